@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asyncio Ön-Getirme Yardımcıları - Asyncio Prefetch Helpers
+==========================================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+Üreteç çağrılarını (SHA-256 hattı, NumPy blok üretimi) olay döngüsünü
+bloklamadan bir yürütücüde (executor) çalıştırır ve tamponları talepten
+önce doldurur. CryptographicallySecureRNG.astream / anext_bytes ve
+LinearCongruentialGenerator.astream bu modülü kullanır.
+
+Runs generator calls (the SHA-256 pipeline, NumPy block generation) in an
+executor without blocking the event loop and fills buffers ahead of
+demand. CryptographicallySecureRNG.astream / anext_bytes and
+LinearCongruentialGenerator.astream are built on this module.
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Optional
+
+
+async def prefetch_stream(
+    produce: Callable[[int], object],
+    chunks: Optional[int] = None,
+    prefetch: int = 2
+) -> AsyncIterator:
+    """
+    produce(0), produce(1), ... sonuçlarını sırayla veren asenkron üreteç.
+    Async generator yielding produce(0), produce(1), ... in order.
+
+    Parçalar tek iş parçacıklı özel bir yürütücüde üretilir; böylece
+    durumlu üreteçler sırayla çağrılır ve en fazla `prefetch` parça
+    tüketiciden önde hazırlanır.
+
+    Chunks are produced on a private single-thread executor, so stateful
+    generators are called in order and at most `prefetch` chunks are
+    prepared ahead of the consumer.
+
+    Args:
+        produce: Parça indeksinden parça üreten fonksiyon
+                 Function producing a chunk from its index
+        chunks: Toplam parça sayısı (None = sonsuz) / Total chunks (None = endless)
+        prefetch: Önde tutulacak parça sayısı / Chunks kept ahead
+    """
+    if prefetch <= 0:
+        raise ValueError("prefetch must be positive")
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rng-prefetch")
+    pending = deque()
+    submitted = 0
+    try:
+        while True:
+            while len(pending) < prefetch and (chunks is None or submitted < chunks):
+                pending.append(loop.run_in_executor(executor, produce, submitted))
+                submitted += 1
+            if not pending:
+                return
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+class AsyncPrefetchBuffer:
+    """
+    Arka planda doldurulan asenkron byte tamponu.
+    Asynchronous byte buffer refilled in the background.
+
+    read(n), tamponda yeterli veri varsa olay döngüsünde hemen döner;
+    tampon alt eşiğin altına düşünce yürütücüde yeniden doldurma başlatılır.
+    Okunan byte'lar tampondan silinir ve bir daha verilmez.
+
+    read(n) returns immediately on the event loop when enough data is
+    buffered; a refill is started in the executor once the buffer falls
+    below the low-water mark. Bytes that were read are removed from the
+    buffer and never handed out again.
+    """
+
+    def __init__(self, fill: Callable[[int], bytes], capacity: int = 65536,
+                 lowWater: Optional[int] = None):
+        """
+        Args:
+            fill: n byte üreten (bloklayan) fonksiyon / Blocking function producing n bytes
+            capacity: Yeniden doldurma boyutu / Refill size
+            lowWater: Yeniden doldurmayı tetikleyen eşik / Refill threshold
+        """
+        self.fill = fill
+        self.capacity = capacity
+        self.lowWater = capacity // 2 if lowWater is None else lowWater
+        self.buffer = bytearray()
+        self.loop = None
+        self._refill = None
+
+    def _schedule_refill(self) -> None:
+        """Bekleyen yoksa arka plan doldurması başlatır / Starts a background refill."""
+        if self._refill is None or self._refill.done():
+            self._refill = self.loop.create_task(self._do_refill())
+
+    async def _do_refill(self) -> None:
+        data = await self.loop.run_in_executor(None, self.fill, self.capacity)
+        self.buffer += data
+
+    async def read(self, numBytes: int) -> bytes:
+        """
+        numBytes byte döndürür / Returns numBytes bytes.
+        """
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # Farklı bir olay döngüsü: eski doldurma görevini bırak
+            # A different event loop: drop the old refill task
+            self.loop = loop
+            self._refill = None
+
+        if len(self.buffer) < numBytes and self._refill is not None:
+            await self._refill
+
+        if len(self.buffer) >= numBytes:
+            result = bytes(self.buffer[:numBytes])
+            del self.buffer[:numBytes]
+        else:
+            # Büyük istek: tampondakini beklemeden önce al, eksik kısmı
+            # doğrudan yürütücüde üret (bekleme sırasında başka okuyucu
+            # veya doldurma tamponu değiştirebilir)
+            # Large request: take what is buffered before awaiting and
+            # produce the shortfall directly in the executor (other readers
+            # or a refill may change the buffer during the await)
+            head = bytes(self.buffer)
+            self.buffer.clear()
+            extra = await loop.run_in_executor(None, self.fill, numBytes - len(head))
+            result = head + extra
+
+        if len(self.buffer) < self.lowWater:
+            self._schedule_refill()
+        return result
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mikro Kıyaslama Paketi - Micro-Benchmark Suite
+==============================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+LCG, CSPRNG, entropi havuzu ve JPEG bloğu işleme hattının sıcak
+yollarını ölçer; saniyedeki işlem, saniyedeki byte ve grup başına
+ortalama çağrı süresinin yüzdeliklerini JSON olarak kaydeder ve kayıtlı bir çalıştırmaya göre
+gerilemeleri işaretler. Yalnızca standart kütüphane ve NumPy kullanır;
+ağ erişimi gerektirmez.
+
+Measures the hot paths of the LCG, the CSPRNG, the entropy pool and the
+JPEG block pipeline; records ops/sec, bytes/sec and percentiles of the
+per-batch mean call time as JSON and flags regressions against a stored run. Uses only the
+standard library and NumPy; no network access is needed.
+
+Kullanım / Usage:
+    python benchmarks.py                              # tablo / table
+    python benchmarks.py --output baseline.json       # kaydet / store a run
+    python benchmarks.py --baseline baseline.json     # karşılaştır / compare
+    python benchmarks.py --filter csprng --duration 2
+
+Gerileme varsa çıkış kodu 1'dir / The exit code is 1 on regressions.
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+REPORT_VERSION = 2
+
+# Bir ölçüm grubunun asgari süresi (ns); zamanlayıcı çözünürlüğünün çok üstünde
+# Minimum duration of one measured batch (ns), well above timer resolution
+MIN_BATCH_NS = 50_000
+MIN_SAMPLES = 20
+MAX_SAMPLES = 2000
+
+# İsim -> kurulum fonksiyonu; kurulum (çağrı, çağrı başına byte) döndürür
+# Name -> setup function; setup returns (call, bytes per call)
+BENCHMARKS: Dict[str, Callable[[], Tuple[Callable[[], object], Optional[int]]]] = {}
+
+
+def benchmark(name: str):
+    """
+    Bir kurulum fonksiyonunu kıyaslama olarak kaydeden dekoratör.
+    Decorator that registers a setup function as a benchmark.
+    """
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+# ----------------------------------------------------------------------
+# Kıyaslamalar / Benchmarks
+# ----------------------------------------------------------------------
+
+@benchmark("lcg.next")
+def _lcg_next():
+    from lcg_generator import LinearCongruentialGenerator
+
+    return LinearCongruentialGenerator(seed=42).next, 4
+
+
+@benchmark("lcg.generate_sequence[10000]")
+def _lcg_generate_sequence():
+    from lcg_generator import LinearCongruentialGenerator
+
+    generator = LinearCongruentialGenerator(seed=42)
+    return lambda: generator.generate_sequence(10000), 4 * 10000
+
+
+@benchmark("lcg.generate_sequence[10000,array]")
+def _lcg_generate_sequence_array():
+    from lcg_generator import LinearCongruentialGenerator
+
+    generator = LinearCongruentialGenerator(seed=42)
+    return lambda: generator.generate_sequence(10000, asArray=True), 4 * 10000
+
+
+@benchmark("csprng.next")
+def _csprng_next():
+    from secure_rng import CryptographicallySecureRNG
+
+    return CryptographicallySecureRNG().next, 8
+
+
+@benchmark("csprng.next_bytes[32]")
+def _csprng_next_bytes_small():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    return lambda: generator.next_bytes(32), 32
+
+
+@benchmark("csprng.next_bytes[4096]")
+def _csprng_next_bytes_large():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    return lambda: generator.next_bytes(4096), 4096
+
+
+@benchmark("csprng.next_bytes[32,prefetch]")
+def _csprng_next_bytes_prefetch():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    generator.enable_prefetch()
+    return lambda: generator.next_bytes(32), 32
+
+
+@benchmark("csprng.next_bytes[1MiB,bulk]")
+def _csprng_next_bytes_bulk():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG(bulk=True)
+    return lambda: generator.next_bytes(2**20), 2**20
+
+
+@benchmark("csprng.random_floats[10000]")
+def _csprng_random_floats():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    return lambda: generator.random_floats(10000), 8 * 10000
+
+
+@benchmark("csprng.random_floats[10000,bulk]")
+def _csprng_random_floats_bulk():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG(bulk=True)
+    return lambda: generator.random_floats(10000), 8 * 10000
+
+
+@benchmark("csprng.integers[10000]")
+def _csprng_integers():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    return lambda: generator.integers(0, 10**6, 10000), None
+
+
+@benchmark("csprng.permutation[100000,bulk]")
+def _csprng_permutation():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG(bulk=True)
+    return lambda: generator.permutation(100000), None
+
+
+@benchmark("csprng.next_int")
+def _csprng_next_int():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    return lambda: generator.next_int(1, 6), None
+
+
+@benchmark("csprng.next_float")
+def _csprng_next_float():
+    from secure_rng import CryptographicallySecureRNG
+
+    return CryptographicallySecureRNG().next_float, None
+
+
+@benchmark("csprng.shuffle[1000]")
+def _csprng_shuffle():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    items = list(range(1000))
+    return lambda: generator.shuffle(items), None
+
+
+@benchmark("csprng.generate_password[16]")
+def _csprng_generate_password():
+    from secure_rng import CryptographicallySecureRNG
+
+    generator = CryptographicallySecureRNG()
+    return lambda: generator.generate_password(16), None
+
+
+@benchmark("entropy_pool.get_entropy[32]")
+def _entropy_pool_get_entropy():
+    from secure_rng import EntropyPool
+
+    pool = EntropyPool()
+    return lambda: pool.get_entropy(32), 32
+
+
+@benchmark("entropy_pool.add_entropy[4096]")
+def _entropy_pool_add_entropy():
+    from secure_rng import EntropyPool
+
+    pool = EntropyPool()
+    data = bytes(range(256)) * 16
+    return lambda: pool.add_entropy(data), 4096
+
+
+@benchmark("jpeg.process_block")
+def _jpeg_process_block():
+    from jpeg_quantization_demo import JPEGQuantizationDemo
+
+    demo = JPEGQuantizationDemo(seed=42)
+    block = demo.create_sample_image_block()
+    table = demo.STANDARD_LUMINANCE_TABLE
+    return lambda: demo.process_block(block, table), None
+
+
+# ----------------------------------------------------------------------
+# Ölçüm / Measurement
+# ----------------------------------------------------------------------
+
+def _percentile(sortedValues: List[float], fraction: float) -> float:
+    """Doğrusal aradeğerli yüzdelik / Linearly interpolated percentile."""
+    position = (len(sortedValues) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sortedValues) - 1)
+    return sortedValues[lower] + (sortedValues[upper] - sortedValues[lower]) * (position - lower)
+
+
+def measure(call: Callable[[], object], bytesPerCall: Optional[int] = None,
+            duration: float = 0.5) -> dict:
+    """
+    Bir çağrıyı ölçer / Measures one call.
+
+    Çağrılar, her grup en az MIN_BATCH_NS sürecek şekilde gruplanır;
+    batch_p50/p90/p99, grup başına ortalama çağrı süresinin
+    yüzdelikleridir, tek tek çağrı gecikmeleri değildir. Böylece 100
+    ns'lik çağrılar da zamanlayıcı yükünden etkilenmez.
+
+    Calls are grouped so that each batch lasts at least MIN_BATCH_NS;
+    batch_p50/p90/p99 are percentiles of the mean call time per batch,
+    not of individual call latencies, so even 100 ns calls are not
+    dominated by timer overhead.
+
+    Args:
+        call: Ölçülecek argümansız fonksiyon / Zero-argument function to measure
+        bytesPerCall: Çağrı başına üretilen byte (yoksa None) / Bytes per call or None
+        duration: Hedef ölçüm süresi (saniye) / Target measuring time in seconds
+
+    Returns:
+        dict: ops_per_second, bytes_per_second, latency_ns, calls, batch
+    """
+    clock = time.perf_counter_ns
+
+    # Isınma ve grup boyutu ayarı / Warm-up and batch-size calibration
+    batch = 1
+    while True:
+        start = clock()
+        for _ in range(batch):
+            call()
+        if clock() - start >= MIN_BATCH_NS:
+            break
+        batch *= 2
+
+    samples: List[float] = []
+    totalNs = 0
+    deadline = clock() + int(duration * 1e9)
+    while len(samples) < MAX_SAMPLES and (len(samples) < MIN_SAMPLES or clock() < deadline):
+        start = clock()
+        for _ in range(batch):
+            call()
+        elapsed = clock() - start
+        totalNs += elapsed
+        samples.append(elapsed / batch)
+
+    calls = len(samples) * batch
+    opsPerSecond = calls / (totalNs / 1e9)
+    samples.sort()
+    return {
+        "ops_per_second": opsPerSecond,
+        "bytes_per_second": opsPerSecond * bytesPerCall if bytesPerCall else None,
+        "latency_ns": {
+            "mean": totalNs / calls,
+            "batch_p50": _percentile(samples, 0.50),
+            "batch_p90": _percentile(samples, 0.90),
+            "batch_p99": _percentile(samples, 0.99),
+        },
+        "calls": calls,
+        "batch": batch,
+    }
+
+
+def run_benchmarks(names: Optional[List[str]] = None, duration: float = 0.5) -> dict:
+    """
+    Seçilen kıyaslamaları çalıştırır ve bir rapor döndürür.
+    Runs the selected benchmarks and returns a report.
+
+    Args:
+        names: Kıyaslama isimleri (None = hepsi) / Benchmark names (None = all)
+        duration: Kıyaslama başına süre (saniye) / Seconds per benchmark
+
+    Returns:
+        dict: JSON'a yazılabilir rapor / JSON-serializable report
+    """
+    selected = list(BENCHMARKS) if names is None else names
+    results = {}
+    for name in selected:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark: {name}")
+        call, bytesPerCall = BENCHMARKS[name]()
+        results[name] = measure(call, bytesPerCall, duration)
+
+    return {
+        "version": REPORT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "duration": duration,
+        "benchmarks": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.10) -> List[dict]:
+    """
+    Bir raporu kayıtlı bir çalıştırmayla karşılaştırır.
+    Compares a report with a stored run.
+
+    Hız oranı grup ortalamalarının medyanından (batch_p50) hesaplanır;
+    genel ortalamaya göre arka plan gürültüsünden daha az etkilenir. Hızı
+    taban çizgisine göre threshold oranından fazla düşen kıyaslamalar
+    gerileme olarak işaretlenir. batch_p99 değişimi bilgi amaçlı
+    raporlanır. Sürüm 1 raporlarındaki p50/p99 anahtarları da okunur.
+
+    The speed ratio is computed from the median of the batch means
+    (batch_p50), which is less sensitive to background noise than the
+    overall mean. Benchmarks whose speed drops by more than threshold
+    relative to the baseline are flagged as regressions. The batch_p99
+    change is reported for information. The p50/p99 keys of version 1
+    reports are read as well.
+
+    Returns:
+        list: Her ortak kıyaslama için name, ratio, batch_p99_ratio, regression
+              name, ratio, batch_p99_ratio, regression for each shared benchmark
+    """
+    def batchPercentile(result: dict, key: str) -> float:
+        latency = result["latency_ns"]
+        return latency.get(f"batch_{key}", latency.get(key))
+
+    rows = []
+    for name, result in current["benchmarks"].items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None:
+            continue
+        ratio = batchPercentile(reference, "p50") / batchPercentile(result, "p50")
+        rows.append({
+            "name": name,
+            "ratio": ratio,
+            "batch_p99_ratio": batchPercentile(result, "p99") / batchPercentile(reference, "p99"),
+            "regression": ratio < 1.0 - threshold,
+        })
+    return rows
+
+
+def _format_rate(value: Optional[float], unit: str) -> str:
+    if value is None:
+        return "-"
+    for prefix, scale in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f} {prefix}{unit}"
+    return f"{value:.1f} {unit}"
+
+
+def display_report(report: dict, comparison: Optional[List[dict]] = None) -> None:
+    """Raporu tablo olarak yazdırır / Prints the report as a table."""
+    changes = {row["name"]: row for row in comparison or []}
+    print(f"Python {report['python']} ({report['implementation']}) on {report['machine']}")
+    print(f"{'benchmark':<36} {'ops/s':>12} {'bytes/s':>12} "
+          f"{'batch p50':>10} {'batch p99':>10} {'vs base':>9}")
+    print("-" * 94)
+    for name, result in report["benchmarks"].items():
+        latency = result["latency_ns"]
+        change = ""
+        if name in changes:
+            row = changes[name]
+            change = f"{(row['ratio'] - 1.0) * 100:+.1f}%" + (" !" if row["regression"] else "")
+        print(f"{name:<36} {_format_rate(result['ops_per_second'], ''):>12} "
+              f"{_format_rate(result['bytes_per_second'], 'B'):>12} "
+              f"{latency['batch_p50'] / 1e3:>8.2f}us {latency['batch_p99'] / 1e3:>8.2f}us "
+              f"{change:>9}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Komut satırı girişi / Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="RNG mikro kıyaslamaları / RNG micro-benchmarks"
+    )
+    parser.add_argument("--output", "-o", help="Raporu JSON olarak yaz / Write the report as JSON")
+    parser.add_argument("--baseline", "-b",
+                        help="Karşılaştırılacak JSON raporu / JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Gerileme eşiği (oran) / Regression threshold (fraction)")
+    parser.add_argument("--duration", type=float, default=0.5,
+                        help="Kıyaslama başına saniye / Seconds per benchmark")
+    parser.add_argument("--filter", default="",
+                        help="Yalnızca adında bu metin geçenler / Only names containing this")
+    parser.add_argument("--list", action="store_true", help="Kıyaslamaları listele / List benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    report = run_benchmarks(names, args.duration)
+
+    comparison = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baselineFile:
+            comparison = compare(report, json.load(baselineFile), args.threshold)
+
+    display_report(report, comparison)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as outputFile:
+            json.dump(report, outputFile, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    regressions = [row["name"] for row in comparison or [] if row["regression"]]
+    if regressions:
+        print(f"\nRegressions (> {args.threshold:.0%} slower): {', '.join(regressions)}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
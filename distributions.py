@@ -0,0 +1,755 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Düzgün Olmayan Dağılımlar - Non-Uniform Distributions
+=====================================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+Bu modül, LinearCongruentialGenerator, CryptographicallySecureRNG veya
+engines modülündeki motorların toplu [0, 1) çıktısını tüketerek
+vektörel (NumPy) dağılım örnekleyicileri sunar. Örnekler parça parça
+üretilir; böylece 10^8 örneklik simülasyonlarda bellek sınırlı kalır ve
+aynı tohum her zaman aynı diziyi verir.
+
+This module provides vectorized (NumPy) distribution samplers on top of
+the batched [0, 1) output of LinearCongruentialGenerator,
+CryptographicallySecureRNG or the engines in the engines module. Samples
+are produced chunk by chunk, so memory stays bounded for 10^8-sample
+simulations and the same seed always yields the same sequence.
+
+Yöntemler / Methods:
+    - normal, exponential : Ziggurat (Marsaglia & Tsang, 256 katman / layers)
+    - gamma               : Marsaglia & Tsang (2000)
+    - poisson             : Ters CDF tablosu (λ < 10) / PTRS (Hörmann, 1993)
+    - binomial            : Ters CDF tablosu (n·min(p,q) < 10) / BTRS (Hörmann)
+    - truncated_normal    : Robert (1995) üstel / düzgün reddetme
+                            exponential / uniform rejection
+    - truncated_exponential : Kapalı form ters CDF / closed-form inversion
+    - weighted_choice     : Walker/Vose alias tablosu / alias table
+
+Kullanım / Usage:
+    from lcg_generator import LinearCongruentialGenerator
+    from distributions import Distributions
+
+    dist = Distributions(LinearCongruentialGenerator(seed=42))
+    samples = dist.normal(10**6, loc=0.0, scale=2.0)
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+
+Size = Optional[Union[int, Tuple[int, ...]]]
+
+# Parça başına örnek sayısı / Samples per chunk
+BLOCK_SIZE = 2**20
+
+
+def _ziggurat_tables(r: float, v: float, density: Callable[[float], float],
+                     inverse: Callable[[float], float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    256 katmanlı ziggurat tablolarını (x_i, f(x_i)) hesaplar.
+    Computes the 256-layer ziggurat tables (x_i, f(x_i)).
+
+    x[0] = v / f(r) taban katmanının sanal genişliğidir, x[1] = r ve
+    x[256] = 0; her katmanın alanı v'dir.
+    x[0] = v / f(r) is the virtual width of the base layer, x[1] = r and
+    x[256] = 0; every layer has area v.
+    """
+    x = np.empty(257)
+    x[0] = v / density(r)
+    x[1] = r
+    for i in range(1, 255):
+        x[i + 1] = inverse(v / x[i] + density(x[i]))
+    x[256] = 0.0
+    return x, np.array([density(value) for value in x])
+
+
+# Standart normal (f(x) = exp(-x²/2)) ve standart üstel (f(x) = exp(-x))
+# Standard normal (f(x) = exp(-x²/2)) and standard exponential (f(x) = exp(-x))
+NORMAL_R = 3.6541528853610088
+NORMAL_X, NORMAL_F = _ziggurat_tables(
+    NORMAL_R, 4.92867323399e-3,
+    lambda x: math.exp(-0.5 * x * x),
+    lambda y: math.sqrt(-2.0 * math.log(y))
+)
+EXPONENTIAL_R = 7.69711747013104972
+EXPONENTIAL_X, EXPONENTIAL_F = _ziggurat_tables(
+    EXPONENTIAL_R, 3.9496598225815571993e-3,
+    lambda x: math.exp(-x),
+    lambda y: -math.log(y)
+)
+
+# log(k!) için küçük k tablosu / Small-k table for log(k!)
+_LOG_FACTORIAL_TABLE = np.array([math.lgamma(k + 1.0) for k in range(16)])
+
+
+def _log_factorial(k: np.ndarray) -> np.ndarray:
+    """
+    log(k!) (vektörel); k >= 16 için Stirling serisi.
+    log(k!) (vectorized); Stirling series for k >= 16.
+    """
+    k = np.asarray(k, dtype=np.float64)
+    x = np.maximum(k, 16.0) + 1.0
+    inverse = 1.0 / x
+    inverse2 = inverse * inverse
+    stirling = ((x - 0.5) * np.log(x) - x + 0.5 * math.log(2.0 * math.pi)
+                + inverse * (1.0 / 12.0 - inverse2 * (1.0 / 360.0 - inverse2 / 1260.0)))
+    small = np.clip(k, 0, 15).astype(np.intp)
+    return np.where(k < 16, _LOG_FACTORIAL_TABLE[small], stirling)
+
+
+class AliasTable:
+    """
+    Ağırlıklı seçim için Walker/Vose alias tablosu.
+    Walker/Vose alias table for weighted choice.
+
+    Tablo O(n) sürede bir kez kurulur; her seçim bir düzgün indeks ve bir
+    karşılaştırma ile O(1) maliyetlidir:
+        i = ⌊U₁·n⌋;  sonuç = i  eğer U₂ < probability[i], değilse alias[i]
+
+    The table is built once in O(n); every pick costs O(1), one uniform
+    index and one comparison:
+        i = ⌊U₁·n⌋;  result = i  if U₂ < probability[i], else alias[i]
+    """
+
+    def __init__(self, weights):
+        """
+        Args:
+            weights: Negatif olmayan, toplamı pozitif ağırlıklar
+                     Non-negative weights with a positive sum
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or len(weights) == 0:
+            raise ValueError("weights must be a non-empty 1-D sequence")
+        if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+            raise ValueError("weights must be finite and non-negative")
+        total = weights.sum()
+        if total <= 0:
+            raise ValueError("weights must have a positive sum")
+
+        size = len(weights)
+        scaled = (weights * (size / total)).tolist()
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+
+        # Vose: her küçük sütunu bir büyük sütunun fazlasıyla tamamla
+        # Vose: top up every small column with the excess of a large one
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        self.weights = weights / total
+        self.probability = np.array(probability, dtype=np.float64)
+        self.alias = np.array(alias, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def lookup(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """
+        İki düzgün [0, 1) dizisini seçilen indekslere çevirir.
+        Maps two uniform [0, 1) arrays to picked indices.
+        """
+        size = len(self.probability)
+        column = np.minimum((first * size).astype(np.int64), size - 1)
+        return np.where(second < self.probability[column], column, self.alias[column])
+
+
+# Ağırlık byte'ları -> AliasTable (en yeni ALIAS_CACHE_SIZE tablo)
+# Weight bytes -> AliasTable (the most recent ALIAS_CACHE_SIZE tables)
+ALIAS_CACHE_SIZE = 32
+_aliasCache: "OrderedDict[bytes, AliasTable]" = OrderedDict()
+_aliasCacheLock = threading.Lock()
+
+
+def alias_table(weights) -> AliasTable:
+    """
+    Ağırlıklar için önbellekteki AliasTable'ı döndürür (yoksa kurar).
+    Returns the cached AliasTable for the weights (building it if needed).
+
+    Ağırlıklar nadiren değiştiğinden tablo bir kez kurulur; anahtar
+    ağırlıkların byte gösterimidir, böylece içeriği değişen bir liste
+    yeni bir tablo alır.
+
+    Weights change rarely, so the table is built once; the key is the
+    byte representation of the weights, so a list whose contents change
+    gets a new table.
+    """
+    if isinstance(weights, AliasTable):
+        return weights
+    key = np.ascontiguousarray(weights, dtype=np.float64).tobytes()
+    with _aliasCacheLock:
+        table = _aliasCache.get(key)
+        if table is not None:
+            _aliasCache.move_to_end(key)
+            return table
+
+    table = AliasTable(weights)
+    with _aliasCacheLock:
+        _aliasCache[key] = table
+        if len(_aliasCache) > ALIAS_CACHE_SIZE:
+            _aliasCache.popitem(last=False)
+    return table
+
+
+class Distributions:
+    """
+    Bir üretecin toplu çıktısı üzerinde vektörel dağılım örnekleyicileri.
+    Vectorized distribution samplers over a generator's batched output.
+
+    Üreteç fill_into() (LCG, CSPRNG) veya random(count) (engines)
+    sağlamalıdır. Tüm yöntemler size=None için tek bir Python sayısı,
+    aksi halde verilen şekilde bir NumPy dizisi döndürür.
+
+    The generator must provide fill_into() (LCG, CSPRNG) or random(count)
+    (engines). Every method returns a single Python number for
+    size=None, otherwise a NumPy array of the given shape.
+    """
+
+    def __init__(self, generator, blockSize: int = BLOCK_SIZE):
+        """
+        Args:
+            generator: Düzgün çıktı kaynağı / Uniform output source
+            blockSize: Parça başına örnek sayısı / Samples per chunk
+        """
+        if blockSize <= 0:
+            raise ValueError("blockSize must be positive")
+        self.generator = generator
+        self.blockSize = blockSize
+
+    # ------------------------------------------------------------------
+    # Düzgün kaynak ve parça yardımcıları / Uniform source and chunk helpers
+    # ------------------------------------------------------------------
+
+    def uniform(self, count: int) -> np.ndarray:
+        """
+        [0, 1) aralığında count adet float64 / count float64 values in [0, 1).
+        """
+        if hasattr(self.generator, "fill_into"):
+            values = np.empty(count, dtype=np.float64)
+            self.generator.fill_into(values)
+            return values
+        return np.asarray(self.generator.random(count), dtype=np.float64)
+
+    def weighted_choice(self, weights, size: Size = None, population=None):
+        """
+        Ağırlıklı seçim (alias tablosu, seçim başına O(1)).
+        Weighted choice (alias table, O(1) per pick).
+
+        weights bir AliasTable veya ağırlık dizisi olabilir; diziler için
+        tablo alias_table() önbelleğinden alınır.
+        weights may be an AliasTable or a weight sequence; for sequences
+        the table comes from the alias_table() cache.
+
+        Args:
+            weights: AliasTable veya ağırlıklar / AliasTable or weights
+            size: Seçim sayısı veya şekil / Number of picks or shape
+            population: Verilirse indeks yerine bu dizinin öğeleri döner
+                        If given, its items are returned instead of indices
+
+        Returns:
+            İndeksler (int64) veya population öğeleri / Indices or items
+        """
+        table = alias_table(weights)
+        if population is not None and len(population) != len(table):
+            raise ValueError("population and weights must have the same length")
+
+        indices = self._sample(
+            size, lambda count: table.lookup(self.uniform(count), self.uniform(count)),
+            dtype=np.int64
+        )
+        if population is None:
+            return indices
+        if size is None:
+            return population[indices]
+        if not isinstance(population, np.ndarray):
+            items = population
+            population = np.empty(len(items), dtype=object)
+            for position, item in enumerate(items):
+                population[position] = item
+        return population[indices]
+
+    def _sample(self, size: Size, sampler: Callable[[int], np.ndarray],
+                dtype=np.float64):
+        """
+        sampler(n) çağrılarıyla size kadar örneği parça parça üretir.
+        Produces size samples chunk by chunk with sampler(n) calls.
+        """
+        if size is None:
+            return sampler(1)[0].item()
+
+        shape = (size,) if isinstance(size, (int, np.integer)) else tuple(size)
+        total = int(np.prod(shape))
+        if total < 0 or any(dimension < 0 for dimension in shape):
+            raise ValueError("size cannot be negative")
+
+        out = np.empty(total, dtype=dtype)
+        for start in range(0, total, self.blockSize):
+            count = min(self.blockSize, total - start)
+            out[start:start + count] = sampler(count)
+        return out.reshape(shape)
+
+    @staticmethod
+    def _rejection(count: int, propose: Callable[[int], np.ndarray],
+                   dtype=np.float64) -> np.ndarray:
+        """
+        propose(n) kabul edilen örnekleri döndürür; yalnızca eksik kalan
+        konumlar için yeniden önerilir.
+        propose(n) returns the accepted samples; only the missing slots are
+        proposed again.
+        """
+        out = np.empty(count, dtype=dtype)
+        filled = 0
+        while filled < count:
+            accepted = propose(count - filled)
+            take = min(len(accepted), count - filled)
+            out[filled:filled + take] = accepted[:take]
+            filled += take
+        return out
+
+    # ------------------------------------------------------------------
+    # Ziggurat: normal ve üstel / normal and exponential
+    # ------------------------------------------------------------------
+
+    def _propose_normal(self, count: int) -> np.ndarray:
+        layer = (self.uniform(count) * 256.0).astype(np.intp)
+        z = (2.0 * self.uniform(count) - 1.0) * NORMAL_X[layer]
+        accepted = np.abs(z) < NORMAL_X[layer + 1]
+
+        slow = np.flatnonzero(~accepted)
+        if len(slow):
+            slowLayer = layer[slow]
+
+            # Kama bölgesi: f(x) altında kalan noktaları kabul et
+            # Wedge region: accept points that fall under f(x)
+            wedge = slow[slowLayer > 0]
+            if len(wedge):
+                i = layer[wedge]
+                y = NORMAL_F[i + 1] + self.uniform(len(wedge)) * (NORMAL_F[i] - NORMAL_F[i + 1])
+                accepted[wedge] = y < np.exp(-0.5 * z[wedge] ** 2)
+
+            # Taban katmanı: r ötesindeki kuyruk (Marsaglia, 1964)
+            # Base layer: the tail beyond r (Marsaglia, 1964)
+            # Reddedilen kuyruk önerileri kabul edilene kadar yeniden çekilir
+            # Rejected tail proposals are redrawn until accepted
+            tail = slow[slowLayer == 0]
+            while len(tail):
+                x = -np.log1p(-self.uniform(len(tail))) / NORMAL_R
+                y = -np.log1p(-self.uniform(len(tail)))
+                keep = 2.0 * y > x * x
+                z[tail[keep]] = np.copysign(NORMAL_R + x[keep], z[tail[keep]])
+                accepted[tail[keep]] = True
+                tail = tail[~keep]
+
+        return z[accepted]
+
+    def _propose_exponential(self, count: int) -> np.ndarray:
+        layer = (self.uniform(count) * 256.0).astype(np.intp)
+        z = self.uniform(count) * EXPONENTIAL_X[layer]
+        accepted = z < EXPONENTIAL_X[layer + 1]
+
+        slow = np.flatnonzero(~accepted)
+        if len(slow):
+            slowLayer = layer[slow]
+
+            wedge = slow[slowLayer > 0]
+            if len(wedge):
+                i = layer[wedge]
+                y = (EXPONENTIAL_F[i + 1]
+                     + self.uniform(len(wedge)) * (EXPONENTIAL_F[i] - EXPONENTIAL_F[i + 1]))
+                accepted[wedge] = y < np.exp(-z[wedge])
+
+            # Belleksizlik: kuyruk r + Exp(1) / Memorylessness: the tail is r + Exp(1)
+            tail = slow[slowLayer == 0]
+            if len(tail):
+                z[tail] = EXPONENTIAL_R - np.log1p(-self.uniform(len(tail)))
+                accepted[tail] = True
+
+        return z[accepted]
+
+    def _standard_normal(self, count: int) -> np.ndarray:
+        return self._rejection(count, self._propose_normal)
+
+    def _standard_exponential(self, count: int) -> np.ndarray:
+        return self._rejection(count, self._propose_exponential)
+
+    def standard_normal(self, size: Size = None):
+        """
+        Standart normal N(0, 1) örnekleri (ziggurat).
+        Standard normal N(0, 1) samples (ziggurat).
+        """
+        return self._sample(size, self._standard_normal)
+
+    def normal(self, size: Size = None, loc: float = 0.0, scale: float = 1.0):
+        """
+        N(loc, scale²) örnekleri / N(loc, scale²) samples.
+
+        Args:
+            size: Örnek sayısı veya şekil / Sample count or shape
+            loc: Ortalama / Mean
+            scale: Standart sapma / Standard deviation
+        """
+        if scale < 0:
+            raise ValueError("scale cannot be negative")
+        return self._sample(size, lambda count: loc + scale * self._standard_normal(count))
+
+    def standard_exponential(self, size: Size = None):
+        """
+        Exp(1) örnekleri (ziggurat) / Exp(1) samples (ziggurat).
+        """
+        return self._sample(size, self._standard_exponential)
+
+    def exponential(self, size: Size = None, scale: float = 1.0):
+        """
+        Ortalaması scale olan üstel örnekler.
+        Exponential samples with mean scale.
+        """
+        if scale < 0:
+            raise ValueError("scale cannot be negative")
+        return self._sample(size, lambda count: scale * self._standard_exponential(count))
+
+    # ------------------------------------------------------------------
+    # Gamma
+    # ------------------------------------------------------------------
+
+    def _standard_gamma(self, shape: float, count: int) -> np.ndarray:
+        if shape < 1.0:
+            # Gamma(k) = Gamma(k + 1) * U^(1/k)
+            boost = np.power(1.0 - self.uniform(count), 1.0 / shape)
+            return self._standard_gamma(shape + 1.0, count) * boost
+
+        d = shape - 1.0 / 3.0
+        c = 1.0 / math.sqrt(9.0 * d)
+
+        def propose(n: int) -> np.ndarray:
+            x = self._standard_normal(n)
+            v = (1.0 + c * x) ** 3
+            logU = np.log1p(-self.uniform(n))
+            positive = v > 0
+            logV = np.log(np.where(positive, v, 1.0))
+            accepted = positive & (logU < 0.5 * x * x + d - d * v + d * logV)
+            return d * v[accepted]
+
+        return self._rejection(count, propose)
+
+    def gamma(self, shape: float, size: Size = None, scale: float = 1.0):
+        """
+        Gamma(shape, scale) örnekleri (Marsaglia & Tsang).
+        Gamma(shape, scale) samples (Marsaglia & Tsang).
+
+        Args:
+            shape: Şekil parametresi k > 0 / Shape parameter k > 0
+            size: Örnek sayısı veya şekil / Sample count or shape
+            scale: Ölçek θ / Scale θ
+        """
+        if shape <= 0:
+            raise ValueError("shape must be positive")
+        if scale < 0:
+            raise ValueError("scale cannot be negative")
+        return self._sample(size, lambda count: scale * self._standard_gamma(shape, count))
+
+    # ------------------------------------------------------------------
+    # Kesikli dağılımlar / Discrete distributions
+    # ------------------------------------------------------------------
+
+    def _inversion_table(self, pmf: Callable[[], np.ndarray]) -> Callable[[int], np.ndarray]:
+        """
+        Olasılık tablosundan ters CDF örnekleyicisi (searchsorted).
+        Inverse-CDF sampler from a probability table (searchsorted).
+        """
+        cdf = np.cumsum(pmf())
+        last = len(cdf) - 1
+        return lambda count: np.minimum(
+            np.searchsorted(cdf, self.uniform(count), side="right"), last
+        ).astype(np.int64)
+
+    def _poisson_ptrs(self, lam: float, count: int) -> np.ndarray:
+        """PTRS (Hörmann, 1993), λ >= 10."""
+        logLam = math.log(lam)
+        b = 0.931 + 2.53 * math.sqrt(lam)
+        a = -0.059 + 0.02483 * b
+        logInvAlpha = math.log(1.1239 + 1.1328 / (b - 3.4))
+        vr = 0.9277 - 3.6224 / (b - 2.0)
+
+        def propose(n: int) -> np.ndarray:
+            u = self.uniform(n) - 0.5
+            v = self.uniform(n)
+            us = 0.5 - np.abs(u)
+            k = np.floor((2.0 * a / us + b) * u + lam + 0.43)
+
+            quick = (us >= 0.07) & (v <= vr)
+            valid = (k >= 0) & ~((us < 0.013) & (v > us))
+            slow = valid & ~quick
+            accepted = quick.copy()
+            if slow.any():
+                usSlow = us[slow]
+                kSlow = k[slow]
+                accepted[slow] = (np.log(v[slow]) + logInvAlpha
+                                  - np.log(a / (usSlow * usSlow) + b)
+                                  <= -lam + kSlow * logLam - _log_factorial(kSlow))
+            return k[accepted]
+
+        return self._rejection(count, propose, dtype=np.int64)
+
+    def poisson(self, lam: float = 1.0, size: Size = None):
+        """
+        Poisson(λ) örnekleri / Poisson(λ) samples.
+
+        λ < 10 için ters CDF tablosu, aksi halde PTRS dönüştürülmüş
+        reddetme yöntemi kullanılır.
+        An inverse-CDF table is used for λ < 10, PTRS transformed
+        rejection otherwise.
+        """
+        if lam < 0 or not math.isfinite(lam):
+            raise ValueError("lam must be a non-negative finite number")
+        if lam == 0:
+            return self._sample(size, lambda count: np.zeros(count, dtype=np.int64),
+                                dtype=np.int64)
+        if lam >= 10:
+            return self._sample(size, lambda count: self._poisson_ptrs(lam, count),
+                                dtype=np.int64)
+
+        def pmf() -> np.ndarray:
+            # Kuyruk kütlesi ihmal edilebilir olana kadar / Until the tail is negligible
+            limit = int(lam + 20.0 * math.sqrt(lam) + 20.0)
+            k = np.arange(limit + 1, dtype=np.float64)
+            return np.exp(k * math.log(lam) - lam - _log_factorial(k))
+
+        return self._sample(size, self._inversion_table(pmf), dtype=np.int64)
+
+    def _binomial_btrs(self, trials: int, p: float, count: int) -> np.ndarray:
+        """BTRS (Hörmann, 1993), n·p >= 10, p <= 0.5."""
+        q = 1.0 - p
+        spq = math.sqrt(trials * p * q)
+        b = 1.15 + 2.53 * spq
+        a = -0.0873 + 0.0248 * b + 0.01 * p
+        c = trials * p + 0.5
+        vr = 0.92 - 4.2 / b
+        alpha = (2.83 + 5.1 / b) * spq
+        logRatio = math.log(p / q)
+        mode = math.floor((trials + 1) * p)
+        h = math.lgamma(mode + 1.0) + math.lgamma(trials - mode + 1.0)
+
+        def propose(n: int) -> np.ndarray:
+            u = self.uniform(n) - 0.5
+            v = self.uniform(n)
+            us = 0.5 - np.abs(u)
+            k = np.floor((2.0 * a / us + b) * u + c)
+
+            inRange = (k >= 0) & (k <= trials)
+            quick = inRange & (us >= 0.07) & (v <= vr)
+            slow = inRange & ~quick
+            accepted = quick.copy()
+            if slow.any():
+                usSlow = us[slow]
+                kSlow = k[slow]
+                logV = np.log(v[slow] * alpha / (a / (usSlow * usSlow) + b))
+                accepted[slow] = logV <= (h - _log_factorial(kSlow)
+                                          - _log_factorial(trials - kSlow)
+                                          + (kSlow - mode) * logRatio)
+            return k[accepted]
+
+        return self._rejection(count, propose, dtype=np.int64)
+
+    def binomial(self, trials: int, p: float, size: Size = None):
+        """
+        Binom(n, p) örnekleri / Binomial(n, p) samples.
+
+        n·min(p, 1-p) < 10 için ters CDF tablosu, aksi halde BTRS
+        kullanılır; p > 0.5 için n - Binom(n, 1-p) döndürülür.
+        An inverse-CDF table is used for n·min(p, 1-p) < 10, BTRS
+        otherwise; for p > 0.5, n - Binomial(n, 1-p) is returned.
+
+        Args:
+            trials: Deneme sayısı n / Number of trials n
+            p: Başarı olasılığı / Success probability
+            size: Örnek sayısı veya şekil / Sample count or shape
+        """
+        if trials < 0 or int(trials) != trials:
+            raise ValueError("trials must be a non-negative integer")
+        if not 0.0 <= p <= 1.0:
+            raise ValueError("p must be in [0, 1]")
+        trials = int(trials)
+
+        flip = p > 0.5
+        small = 1.0 - p if flip else p
+        if trials == 0 or small == 0.0:
+            constant = trials if flip else 0
+            return self._sample(size, lambda count: np.full(count, constant, dtype=np.int64),
+                                dtype=np.int64)
+
+        if trials * small >= 10:
+            sampler = lambda count: self._binomial_btrs(trials, small, count)
+        else:
+            def pmf() -> np.ndarray:
+                mean = trials * small
+                limit = min(trials, int(mean + 20.0 * math.sqrt(mean) + 20.0))
+                k = np.arange(limit + 1, dtype=np.float64)
+                return np.exp(_log_factorial(trials) - _log_factorial(k)
+                              - _log_factorial(trials - k)
+                              + k * math.log(small) + (trials - k) * math.log1p(-small))
+            sampler = self._inversion_table(pmf)
+
+        if flip:
+            return self._sample(size, lambda count: trials - sampler(count), dtype=np.int64)
+        return self._sample(size, sampler, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Kesik dağılımlar / Truncated distributions
+    # ------------------------------------------------------------------
+
+    def _truncated_standard_normal(self, a: float, b: float, count: int) -> np.ndarray:
+        """
+        [a, b] aralığına kesilmiş N(0, 1) (Robert, 1995).
+        N(0, 1) truncated to [a, b] (Robert, 1995).
+        """
+        if b <= 0:
+            return -self._truncated_standard_normal(-b, -a, count)
+
+        if a < 0:
+            if b - a >= math.sqrt(2.0 * math.pi):
+                # Geniş aralık: normal örnekle, dışarıdakileri reddet
+                # Wide interval: sample normals, reject the outside
+                def propose(n: int) -> np.ndarray:
+                    z = self._standard_normal(n)
+                    return z[(z >= a) & (z <= b)]
+            else:
+                def propose(n: int) -> np.ndarray:
+                    z = a + (b - a) * self.uniform(n)
+                    return z[self.uniform(n) < np.exp(-0.5 * z * z)]
+            return self._rejection(count, propose)
+
+        root = math.sqrt(a * a + 4.0)
+        alpha = 0.5 * (a + root)
+        limit = a + 2.0 * math.sqrt(math.e) / (a + root) * math.exp(0.25 * (a * a - a * root))
+
+        if b <= limit:
+            # Dar aralık: düzgün öneri / Narrow interval: uniform proposal
+            def propose(n: int) -> np.ndarray:
+                z = a + (b - a) * self.uniform(n)
+                return z[self.uniform(n) < np.exp(0.5 * (a * a - z * z))]
+        else:
+            # Kuyruk: kaydırılmış üstel öneri / Tail: shifted exponential proposal
+            def propose(n: int) -> np.ndarray:
+                z = a - np.log1p(-self.uniform(n)) / alpha
+                keep = (z <= b) & (self.uniform(n) <= np.exp(-0.5 * (z - alpha) ** 2))
+                return z[keep]
+        return self._rejection(count, propose)
+
+    def truncated_normal(self, low: float, high: float, size: Size = None,
+                         loc: float = 0.0, scale: float = 1.0):
+        """
+        [low, high] aralığına kesilmiş N(loc, scale²) örnekleri.
+        N(loc, scale²) samples truncated to [low, high].
+
+        Uzak kuyruklar için bile kabul oranı yüksek kalır.
+        The acceptance rate stays high even for far tails.
+
+        Args:
+            low, high: Sınırlar (±inf olabilir) / Bounds (may be ±inf)
+            size: Örnek sayısı veya şekil / Sample count or shape
+            loc: Ortalama / Mean
+            scale: Standart sapma / Standard deviation
+        """
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        if not low < high:
+            raise ValueError("low must be less than high")
+        a = (low - loc) / scale
+        b = (high - loc) / scale
+        return self._sample(
+            size, lambda count: loc + scale * self._truncated_standard_normal(a, b, count)
+        )
+
+    def truncated_exponential(self, high: float, size: Size = None,
+                              scale: float = 1.0, low: float = 0.0):
+        """
+        [low, high) aralığına kesilmiş üstel örnekler (ters CDF).
+        Exponential samples truncated to [low, high) (inverse CDF).
+
+        Args:
+            high: Üst sınır (inf olabilir) / Upper bound (may be inf)
+            size: Örnek sayısı veya şekil / Sample count or shape
+            scale: Ortalama / Mean
+            low: Alt sınır / Lower bound
+        """
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        if not low < high:
+            raise ValueError("low must be less than high")
+        mass = -math.expm1(-(high - low) / scale)
+        return self._sample(
+            size, lambda count: low - scale * np.log1p(-mass * self.uniform(count))
+        )
+
+
+def normal_tail_check(generator, count: int = 10**7) -> dict:
+    """
+    Ziggurat taban katmanı kuyruğunun kütlesini denetler.
+    Checks the mass of the ziggurat base-layer tail.
+
+    |z| > NORMAL_R olan örnek sayısı beklenen count * erfc(r / √2) ile
+    karşılaştırılır; |z-skoru| > 4 kuyruk örneklemesinde bir hataya işaret
+    eder.
+    The number of samples with |z| > NORMAL_R is compared with the expected
+    count * erfc(r / √2); |z-score| > 4 points to a tail sampling bug.
+
+    Args:
+        generator: Distributions'a verilecek üreteç / Generator for Distributions
+        count: Örnek sayısı / Sample count
+
+    Returns:
+        dict: observed, expected, z_score, passed
+    """
+    dist = Distributions(generator)
+    observed = 0
+    for start in range(0, count, dist.blockSize):
+        block = dist.standard_normal(min(dist.blockSize, count - start))
+        observed += int(np.count_nonzero(np.abs(block) > NORMAL_R))
+
+    probability = math.erfc(NORMAL_R / math.sqrt(2.0))
+    expected = count * probability
+    zScore = (observed - expected) / math.sqrt(expected * (1.0 - probability))
+    return {
+        "observed": observed,
+        "expected": expected,
+        "z_score": zScore,
+        "passed": abs(zScore) <= 4.0,
+    }
+
+
+def main():
+    """Demo: ziggurat kuyruk denetimi / Demo: ziggurat tail check."""
+    from lcg_generator import LinearCongruentialGenerator
+
+    result = normal_tail_check(LinearCongruentialGenerator(seed=42))
+    print("\n" + "=" * 60)
+    print("📈 Normal kuyruk kütlesi / Normal tail mass (|z| > r)")
+    print("=" * 60)
+    print(f"  Gözlenen / Observed : {result['observed']}")
+    print(f"  Beklenen / Expected : {result['expected']:.1f}")
+    print(f"  z-skoru / z-score   : {result['z_score']:+.2f}")
+    print(f"  {'✅ GEÇTİ / PASSED' if result['passed'] else '❌ KALDI / FAILED'}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
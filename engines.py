@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yüksek Verimli Üreteç Motorları - High-Throughput Generator Engines
+===================================================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+Bu modül, RandomNumberGenerator soyut sınıfının arkasında isimle
+seçilebilen, toplu (dizi) çıktı üretebilen motorlardan oluşan bir kayıt
+defteri sunar. Böylece çağıran kod değişmeden iş yüküne göre daha hızlı
+bir motor seçilebilir.
+
+This module provides a registry of array-capable engines behind the
+RandomNumberGenerator ABC, selectable by name, so a faster engine can be
+swapped in per workload without rewriting callers.
+
+Motorlar / Engines:
+    - minstd     : LinearCongruentialGenerator (Park-Miller, m = 2^31 - 1)
+    - lcg64      : 64-bit LCG (Knuth MMIX sabitleri / constants)
+    - pcg32      : PCG32 (XSH-RR, 64-bit durum / state)
+    - xoshiro256 : xoshiro256** (paralel şeritler / parallel lanes)
+    - mrg32k3a   : MRG32k3a (L'Ecuyer, paralel alt akışlar / substreams)
+
+⚠️ Bu motorların hiçbiri kriptografik olarak güvenli DEĞİLDİR.
+⚠️ None of these engines is cryptographically secure.
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import time
+from abc import abstractmethod
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+
+from lcg_generator import LinearCongruentialGenerator, RandomNumberGenerator
+
+
+MASK64 = 2**64 - 1
+MASK32 = 2**32 - 1
+
+# İsim -> motor sınıfı / Name -> engine class
+ENGINE_REGISTRY: Dict[str, Type[RandomNumberGenerator]] = {}
+
+
+def register_engine(name: str):
+    """
+    Bir motor sınıfını kayıt defterine ekleyen dekoratör.
+    Decorator that adds an engine class to the registry.
+    """
+    def decorator(cls):
+        """Sınıfı kaydeder ve aynen döndürür / Registers and returns the class unchanged."""
+        ENGINE_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+def available_engines() -> List[str]:
+    """Kayıtlı motor isimleri / Registered engine names."""
+    return sorted(ENGINE_REGISTRY)
+
+
+def create_engine(name: str, seed: Optional[int] = None, **kwargs) -> RandomNumberGenerator:
+    """
+    İsme göre bir motor oluşturur.
+    Creates an engine by name.
+
+    Args:
+        name: Kayıtlı motor adı / Registered engine name
+        seed: Tohum değeri / Seed value
+        **kwargs: Motora özel seçenekler (ör. lanes) / Engine-specific options
+
+    Returns:
+        RandomNumberGenerator: Motor örneği / Engine instance
+    """
+    if name not in ENGINE_REGISTRY:
+        raise ValueError(f"Unknown engine: {name} (available: {available_engines()})")
+    return ENGINE_REGISTRY[name](seed=seed, **kwargs)
+
+
+register_engine("minstd")(LinearCongruentialGenerator)
+
+
+def _default_seed(seed: Optional[int]) -> int:
+    """
+    seed None ise LCG gibi mikrosaniye hassasiyetinde sistem zamanını kullanır.
+    Uses microsecond system time when seed is None, like the LCG.
+    """
+    if seed is None:
+        return int(time.time() * 1_000_000)
+    return seed
+
+
+def _splitmix64(value: int):
+    """
+    SplitMix64 ile bir tohumdan sonsuz 64-bit kelime dizisi üretir.
+    Yields an endless sequence of 64-bit words from a seed with SplitMix64.
+    """
+    state = value & MASK64
+    while True:
+        state = (state + 0x9E3779B97F4A7C15) & MASK64
+        z = state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        yield z ^ (z >> 31)
+
+
+# =============================================================================
+# 64-bit afin motorlar (LCG64, PCG32) / 64-bit affine engines
+# =============================================================================
+
+class _Affine64Generator(RandomNumberGenerator):
+    """
+    S_{n+1} = (a * S_n + c) mod 2^64 durum geçişine sahip motorlar için
+    ortak toplu üretim.
+    Shared batched generation for engines with the state transition
+    S_{n+1} = (a * S_n + c) mod 2^64.
+
+    Ardışık durumlar blok halinde S_{n+k} = A_k * S_n + c * T_k ile
+    hesaplanır; A_k = a^k ve T_k = 1 + a + ... + a^{k-1} sınıf başına bir
+    kez hesaplanır ve uint64 taşması mod 2^64 işlemini doğal olarak yapar.
+
+    Successive states are computed block-wise as S_{n+k} = A_k * S_n +
+    c * T_k; A_k = a^k and T_k = 1 + a + ... + a^{k-1} are computed once
+    per class and uint64 wraparound performs the mod 2^64 for free.
+    """
+
+    MULTIPLIER: int = 6364136223846793005
+    ARRAY_BLOCK_SIZE: int = 65536
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Başlangıç tohumu (None = zamana dayalı) / Initial seed (None = time-based)
+        """
+        self.initialSeed = _default_seed(seed)
+        self.reset(self.initialSeed)
+
+    @classmethod
+    def _block_coefficients(cls):
+        """(A_k, T_k), k = 1..B, sınıf başına önbellekli / cached per class."""
+        cached = cls.__dict__.get("_blockCoefficientsCache")
+        if cached is not None:
+            return cached
+
+        multipliers = np.empty(cls.ARRAY_BLOCK_SIZE, dtype=np.uint64)
+        sums = np.empty(cls.ARRAY_BLOCK_SIZE, dtype=np.uint64)
+        power, total = 1, 0
+        for k in range(cls.ARRAY_BLOCK_SIZE):
+            total = (total + power) & MASK64
+            power = (power * cls.MULTIPLIER) & MASK64
+            multipliers[k] = power
+            sums[k] = total
+
+        cls._blockCoefficientsCache = (multipliers, sums)
+        return cls._blockCoefficientsCache
+
+    def _advance_state(self) -> int:
+        """Durumu bir adım ilerletir / Advances the state by one step."""
+        self.state = (self.MULTIPLIER * self.state + self.increment) & MASK64
+        return self.state
+
+    def _states(self, count: int) -> np.ndarray:
+        """
+        Sonraki count durumu (her adımdan sonraki) döndürür ve ilerler.
+        Returns the next count states (after each step) and advances.
+        """
+        multipliers, sums = self._block_coefficients()
+        increments = sums * np.uint64(self.increment)
+        result = np.empty(count, dtype=np.uint64)
+
+        with np.errstate(over="ignore"):
+            for start in range(0, count, self.ARRAY_BLOCK_SIZE):
+                size = min(self.ARRAY_BLOCK_SIZE, count - start)
+                block = result[start:start + size]
+                np.multiply(multipliers[:size], np.uint64(self.state), out=block)
+                np.add(block, increments[:size], out=block)
+                self.state = int(block[-1])
+        return result
+
+
+@register_engine("lcg64")
+class LCG64Generator(_Affine64Generator):
+    """
+    64-bit Doğrusal Eşlik Üreteci (Knuth MMIX sabitleri).
+    64-bit Linear Congruential Generator (Knuth MMIX constants).
+
+        S_{n+1} = (6364136223846793005 * S_n + 1442695040888963407) mod 2^64
+
+    next() tam 64-bit durumu döndürür; düşük bitler zayıftır, bu yüzden
+    next_float()/random() yalnızca üst 53 biti kullanır.
+    next() returns the full 64-bit state; the low bits are weak, so
+    next_float()/random() only use the top 53 bits.
+    """
+
+    INCREMENT: int = 1442695040888963407
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Durumu tohuma döndürür / Resets the state to the seed."""
+        if seed is not None:
+            self.initialSeed = seed
+        self.state = self.initialSeed & MASK64
+        self.increment = self.INCREMENT
+
+    def next(self) -> int:
+        """Bir sonraki 64-bit durum / Next 64-bit state."""
+        return self._advance_state()
+
+    def next_float(self) -> float:
+        """Üst 53 bitten [0, 1) değeri / [0, 1) value from the top 53 bits."""
+        return (self._advance_state() >> 11) / 2.0**53
+
+    def random_raw(self, count: int) -> np.ndarray:
+        """Toplu ham çıktı (uint64) / Batched raw output (uint64)."""
+        return self._states(count)
+
+    def random(self, count: int) -> np.ndarray:
+        """Toplu [0, 1) çıktı (float64) / Batched [0, 1) output (float64)."""
+        return (self._states(count) >> np.uint64(11)).astype(np.float64) / 2.0**53
+
+
+@register_engine("pcg32")
+class PCG32Generator(_Affine64Generator):
+    """
+    PCG32 (XSH-RR) - 64-bit durum, 32-bit çıktı.
+    PCG32 (XSH-RR) - 64-bit state, 32-bit output.
+
+    Referans pcg32_srandom(seed, sequence) tohumlamasını izler.
+    Follows the reference pcg32_srandom(seed, sequence) seeding.
+    """
+
+    def __init__(self, seed: Optional[int] = None, sequence: int = 54):
+        """
+        Args:
+            seed: Başlangıç durumu / Initial state
+            sequence: Akış seçici (artışı belirler) / Stream selector (sets the increment)
+        """
+        self.sequence = sequence
+        super().__init__(seed)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """pcg32_srandom gibi yeniden tohumlar / Reseeds like pcg32_srandom."""
+        if seed is not None:
+            self.initialSeed = seed
+        self.increment = ((self.sequence << 1) | 1) & MASK64
+        self.state = 0
+        self._advance_state()
+        self.state = (self.state + self.initialSeed) & MASK64
+        self._advance_state()
+
+    @staticmethod
+    def _permute(old):
+        """
+        XSH-RR çıktı permütasyonu (O'Neill, PCG): xorshift-high ardından üst
+        5 bitle döndürme; int veya uint64 dizisi kabul eder.
+        XSH-RR output permutation (O'Neill, PCG): xorshift-high followed by a
+        rotation by the top 5 bits; accepts an int or a uint64 array.
+        """
+        if isinstance(old, int):
+            xorshifted = (((old >> 18) ^ old) >> 27) & MASK32
+            rot = old >> 59
+            return ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & MASK32
+
+        xorshifted = (((old >> np.uint64(18)) ^ old) >> np.uint64(27)) & np.uint64(MASK32)
+        rot = old >> np.uint64(59)
+        left = (np.uint64(32) - rot) & np.uint64(31)
+        return ((xorshifted >> rot) | (xorshifted << left)) & np.uint64(MASK32)
+
+    def next(self) -> int:
+        """Eski durumun XSH-RR permütasyonu / XSH-RR permutation of the old state."""
+        old = self.state
+        self._advance_state()
+        return self._permute(old)
+
+    def next_float(self) -> float:
+        """32-bit çıktıdan [0, 1) değeri / [0, 1) value from the 32-bit output."""
+        return self.next() / 2.0**32
+
+    def random_raw(self, count: int) -> np.ndarray:
+        """Toplu ham çıktı (uint32) / Batched raw output (uint32)."""
+        old = np.empty(count, dtype=np.uint64)
+        if count:
+            old[0] = self.state
+            old[1:] = self._states(count)[:-1]
+            self.state = (self.MULTIPLIER * int(old[-1]) + self.increment) & MASK64
+        return self._permute(old).astype(np.uint32)
+
+    def random(self, count: int) -> np.ndarray:
+        """Toplu [0, 1) çıktı (float64) / Batched [0, 1) output (float64)."""
+        return self.random_raw(count) / 2.0**32
+
+
+# =============================================================================
+# Şerit tabanlı motorlar (xoshiro256**, MRG32k3a) / Lane-based engines
+# =============================================================================
+
+class _LaneGenerator(RandomNumberGenerator):
+    """
+    Doğası gereği ardışık özyinelemeler için paralel şeritler.
+    Parallel lanes for inherently sequential recurrences.
+
+    Motor, `lanes` adet bağımsız referans akışı NumPy dizilerinde tutar ve
+    her adımda hepsini birlikte ilerletir. Çıktı akışı, şeritlerin adım
+    adım iç içe geçirilmesidir (adım 0: şerit 0..L-1, adım 1: ...).
+    next() ve random_raw() aynı akışı paylaşır; lanes=1 referans diziyi
+    verir.
+
+    The engine keeps `lanes` independent reference streams in NumPy arrays
+    and advances them together. The output stream interleaves the lanes
+    step by step (step 0: lanes 0..L-1, step 1: ...). next() and
+    random_raw() share that stream; lanes=1 yields the reference sequence.
+    """
+
+    RAW_DTYPE = np.uint64
+
+    def __init__(self, seed: Optional[int] = None, lanes: int = 1024):
+        """
+        Args:
+            seed: Başlangıç tohumu (None = zamana dayalı) / Initial seed (None = time-based)
+            lanes: Paralel şerit sayısı / Number of parallel lanes
+        """
+        if lanes <= 0:
+            raise ValueError("lanes must be positive")
+        self.lanes = lanes
+        self.initialSeed = _default_seed(seed)
+        self.reset(self.initialSeed)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Şeritleri yeniden tohumlar, tamponu boşaltır / Reseeds the lanes and drops the buffer."""
+        if seed is not None:
+            self.initialSeed = seed
+        self._seed_lanes(self.initialSeed)
+        self._buffer = np.empty(0, dtype=self.RAW_DTYPE)
+        self._bufferPosition = 0
+
+    @abstractmethod
+    def _seed_lanes(self, seed: int) -> None:
+        """Şerit durumlarını tohumlar / Seeds the lane states."""
+        pass
+
+    @abstractmethod
+    def _step(self) -> np.ndarray:
+        """Tüm şeritleri bir adım ilerletir / Advances every lane one step."""
+        pass
+
+    def random_raw(self, count: int) -> np.ndarray:
+        """İç içe şerit akışından toplu ham çıktı / Batched raw output of the interleaved lanes."""
+        result = np.empty(count, dtype=self.RAW_DTYPE)
+
+        # Önce tampondaki artıkları kullan / Drain leftovers first
+        leftover = min(count, len(self._buffer) - self._bufferPosition)
+        result[:leftover] = self._buffer[self._bufferPosition:self._bufferPosition + leftover]
+        self._bufferPosition += leftover
+        position = leftover
+
+        while count - position >= self.lanes:
+            result[position:position + self.lanes] = self._step()
+            position += self.lanes
+
+        if position < count:
+            self._buffer = self._step()
+            self._bufferPosition = count - position
+            result[position:] = self._buffer[:self._bufferPosition]
+        return result
+
+    def next(self) -> int:
+        """Akıştaki bir sonraki ham değer / Next raw value of the stream."""
+        if self._bufferPosition >= len(self._buffer):
+            self._buffer = self._step()
+            self._bufferPosition = 0
+        value = int(self._buffer[self._bufferPosition])
+        self._bufferPosition += 1
+        return value
+
+
+@register_engine("xoshiro256")
+class Xoshiro256StarStarGenerator(_LaneGenerator):
+    """
+    xoshiro256** (Blackman & Vigna), 256-bit durum, 64-bit çıktı.
+    xoshiro256** (Blackman & Vigna), 256-bit state, 64-bit output.
+
+    Her şeridin durumu, yazarların önerdiği gibi SplitMix64 ile tohumdan
+    türetilir; 2^256 - 1 periyot nedeniyle şeritlerin çakışma olasılığı
+    ihmal edilebilir düzeydedir.
+
+    Each lane is seeded from SplitMix64 as the authors recommend; with a
+    2^256 - 1 period the chance of overlapping lanes is negligible.
+    """
+
+    def _seed_lanes(self, seed: int) -> None:
+        """Şerit başına dört SplitMix64 kelimesi / Four SplitMix64 words per lane."""
+        words = _splitmix64(seed)
+        state = np.array([[next(words) for _ in range(4)] for _ in range(self.lanes)],
+                         dtype=np.uint64).T
+        self.s0, self.s1, self.s2, self.s3 = (row.copy() for row in state)
+
+    @staticmethod
+    def _rotl(value: np.ndarray, shift: int) -> np.ndarray:
+        """64-bit sola döndürme / 64-bit rotate left."""
+        return (value << np.uint64(shift)) | (value >> np.uint64(64 - shift))
+
+    def _step(self) -> np.ndarray:
+        """
+        xoshiro256** adımı (Blackman & Vigna, 2018): çıktı rotl(s1 * 5, 7) * 9,
+        ardından xorshift/döndürme durum güncellemesi.
+        xoshiro256** step (Blackman & Vigna, 2018): output rotl(s1 * 5, 7) * 9,
+        then the xorshift/rotate state update.
+        """
+        with np.errstate(over="ignore"):
+            result = self._rotl(self.s1 * np.uint64(5), 7) * np.uint64(9)
+        t = self.s1 << np.uint64(17)
+        self.s2 ^= self.s0
+        self.s3 ^= self.s1
+        self.s1 ^= self.s2
+        self.s0 ^= self.s3
+        self.s2 ^= t
+        self.s3 = self._rotl(self.s3, 45)
+        return result
+
+    def next_float(self) -> float:
+        """Üst 53 bitten [0, 1) değeri / [0, 1) value from the top 53 bits."""
+        return (self.next() >> 11) / 2.0**53
+
+    def random(self, count: int) -> np.ndarray:
+        """Toplu [0, 1) çıktı (float64) / Batched [0, 1) output (float64)."""
+        return (self.random_raw(count) >> np.uint64(11)).astype(np.float64) / 2.0**53
+
+
+@register_engine("mrg32k3a")
+class MRG32k3aGenerator(_LaneGenerator):
+    """
+    MRG32k3a (L'Ecuyer) birleşik çoklu özyinelemeli üreteç.
+    MRG32k3a (L'Ecuyer) combined multiple recursive generator.
+
+    Şeritler, RngStreams'teki gibi 2^127 adım aralıklı alt akışlardır;
+    atlama matrisleri ardışık kare alma ile tam sayı aritmetiğinde
+    hesaplanır. Tüm ara çarpımlar int64 sınırının altında kalır.
+
+    Lanes are substreams 2^127 steps apart, as in RngStreams; the jump
+    matrices are computed by repeated squaring in integer arithmetic. All
+    intermediate products stay below the int64 limit.
+    """
+
+    M1 = 4294967087
+    M2 = 4294944443
+    A12, A13N = 1403580, 810728
+    A21, A23N = 527612, 1370589
+    NORM = 1.0 / (M1 + 1)
+    JUMP_EXPONENT = 127
+
+    def _seed_lanes(self, seed: int) -> None:
+        """Şeritleri 2^127 adım aralıklı alt akışlara yerleştirir / Places lanes on substreams 2^127 steps apart."""
+        words = _splitmix64(seed)
+        first = [next(words) % self.M1 for _ in range(3)]
+        second = [next(words) % self.M2 for _ in range(3)]
+        # Bileşenlerin tamamen sıfır olmasını engelle / Avoid an all-zero component
+        if not any(first):
+            first[0] = 1
+        if not any(second):
+            second[0] = 1
+
+        jump1 = self._matrix_power(
+            [[0, 1, 0], [0, 0, 1], [-self.A13N % self.M1, self.A12, 0]],
+            2**self.JUMP_EXPONENT, self.M1)
+        jump2 = self._matrix_power(
+            [[0, 1, 0], [0, 0, 1], [-self.A23N % self.M2, 0, self.A21]],
+            2**self.JUMP_EXPONENT, self.M2)
+
+        lanes1, lanes2 = [], []
+        for _ in range(self.lanes):
+            lanes1.append(first)
+            lanes2.append(second)
+            first = self._matrix_vector(jump1, first, self.M1)
+            second = self._matrix_vector(jump2, second, self.M2)
+
+        state1 = np.array(lanes1, dtype=np.int64).T
+        state2 = np.array(lanes2, dtype=np.int64).T
+        self.s10, self.s11, self.s12 = (row.copy() for row in state1)
+        self.s20, self.s21, self.s22 = (row.copy() for row in state2)
+
+    @staticmethod
+    def _matrix_vector(matrix, vector, modulus):
+        """3x3 matris-vektör çarpımı (mod m) / 3x3 matrix-vector product (mod m)."""
+        return [sum(matrix[i][j] * vector[j] for j in range(3)) % modulus for i in range(3)]
+
+    @staticmethod
+    def _matrix_power(matrix, exponent, modulus):
+        """Ardışık kare alma ile matris kuvveti (mod m) / Matrix power by repeated squaring (mod m)."""
+        def multiply(left, right):
+            """3x3 matris çarpımı (mod m) / 3x3 matrix product (mod m)."""
+            return [[sum(left[i][k] * right[k][j] for k in range(3)) % modulus
+                     for j in range(3)] for i in range(3)]
+
+        result = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        while exponent:
+            if exponent & 1:
+                result = multiply(result, matrix)
+            matrix = multiply(matrix, matrix)
+            exponent >>= 1
+        return result
+
+    def _step(self) -> np.ndarray:
+        """
+        MRG32k3a adımı (L'Ecuyer, 1999): iki 3. dereceden özyineleme (mod m1,
+        m2) ilerletilir ve çıktı (p1 - p2) mod m1 olarak birleştirilir.
+        MRG32k3a step (L'Ecuyer, 1999): advances the two order-3 recurrences
+        (mod m1, m2) and combines the output as (p1 - p2) mod m1.
+        """
+        p1 = (self.A12 * self.s11 - self.A13N * self.s10) % self.M1
+        self.s10, self.s11, self.s12 = self.s11, self.s12, p1
+        p2 = (self.A21 * self.s22 - self.A23N * self.s20) % self.M2
+        self.s20, self.s21, self.s22 = self.s21, self.s22, p2
+        difference = p1 - p2
+        return np.where(difference > 0, difference, difference + self.M1).astype(np.uint64)
+
+    def next_float(self) -> float:
+        """(0, 1) aralığında değer / Value in (0, 1)."""
+        return self.next() * self.NORM
+
+    def random(self, count: int) -> np.ndarray:
+        """Toplu (0, 1) çıktı (float64) / Batched (0, 1) output (float64)."""
+        return self.random_raw(count) * self.NORM
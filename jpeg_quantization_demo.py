@@ -67,15 +67,11 @@ class JPEGQuantizationDemo:
         Returns:
             np.ndarray: 8x8 rastgele kuantalama tablosu
         """
-        randomTable = np.zeros((8, 8), dtype=np.float64)
+        # 1-255 arasında 64 değer tek çağrıda, modüler yanlılık olmadan
+        # (0 olursa bölme hatası alınır)
+        randomValues = self.rng.integers(1, 256, 64)
         
-        for i in range(8):
-            for j in range(8):
-                # 1-255 arasında rastgele değer
-                # (0 olursa bölme hatası alınır)
-                randomTable[i, j] = self.rng.next_int(1, 255)
-        
-        return randomTable
+        return randomValues.reshape(8, 8).astype(np.float64)
     
     def create_sample_image_block(self) -> np.ndarray:
         """
@@ -15,6 +15,7 @@ License: MIT
 """
 
 import time
+import struct
 from enum import Enum
 from typing import List, Optional, Tuple
 from abc import ABC, abstractmethod
@@ -139,6 +140,34 @@ class RandomNumberGenerator(ABC):
         """Üreteci sıfırlar / Resets the generator."""
         pass
 
+    def random_raw(self, count: int):
+        """
+        count adet ham çıktıyı NumPy dizisi olarak döndürür.
+        Returns count raw outputs as a NumPy array.
+        
+        Varsayılan uygulama next()'i döngüde çağırır; motorlar bunu
+        toplu (vektörel) bir sürümle geçersiz kılar.
+        The default calls next() in a loop; engines override it with a
+        batched (vectorized) version.
+        """
+        import numpy as np
+        
+        return np.fromiter((self.next() for _ in range(count)),
+                           dtype=np.uint64, count=count)
+    
+    def random(self, count: int):
+        """
+        [0, 1) aralığında count adet float64 değer döndürür.
+        Returns count float64 values in [0, 1).
+        
+        Varsayılan uygulama next_float()'u döngüde çağırır.
+        The default calls next_float() in a loop.
+        """
+        import numpy as np
+        
+        return np.fromiter((self.next_float() for _ in range(count)),
+                           dtype=np.float64, count=count)
+
 
 class LinearCongruentialGenerator(RandomNumberGenerator):
     """
@@ -172,6 +201,19 @@ class LinearCongruentialGenerator(RandomNumberGenerator):
     # Çarpımsal LCG için artış değeri sıfır
     INCREMENT: int = 0
     
+    # Dizi modunda tek seferde hesaplanan blok boyutu
+    # Block size computed at once in array mode
+    ARRAY_BLOCK_SIZE: int = 65536
+    
+    # integers() için en geniş aralık (m - 1 farklı çıktı)
+    # Widest range supported by integers() (m - 1 distinct outputs)
+    MAX_INTEGERS_RANGE: int = MODULUS - 1
+    
+    # İkili durum biçimi: sürüm, mevcut durum, başlangıç tohumu, dil
+    # Binary state format: version, current state, initial seed, language
+    STATE_FORMAT: str = ">BIIB"
+    STATE_VERSION: int = 1
+    
     def __init__(
         self, 
         seed: Optional[int] = None, 
@@ -233,6 +275,91 @@ class LinearCongruentialGenerator(RandomNumberGenerator):
         
         return self.currentState
     
+    @classmethod
+    def jump_parameters(cls, steps: int) -> Tuple[int, int]:
+        """
+        n adımlık atlama için birleşik afin dönüşümü hesaplar.
+        Computes the composed affine map for an n-step jump.
+        
+        X -> a*X + c (mod m) dönüşümü kendisiyle n kez birleştirilir:
+            X_{k+n} = (A * X_k + C) mod m
+        Ardışık kare alma ile O(log n) sürede hesaplanır.
+        
+        The map X -> a*X + c (mod m) is composed with itself n times
+        by repeated squaring in O(log n).
+        
+        Args:
+            steps: Atlanacak adım sayısı / Number of steps to jump
+        
+        Returns:
+            Tuple[int, int]: (A, C) katsayıları / (A, C) coefficients
+        """
+        if steps < 0:
+            raise ValueError("steps cannot be negative")
+        
+        # Birikmiş dönüşüm (birim) / Accumulated map (identity)
+        accMultiplier, accIncrement = 1, 0
+        # Mevcut kare dönüşüm / Current squared map
+        curMultiplier, curIncrement = cls.MULTIPLIER, cls.INCREMENT
+        
+        while steps > 0:
+            if steps & 1:
+                accMultiplier = (accMultiplier * curMultiplier) % cls.MODULUS
+                accIncrement = (accIncrement * curMultiplier + curIncrement) % cls.MODULUS
+            curIncrement = (curIncrement * (curMultiplier + 1)) % cls.MODULUS
+            curMultiplier = (curMultiplier * curMultiplier) % cls.MODULUS
+            steps >>= 1
+        
+        return accMultiplier, accIncrement
+    
+    def advance(self, steps: int) -> int:
+        """
+        Üreteci n adım ileri atlatır (O(log n)).
+        Jumps the generator n steps ahead (O(log n)).
+        
+        advance(n), next() metodunu n kez çağırmakla aynı duruma ulaşır.
+        advance(n) reaches the same state as calling next() n times.
+        
+        Args:
+            steps: Atlanacak adım sayısı / Number of steps to jump
+        
+        Returns:
+            int: Yeni durum / New state
+        """
+        jumpMultiplier, jumpIncrement = self.jump_parameters(steps)
+        self.currentState = (
+            jumpMultiplier * self.currentState + jumpIncrement
+        ) % self.MODULUS
+        return self.currentState
+    
+    def _state_after(self, steps: int) -> int:
+        """
+        Durumu değiştirmeden n adım sonraki durumu döndürür.
+        Returns the state n steps ahead without modifying the generator.
+        """
+        jumpMultiplier, jumpIncrement = self.jump_parameters(steps)
+        return (jumpMultiplier * self.currentState + jumpIncrement) % self.MODULUS
+    
+    def value_at(self, index: int) -> int:
+        """
+        Başlangıç tohumundan itibaren index. durumu döndürür.
+        Returns the state at the given index counted from the initial seed.
+        
+        value_at(0) tohumun kendisidir; reset() sonrasında k. next()
+        çağrısı value_at(k) değerini döndürür. Üretecin durumu değişmez.
+        
+        value_at(0) is the seed itself; after reset() the k-th call to
+        next() returns value_at(k). The generator state is not modified.
+        
+        Args:
+            index: Dizideki konum / Position in the stream
+        
+        Returns:
+            int: O konumdaki değer / Value at that position
+        """
+        jumpMultiplier, jumpIncrement = self.jump_parameters(index)
+        return (jumpMultiplier * self.initialSeed + jumpIncrement) % self.MODULUS
+    
     def next_float(self) -> float:
         """
         [0, 1) aralığında normalize edilmiş rastgele sayı üretir.
@@ -261,32 +388,389 @@ class LinearCongruentialGenerator(RandomNumberGenerator):
         rangeSize = maxValue - minValue + 1
         return minValue + (self.next() % rangeSize)
     
-    def generate_sequence(self, count: int) -> List[int]:
+    @classmethod
+    def _block_coefficients(cls):
+        """
+        Blok üretimi için önceden hesaplanmış katsayıları döndürür.
+        Returns the precomputed coefficients for block generation.
+        
+        k = 1..B için X_{n+k} = (A_k * X_n + C_k) mod m olacak şekilde
+        (A_k, C_k) dizileri bir kez hesaplanır ve sınıfta saklanır.
+        
+        The (A_k, C_k) arrays for k = 1..B are computed once and cached
+        on the class.
+        """
+        import numpy as np
+        
+        cached = cls.__dict__.get("_blockCoefficientsCache")
+        if cached is not None:
+            return cached
+        
+        multipliers = np.empty(cls.ARRAY_BLOCK_SIZE, dtype=np.uint64)
+        increments = np.empty(cls.ARRAY_BLOCK_SIZE, dtype=np.uint64)
+        accMultiplier, accIncrement = 1, 0
+        for k in range(cls.ARRAY_BLOCK_SIZE):
+            accMultiplier = (accMultiplier * cls.MULTIPLIER) % cls.MODULUS
+            accIncrement = (accIncrement * cls.MULTIPLIER + cls.INCREMENT) % cls.MODULUS
+            multipliers[k] = accMultiplier
+            increments[k] = accIncrement
+        
+        cls._blockCoefficientsCache = (multipliers, increments)
+        return cls._blockCoefficientsCache
+    
+    def _generate_array(self, count: int, out=None):
+        """
+        next() akışıyla bit düzeyinde aynı uint32 dizisi üretir.
+        Generates a uint32 array bit-identical to the next() stream.
+        
+        Her blok tek bir vektörel çarpma-mod işlemiyle hesaplanır;
+        A_k, C_k < 2^31 olduğundan ara çarpım uint64'e sığar.
+        out verilirse değerler ara dizi ayrılmadan doğrudan ona yazılır.
+        
+        Each block is computed with a single vectorized multiply-mod;
+        since A_k, C_k < 2^31 the intermediate product fits in uint64.
+        If out is given, values are written straight into it without an
+        intermediate array.
+        """
+        import numpy as np
+        
+        if count < 0:
+            raise ValueError("count cannot be negative")
+        
+        multipliers, increments = self._block_coefficients()
+        result = np.empty(count, dtype=np.uint32) if out is None else out
+        block = np.empty(self.ARRAY_BLOCK_SIZE, dtype=np.uint64)
+        modulus = np.uint64(self.MODULUS)
+        state = self.currentState
+        
+        for start in range(0, count, self.ARRAY_BLOCK_SIZE):
+            size = min(self.ARRAY_BLOCK_SIZE, count - start)
+            view = block[:size]
+            np.multiply(multipliers[:size], np.uint64(state), out=view)
+            np.add(view, increments[:size], out=view)
+            np.remainder(view, modulus, out=view)
+            result[start:start + size] = view
+            state = int(view[-1])
+        
+        self.currentState = state
+        return result
+    
+    def generate_sequence(self, count: int, asArray: bool = False):
         """
         Belirtilen sayıda rastgele sayı dizisi üretir.
         Generates a sequence of random numbers.
         
         Args:
             count: Üretilecek sayı adedi / Number of values to generate
+            asArray: True ise blok halinde hesaplanan bir NumPy uint32
+                     dizisi döndürülür.
+                     If True, a block-computed NumPy uint32 array is returned.
         
         Returns:
-            List[int]: Rastgele sayı listesi / List of random numbers
+            List[int] | np.ndarray: Rastgele sayı listesi / List of random numbers
         """
+        if asArray:
+            return self._generate_array(count)
         return [self.next() for _ in range(count)]
     
-    def generate_normalized_sequence(self, count: int) -> List[float]:
+    def generate_normalized_sequence(self, count: int, asArray: bool = False):
         """
         Normalize edilmiş [0,1) aralığında sayı dizisi üretir.
         Generates a normalized sequence in [0,1) range.
         
         Args:
             count: Üretilecek sayı adedi / Number of values to generate
+            asArray: True ise NumPy float64 dizisi döndürülür.
+                     If True, a NumPy float64 array is returned.
         
         Returns:
-            List[float]: Normalize edilmiş sayı listesi
+            List[float] | np.ndarray: Normalize edilmiş sayı listesi
         """
+        if asArray:
+            import numpy as np
+            
+            values = self._generate_array(count, out=np.empty(count, dtype=np.float64))
+            values /= self.MODULUS
+            return values
         return [self.next_float() for _ in range(count)]
     
+    def random_raw(self, count: int):
+        """
+        Toplu ham çıktı (uint32) / Batched raw output (uint32).
+        """
+        return self._generate_array(count)
+    
+    def random(self, count: int):
+        """
+        Toplu [0, 1) çıktı (float64) / Batched [0, 1) output (float64).
+        """
+        return self.generate_normalized_sequence(count, asArray=True)
+    
+    def fill_into(self, buffer) -> int:
+        """
+        Yazılabilir bir tamponu ara kopya olmadan rastgele çıktıyla doldurur.
+        Fills a writable buffer with random output without intermediate copies.
+        
+        float64 NumPy dizileri [0, 1) aralığında normalize değerlerle
+        doldurulur. Diğer tüm tamponlar (bytearray, memoryview, mmap,
+        shared_memory.buf, tamsayı dizileri) ardışık yerel sıralı uint32
+        next() değerleriyle bayt bayt doldurulur; son eksik kelime bir
+        sonraki değerin ilk baytlarını alır.
+        
+        float64 NumPy arrays are filled with normalized [0, 1) values.
+        Every other buffer (bytearray, memoryview, mmap, shared_memory.buf,
+        integer arrays) is filled byte-wise with consecutive native-order
+        uint32 next() values; a trailing partial word takes the leading
+        bytes of one more value.
+        
+        Args:
+            buffer: Yazılabilir, bitişik tampon / Writable contiguous buffer
+        
+        Returns:
+            int: Yazılan byte sayısı / Number of bytes written
+        """
+        import numpy as np
+        
+        if isinstance(buffer, np.ndarray) and buffer.dtype == np.float64:
+            if not buffer.flags.c_contiguous or not buffer.flags.writeable:
+                raise ValueError("buffer must be a writable C-contiguous array")
+            flat = buffer.reshape(-1)
+            self._generate_array(flat.size, out=flat)
+            flat /= self.MODULUS
+            return flat.nbytes
+        
+        data = np.frombuffer(memoryview(buffer).cast("B"), dtype=np.uint8)
+        if not data.flags.writeable:
+            raise TypeError("buffer must be writable")
+        
+        words = len(data) // 4
+        self._generate_array(words, out=data[:words * 4].view(np.uint32))
+        tail = len(data) - words * 4
+        if tail:
+            lastWord = np.array([self.next()], dtype=np.uint32)
+            data[words * 4:] = lastWord.view(np.uint8)[:tail]
+        return len(data)
+    
+    def dump(
+        self,
+        path: str,
+        count: int,
+        fmt: str = "uint32",
+        chunkSize: int = 2**20,
+        useMemmap: bool = False
+    ) -> dict:
+        """
+        Üretilen diziyi parça parça ikili bir dosyaya yazar.
+        Writes the generated stream to a binary file chunk by chunk.
+        
+        Ayrıntılar için rng_io.dump_stream'e bakınız.
+        See rng_io.dump_stream for details.
+        
+        Args:
+            path: Hedef dosya yolu / Target file path
+            count: Öğe sayısı ("raw" için byte) / Item count (bytes for "raw")
+            fmt: "uint32", "float64" veya/or "raw"
+            chunkSize: Parça başına öğe sayısı / Items per chunk
+            useMemmap: True ise önceden boyutlandırılmış np.memmap kullanılır
+                       If True, a pre-sized np.memmap is filled instead
+        
+        Returns:
+            dict: Yazılan byte, süre ve MB/s / Bytes written, seconds, MB/s
+        """
+        from rng_io import dump_stream
+        
+        return dump_stream(self, path, count, fmt, chunkSize, useMemmap)
+    
+    def astream(
+        self,
+        chunkSize: int = 2**20,
+        count: Optional[int] = None,
+        prefetch: int = 2,
+        normalized: bool = False
+    ):
+        """
+        Asenkron dizi akışı: async for chunk in lcg.astream(2**20).
+        Asynchronous array stream: async for chunk in lcg.astream(2**20).
+        
+        Parçalar random_raw() (veya normalized=True ise random()) ile bir
+        yürütücüde üretilir; en fazla `prefetch` parça önde hazırlanır.
+        Dizi, aynı çağrıların senkron sırasıyla birebir aynıdır.
+        
+        Chunks are produced with random_raw() (or random() when
+        normalized=True) in an executor, with at most `prefetch` chunks
+        prepared ahead. The sequence is identical to the synchronous calls.
+        
+        Args:
+            chunkSize: Parça başına değer sayısı / Values per chunk
+            count: Toplam değer sayısı (None = sonsuz) / Total values (None = endless)
+            prefetch: Önde hazırlanacak parça sayısı / Chunks prepared ahead
+            normalized: [0, 1) float64 üret / Produce float64 in [0, 1)
+        
+        Returns:
+            AsyncIterator[np.ndarray]: uint32 veya float64 parçaları / chunks
+        """
+        from async_rng import prefetch_stream
+        
+        if chunkSize <= 0:
+            raise ValueError("chunkSize must be positive")
+        if count is not None and count < 0:
+            raise ValueError("count cannot be negative")
+        
+        produceChunk = self.random if normalized else self.random_raw
+        chunks = None if count is None else -(-count // chunkSize)
+        
+        def produce(index: int):
+            size = chunkSize if count is None else min(chunkSize, count - index * chunkSize)
+            return produceChunk(size)
+        
+        return prefetch_stream(produce, chunks, prefetch)
+    
+    def integers(self, low: int, high: int, size: Optional[int] = None):
+        """
+        [low, high) aralığında yanlılıksız tam sayılar üretir (toplu).
+        Generates unbiased integers in [low, high) in bulk.
+        
+        Lemire'nin çarp-ve-böl yöntemi LCG'nin m - 1 değerli çıktı uzayına
+        uyarlanmıştır: x' = x - 1, p = x' * s; sonuç p // (m-1), kalan
+        p % (m-1) eşik değerinden küçükse örnek reddedilir. Reddedilen
+        konumlar vektörel olarak yeniden doldurulur; next() % s'deki
+        modüler yanlılık oluşmaz.
+        
+        Lemire's multiply method adapted to the LCG's (m - 1)-valued output
+        space: x' = x - 1, p = x' * s; the result is p // (m-1) and the
+        sample is rejected when p % (m-1) is below the threshold. Rejected
+        slots are refilled vectorized, so there is no modulo bias.
+        
+        Args:
+            low: Alt sınır (dahil) / Lower bound (inclusive)
+            high: Üst sınır (hariç) / Upper bound (exclusive)
+            size: Dizi boyutu. None ise tek bir int döndürülür.
+                  Array size. If None, a single int is returned.
+        
+        Returns:
+            int | np.ndarray: int64 dizisi; sonuçlar int64'e sığmıyorsa object
+                              int64 array; object when results do not fit int64
+        """
+        import numpy as np
+        
+        rangeSize = high - low
+        sourceRange = self.MAX_INTEGERS_RANGE
+        if rangeSize <= 0:
+            raise ValueError("high must be greater than low")
+        if rangeSize > sourceRange:
+            raise ValueError(f"range cannot exceed {sourceRange}")
+        
+        count = 1 if size is None else size
+        threshold = np.uint64(sourceRange % rangeSize)
+        scale = np.uint64(rangeSize)
+        divisor = np.uint64(sourceRange)
+        
+        result = np.empty(count, dtype=np.int64)
+        pending = np.arange(count)
+        while len(pending):
+            products = (self._generate_array(len(pending)).astype(np.uint64)
+                        - np.uint64(1)) * scale
+            accepted = (products % divisor) >= threshold
+            result[pending[accepted]] = (products[accepted] // divisor).astype(np.int64)
+            pending = pending[~accepted]
+        
+        # Kaydırma int64 dışına taşacaksa Python tamsayılarıyla yapılır
+        # The shift is done in Python ints when it would overflow int64
+        if size is None:
+            return low + int(result[0])
+        if low >= -2**63 and high <= 2**63:
+            result += low
+            return result
+        return result.astype(object) + low
+    
+    def sample(self, population, k: int) -> list:
+        """
+        Popülasyondan k farklı öğe seçer (O(k), random.sample gibi).
+        Picks k distinct items from the population (O(k), like random.sample).
+        
+        Ayrıntılar için sampling.sample'a bakınız.
+        See sampling.sample for details.
+        """
+        from sampling import sample
+        
+        return sample(self, population, k)
+    
+    def reservoir(self, iterable, k: int) -> list:
+        """
+        Bir akıştan tek geçişte k öğe seçer (Algorithm L).
+        Picks k items from a stream in one pass (Algorithm L).
+        
+        Ayrıntılar için sampling.reservoir'a bakınız.
+        See sampling.reservoir for details.
+        """
+        from sampling import reservoir
+        
+        return reservoir(self, iterable, k)
+    
+    def generate_sequence_parallel(
+        self,
+        count: int,
+        workers: Optional[int] = None,
+        outputPath: Optional[str] = None,
+        blockSize: int = 2**24
+    ):
+        """
+        Uzun bir diziyi birden fazla işlemde paralel üretir.
+        Generates a long sequence in parallel across multiple processes.
+        
+        Aralık ardışık bloklara bölünür; her işçi kendi bloğunun başına
+        advance() ile atlar ve bloğu dizi modunda üretir. Sonuç,
+        generate_sequence(count) ile bit düzeyinde aynıdır ve üreteç
+        sonunda count adım ilerlemiş olur.
+        
+        The range is split into contiguous blocks; each worker jumps to
+        its block start and generates it in array mode. The result is
+        bit-identical to generate_sequence(count) and the generator ends
+        up count steps ahead.
+        
+        Args:
+            count: Üretilecek sayı adedi / Number of values to generate
+            workers: İşlem sayısı (None ise CPU sayısı) / Process count
+            outputPath: Verilirse sonuç bu dosyaya ham uint32 olarak
+                        yazılır (np.memmap).
+                        If given, the result is written to this file as
+                        raw uint32 (np.memmap).
+            blockSize: İşçi başına blok boyutu / Block size per worker task
+        
+        Returns:
+            np.ndarray | None: uint32 dizisi veya dosya modunda None
+                               uint32 array, or None in file mode
+        """
+        import numpy as np
+        from concurrent.futures import ProcessPoolExecutor
+        
+        if count < 0:
+            raise ValueError("count cannot be negative")
+        if blockSize <= 0:
+            raise ValueError("blockSize must be positive")
+        
+        # Her bloğun başlangıç durumu / Start state of each block
+        tasks = []
+        for offset in range(0, count, blockSize):
+            size = min(blockSize, count - offset)
+            tasks.append((self._state_after(offset), offset, size, outputPath))
+        
+        if outputPath is not None:
+            # Dosyayı önceden boyutlandır / Pre-size the file
+            with open(outputPath, "wb") as outputFile:
+                outputFile.truncate(count * 4)
+            result = None
+        else:
+            result = np.empty(count, dtype=np.uint32)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for offset, block in executor.map(_generate_parallel_block, tasks):
+                if result is not None:
+                    result[offset:offset + len(block)] = block
+        
+        self.advance(count)
+        return result
+    
     def reset(self, seed: Optional[int] = None) -> None:
         """
         Üreteci başlangıç durumuna sıfırlar.
@@ -302,6 +786,66 @@ class LinearCongruentialGenerator(RandomNumberGenerator):
         else:
             self.currentState = self.initialSeed
     
+    def getstate(self) -> Tuple[int, int]:
+        """
+        Üretecin durumunu döndürür (ucuz anlık görüntü).
+        Returns the generator state (cheap snapshot).
+        
+        Returns:
+            Tuple[int, int]: (mevcut durum, başlangıç tohumu)
+                             (current state, initial seed)
+        """
+        return self.currentState, self.initialSeed
+    
+    def setstate(self, state: Tuple[int, int]) -> None:
+        """
+        getstate() ile alınan durumu geri yükler.
+        Restores a state obtained from getstate().
+        
+        Args:
+            state: (mevcut durum, başlangıç tohumu) / (current state, initial seed)
+        """
+        currentState, initialSeed = state
+        for value in (currentState, initialSeed):
+            if not 0 < value < self.MODULUS:
+                raise ValueError(f"state values must be in [1, {self.MODULUS - 1}]")
+        self.currentState = currentState
+        self.initialSeed = initialSeed
+    
+    def to_bytes(self) -> bytes:
+        """
+        Durumu kompakt ikili biçimde serileştirir (10 byte).
+        Serializes the state into a compact binary form (10 bytes).
+        """
+        languageIndex = list(Language).index(self.localization.currentLanguage)
+        return struct.pack(self.STATE_FORMAT, self.STATE_VERSION,
+                           self.currentState, self.initialSeed, languageIndex)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LinearCongruentialGenerator":
+        """
+        to_bytes() çıktısından üreteç oluşturur.
+        Creates a generator from the output of to_bytes().
+        """
+        version, currentState, initialSeed, languageIndex = struct.unpack(
+            cls.STATE_FORMAT, data
+        )
+        if version != cls.STATE_VERSION:
+            raise ValueError(f"Unsupported state version: {version}")
+        generator = cls.__new__(cls)
+        generator.__setstate__((currentState, initialSeed, list(Language)[languageIndex]))
+        return generator
+    
+    def __getstate__(self) -> tuple:
+        """Pickle için kompakt durum / Compact state for pickle."""
+        return self.currentState, self.initialSeed, self.localization.currentLanguage
+    
+    def __setstate__(self, state: tuple) -> None:
+        """Pickle durumundan geri yükler / Restores from pickle state."""
+        currentState, initialSeed, language = state
+        self.localization = LocalizationManager(language)
+        self.setstate((currentState, initialSeed))
+    
     def set_language(self, language: Language) -> None:
         """
         Çıktı dilini değiştirir.
@@ -322,36 +866,75 @@ class LinearCongruentialGenerator(RandomNumberGenerator):
             "max_period": self.MODULUS - 1
         }
     
-    def calculate_statistics(self, sampleSize: int = 10000) -> dict:
+    def calculate_statistics(
+        self,
+        sampleSize: int = 10000,
+        chunkSize: int = 2**20,
+        workers: int = 1
+    ) -> dict:
         """
         Üretilen sayılar için istatistiksel analiz yapar.
         Performs statistical analysis on generated numbers.
         
+        Örnekler parça parça üretilir ve her parçanın momentleri
+        Welford/Chan birleştirmesiyle toplanır; bellek kullanımı
+        sampleSize'dan bağımsızdır. Üretecin durumu sonunda geri yüklenir.
+        
+        Samples are generated chunk by chunk and the per-chunk moments
+        are merged Welford/Chan style, so memory use does not depend on
+        sampleSize. The generator state is restored at the end.
+        
         Args:
             sampleSize: Örnek büyüklüğü / Sample size
+            chunkSize: Parça başına örnek sayısı / Samples per chunk
+            workers: 1'den büyükse parçalar bu kadar işlemde hesaplanır
+                     If greater than 1, chunks are computed in this many
+                     processes
         
         Returns:
             dict: İstatistiksel metrikler / Statistical metrics
         """
+        if sampleSize <= 0:
+            raise ValueError("sampleSize must be positive")
+        if chunkSize <= 0:
+            raise ValueError("chunkSize must be positive")
+        
         # Mevcut durumu kaydet / Save current state
         savedState = self.currentState
         
-        # Örnek üret / Generate samples
-        samples = self.generate_normalized_sequence(sampleSize)
+        # Parçaların başlangıç durumları / Start states of the chunks
+        tasks = [
+            (self._state_after(offset), min(chunkSize, sampleSize - offset))
+            for offset in range(0, sampleSize, chunkSize)
+        ]
         
-        # Ortalama hesapla / Calculate mean
-        mean = sum(samples) / len(samples)
+        if workers > 1 and len(tasks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(_chunk_moments, tasks))
+        else:
+            partials = [_chunk_moments(task) for task in tasks]
         
-        # Varyans hesapla / Calculate variance
-        variance = sum((x - mean) ** 2 for x in samples) / len(samples)
+        # Parçaları Chan/Pébay formülleriyle birleştir
+        # Merge the chunks with the Chan/Pébay formulas
+        moments = partials[0]
+        for partial in partials[1:]:
+            moments = _merge_moments(moments, partial)
+        count, mean, m2, m3, m4, minimum, maximum = moments
         
         # Durumu geri yükle / Restore state
         self.currentState = savedState
         
+        variance = m2 / count
         return {
             "sample_size": sampleSize,
             "mean": mean,
             "variance": variance,
+            "min": minimum,
+            "max": maximum,
+            "skewness": (m3 / count) / variance ** 1.5 if variance > 0 else 0.0,
+            "excess_kurtosis": (m4 / count) / variance ** 2 - 3 if variance > 0 else 0.0,
             "expected_mean": 0.5,
             "expected_variance": 1/12  # Uniform [0,1] için / For Uniform [0,1]
         }
@@ -409,6 +992,275 @@ class LinearCongruentialGenerator(RandomNumberGenerator):
         print("=" * 60 + "\n")
 
 
+class GeneratorBank:
+    """
+    Yapı-dizisi (struct-of-arrays) biçiminde N bağımsız MINSTD akışı.
+    N independent MINSTD streams in struct-of-arrays form.
+    
+    Tüm şerit (lane) durumları tek bir uint64 NumPy dizisinde tutulur ve
+    tek bir vektörel çarpma-mod işlemiyle birlikte ilerletilir. Her şerit,
+    aynı tohumla başlatılmış bir LinearCongruentialGenerator ile bit
+    düzeyinde aynı diziyi üretir; ancak şerit başına LocalizationManager
+    veya Python çağrısı yoktur.
+    
+    All lane states live in one uint64 NumPy array and advance together
+    with a single vectorized multiply-mod. Each lane produces exactly the
+    sequence of a LinearCongruentialGenerator with the same seed, without
+    a per-lane LocalizationManager or Python call.
+    """
+    
+    MODULUS: int = LinearCongruentialGenerator.MODULUS
+    MULTIPLIER: int = LinearCongruentialGenerator.MULTIPLIER
+    INCREMENT: int = LinearCongruentialGenerator.INCREMENT
+    
+    def __init__(self, seeds):
+        """
+        Bankayı verilen tohumlarla başlatır.
+        Initializes the bank with the given seeds.
+        
+        Args:
+            seeds: Şerit başına tohum dizisi / Per-lane seed array
+        """
+        import numpy as np
+        
+        self.initialSeeds = self._normalize_seeds(np.asarray(seeds, dtype=np.int64).ravel())
+        self.states = self.initialSeeds.copy()
+    
+    @classmethod
+    def spaced(cls, seed: int, size: int, spacing: Optional[int] = None) -> "GeneratorBank":
+        """
+        Tek bir tohumlu akışı çakışmayan şeritlere böler.
+        Splits one seeded stream into non-overlapping lanes.
+        
+        i. şerit, akışın i * spacing konumundan başlar (jump-ahead ile).
+        Lane i starts at position i * spacing of the stream (via jump-ahead).
+        
+        Args:
+            seed: Ana akışın tohumu / Seed of the parent stream
+            size: Şerit sayısı / Number of lanes
+            spacing: Şeritler arası adım (None ise periyot / size)
+                     Steps between lanes (None = period / size)
+        """
+        import numpy as np
+        
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if spacing is None:
+            spacing = (cls.MODULUS - 1) // size
+        
+        bank = cls(np.full(size, seed, dtype=np.int64))
+        bank.advance(np.arange(size, dtype=np.uint64) * np.uint64(spacing))
+        bank.initialSeeds = bank.states.copy()
+        return bank
+    
+    def _normalize_seeds(self, seeds):
+        """
+        Tohumları _initialize_seed ile aynı kurala göre [1, m-1]'e indirger.
+        Reduces seeds into [1, m-1] with the same rule as _initialize_seed.
+        """
+        import numpy as np
+        
+        states = np.mod(seeds, self.MODULUS).astype(np.uint64)
+        states[states == 0] = 1
+        return states
+    
+    def __len__(self) -> int:
+        """Şerit sayısı / Number of lanes."""
+        return len(self.states)
+    
+    def next(self, out=None):
+        """
+        Tüm şeritleri bir adım ilerletir ve yeni değerleri döndürür.
+        Advances every lane by one step and returns the new values.
+        
+        Args:
+            out: İsteğe bağlı uint32 çıktı dizisi / Optional uint32 output array
+        
+        Returns:
+            np.ndarray: Şerit başına uint32 değer / One uint32 value per lane
+        """
+        import numpy as np
+        
+        np.multiply(self.states, np.uint64(self.MULTIPLIER), out=self.states)
+        if self.INCREMENT:
+            np.add(self.states, np.uint64(self.INCREMENT), out=self.states)
+        np.remainder(self.states, np.uint64(self.MODULUS), out=self.states)
+        
+        if out is None:
+            return self.states.astype(np.uint32)
+        out[...] = self.states
+        return out
+    
+    def next_float(self, out=None):
+        """
+        Tüm şeritler için [0, 1) aralığında normalize değer üretir.
+        Generates a normalized [0, 1) value for every lane.
+        """
+        import numpy as np
+        
+        if out is None:
+            out = np.empty(len(self.states), dtype=np.float64)
+        self.next(out=out)
+        out /= self.MODULUS
+        return out
+    
+    def advance(self, steps, lanes=None) -> None:
+        """
+        Şeritleri O(log n) sürede ileri atlatır.
+        Jumps lanes ahead in O(log n).
+        
+        Args:
+            steps: Tüm şeritler için tek değer veya şerit başına dizi
+                   A single value for all lanes or a per-lane array
+            lanes: Yalnızca bu şeritler (indeks veya maske); None = tümü
+                   Only these lanes (indices or mask); None = all
+        """
+        import numpy as np
+        
+        if np.isscalar(steps):
+            jumpMultiplier, jumpIncrement = LinearCongruentialGenerator.jump_parameters(int(steps))
+            target = self.states if lanes is None else self.states[lanes]
+            target = (target * np.uint64(jumpMultiplier) + np.uint64(jumpIncrement)) \
+                % np.uint64(self.MODULUS)
+            if lanes is None:
+                self.states = target
+            else:
+                self.states[lanes] = target
+            return
+        
+        # Şerit başına farklı adım: bitler üzerinden vektörel kare alma
+        # Per-lane steps: vectorized repeated squaring over the bits
+        steps = np.asarray(steps, dtype=np.uint64).copy()
+        modulus = np.uint64(self.MODULUS)
+        accMultiplier = np.ones(len(steps), dtype=np.uint64)
+        accIncrement = np.zeros(len(steps), dtype=np.uint64)
+        curMultiplier, curIncrement = self.MULTIPLIER, self.INCREMENT
+        
+        while steps.any():
+            odd = (steps & np.uint64(1)).astype(bool)
+            accMultiplier[odd] = accMultiplier[odd] * np.uint64(curMultiplier) % modulus
+            accIncrement[odd] = (accIncrement[odd] * np.uint64(curMultiplier)
+                                 + np.uint64(curIncrement)) % modulus
+            curIncrement = (curIncrement * (curMultiplier + 1)) % self.MODULUS
+            curMultiplier = (curMultiplier * curMultiplier) % self.MODULUS
+            steps >>= np.uint64(1)
+        
+        target = self.states if lanes is None else self.states[lanes]
+        target = (target * accMultiplier % modulus + accIncrement) % modulus
+        if lanes is None:
+            self.states = target
+        else:
+            self.states[lanes] = target
+    
+    def reset(self, lanes=None, seeds=None) -> None:
+        """
+        Şeritleri başlangıç tohumlarına veya yeni tohumlara sıfırlar.
+        Resets lanes to their initial seeds or to new seeds.
+        
+        Args:
+            lanes: Sıfırlanacak şeritler; None = tümü / Lanes to reset; None = all
+            seeds: Yeni tohumlar (None ise başlangıç tohumları)
+                   New seeds (None = initial seeds)
+        """
+        import numpy as np
+        
+        selector = slice(None) if lanes is None else lanes
+        if seeds is not None:
+            newSeeds = self._normalize_seeds(np.asarray(seeds, dtype=np.int64))
+            self.initialSeeds[selector] = newSeeds
+        self.states[selector] = self.initialSeeds[selector]
+    
+    def lane(self, index: int) -> LinearCongruentialGenerator:
+        """
+        Bir şeridin mevcut durumundan bağımsız bir LCG oluşturur.
+        Creates a standalone LCG from the current state of one lane.
+        """
+        generator = LinearCongruentialGenerator(seed=int(self.states[index]))
+        generator.initialSeed = int(self.initialSeeds[index])
+        return generator
+
+
+def _generate_parallel_block(task: tuple):
+    """
+    generate_sequence_parallel için işçi fonksiyonu.
+    Worker function for generate_sequence_parallel.
+    
+    Dosya modunda bloğu doğrudan memmap'e yazar ve boş dizi döndürür.
+    In file mode it writes the block straight into the memmap and
+    returns an empty array.
+    """
+    import numpy as np
+    
+    startState, offset, size, outputPath = task
+    generator = LinearCongruentialGenerator(seed=startState)
+    block = generator.generate_sequence(size, asArray=True)
+    
+    if outputPath is None:
+        return offset, block
+    
+    mapped = np.memmap(outputPath, dtype=np.uint32, mode="r+",
+                       offset=offset * 4, shape=(size,))
+    mapped[:] = block
+    mapped.flush()
+    del mapped
+    return offset, block[:0]
+
+
+def _chunk_moments(task: tuple) -> tuple:
+    """
+    Bir parçanın momentlerini hesaplar (calculate_statistics işçisi).
+    Computes the moments of one chunk (calculate_statistics worker).
+    
+    Returns:
+        tuple: (n, ortalama/mean, M2, M3, M4, min, max)
+    """
+    startState, size = task
+    generator = LinearCongruentialGenerator(seed=startState)
+    samples = generator.generate_normalized_sequence(size, asArray=True)
+    
+    mean = float(samples.mean())
+    deviations = samples - mean
+    squared = deviations * deviations
+    return (
+        size,
+        mean,
+        float(squared.sum()),
+        float((squared * deviations).sum()),
+        float((squared * squared).sum()),
+        float(samples.min()),
+        float(samples.max()),
+    )
+
+
+def _merge_moments(left: tuple, right: tuple) -> tuple:
+    """
+    İki parçanın momentlerini birleştirir (Chan/Pébay).
+    Merges the moments of two chunks (Chan/Pébay).
+    """
+    countA, meanA, m2A, m3A, m4A, minA, maxA = left
+    countB, meanB, m2B, m3B, m4B, minB, maxB = right
+    
+    count = countA + countB
+    delta = meanB - meanA
+    deltaN = delta / count
+    product = countA * countB
+    
+    mean = meanA + deltaN * countB
+    m2 = m2A + m2B + delta * deltaN * product
+    m3 = (
+        m3A + m3B
+        + delta * deltaN * deltaN * product * (countA - countB)
+        + 3 * deltaN * (countA * m2B - countB * m2A)
+    )
+    m4 = (
+        m4A + m4B
+        + delta * deltaN ** 3 * product * (countA * countA - product + countB * countB)
+        + 6 * deltaN * deltaN * (countA * countA * m2B + countB * countB * m2A)
+        + 4 * deltaN * (countA * m3B - countB * m3A)
+    )
+    return count, mean, m2, m3, m4, min(minA, minB), max(maxA, maxB)
+
+
 def demonstrate_language_feature():
     """
     Dil özelliğini gösterir.
@@ -469,4 +1321,12 @@ def main():
 
 
 if __name__ == "__main__":
+    import sys
+    
+    # Argüman verilirse komut satırı üreteci, aksi halde demo
+    # With arguments run the command-line generator, otherwise the demo
+    if len(sys.argv) > 1:
+        from rng_cli import main as cli_main
+        
+        sys.exit(cli_main())
     main()
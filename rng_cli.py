@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Komut Satırı Üreteci - Command-Line Generator
+=============================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+Test düzenekleri için yüksek verimli akış çıktısı üretir. Çıktı büyük
+parçalar halinde stdout'a veya bir dosyaya yazılır; modüller tembel
+olarak içe aktarılır ve NumPy yalnızca gerektiğinde yüklenir.
+
+Streams high-throughput output for test harnesses. Output is written in
+large chunks to stdout or a file; modules are imported lazily and NumPy
+is only loaded when needed.
+
+Kullanım / Usage:
+    python -m lcg_generator generate --engine lcg --count 1000000 --format u32 > out.bin
+    python rng_cli.py generate --engine csprng --count 64 --format hex
+    python rng_cli.py generate --engine pcg32 --seed 42 --count 10 --format text
+
+Biçimler / Formats:
+    text : 32-bit kelimeler, satır başına bir ondalık sayı / decimal, one per line
+    hex  : 32-bit kelimeler, satır başına 8 onaltılık hane / 8 hex digits per line
+    u32  : ikili yerel sıralı uint32 / binary native-order uint32
+    f64  : ikili yerel sıralı float64, [0, 1) / binary native-order float64
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+
+FORMATS = ("text", "hex", "u32", "f64")
+
+# engines kayıt defteri dışında CLI'nin kabul ettiği kaynaklar
+# Sources the CLI accepts besides the engines registry
+CLI_SOURCES = ("lcg", "csprng")
+
+
+class _LCGSource:
+    """MINSTD LCG kaynağı (NumPy blok üretimi) / MINSTD LCG source."""
+
+    def __init__(self, seed: Optional[int]):
+        from lcg_generator import LinearCongruentialGenerator
+
+        self.generator = LinearCongruentialGenerator(seed=seed)
+
+    def u32(self, count: int):
+        return self.generator.random_raw(count)
+
+    def f64(self, count: int):
+        return self.generator.random(count)
+
+
+class _SecureSource:
+    """
+    CSPRNG kaynağı: toplu DRBG modu ve yeniden kullanılan bir tampona
+    fill_into; tamsayı biçimleri NumPy gerektirmez.
+    CSPRNG source: bulk DRBG mode and fill_into a reused buffer; integer
+    formats do not need NumPy.
+    """
+
+    def __init__(self, seed: Optional[int]):
+        from secure_rng import CryptographicallySecureRNG
+
+        self.generator = CryptographicallySecureRNG(bulk=True)
+        self.buffer = bytearray()
+
+    def u32(self, count: int):
+        if len(self.buffer) != count * 4:
+            self.buffer = bytearray(count * 4)
+        self.generator.fill_into(self.buffer)
+        return self.buffer
+
+    def f64(self, count: int):
+        import numpy as np
+
+        values = np.empty(count, dtype=np.float64)
+        self.generator.fill_into(values)
+        return values
+
+
+class _EngineSource:
+    """
+    engines kayıt defterindeki bir motor. 64-bit ham çıktılarda u32 için
+    üst 32 bit kullanılır.
+    An engine from the engines registry. For 64-bit raw outputs, u32 uses
+    the high 32 bits.
+    """
+
+    def __init__(self, name: str, seed: Optional[int]):
+        from engines import create_engine
+
+        self.generator = create_engine(name, seed=seed)
+
+    def u32(self, count: int):
+        import numpy as np
+
+        raw = self.generator.random_raw(count)
+        if raw.dtype.itemsize == 8:
+            return (raw >> np.uint64(32)).astype(np.uint32)
+        return raw.astype(np.uint32, copy=False)
+
+    def f64(self, count: int):
+        return self.generator.random(count)
+
+
+def _available_sources() -> List[str]:
+    """CLI'nin kabul ettiği tüm motor adları / Every engine name the CLI accepts."""
+    from engines import available_engines
+
+    return sorted(set(CLI_SOURCES) | set(available_engines()))
+
+
+def _validate_arguments(engine: str, fmt: str, count: int, seed: Optional[int]) -> None:
+    """
+    Argümanları çıktı açılmadan önce denetler; hata durumunda ValueError.
+    Checks the arguments before any output is opened; raises ValueError.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt}")
+    if count < 0:
+        raise ValueError("count cannot be negative")
+    if engine == "csprng":
+        if seed is not None:
+            raise ValueError("The csprng engine cannot be seeded")
+    elif engine not in CLI_SOURCES:
+        sources = _available_sources()
+        if engine not in sources:
+            raise ValueError(f"Unknown engine: {engine} (available: {', '.join(sources)})")
+
+
+def _create_source(engine: str, seed: Optional[int]):
+    """Motor adından kaynak oluşturur / Creates a source from an engine name."""
+    if engine in ("lcg", "minstd"):
+        return _LCGSource(seed)
+    if engine == "csprng":
+        return _SecureSource(seed)
+    return _EngineSource(engine, seed)
+
+
+def _encode(source, fmt: str, count: int):
+    """Bir parçayı istenen biçimde bytes benzeri nesneye çevirir / Encodes one chunk."""
+    if fmt == "f64":
+        return memoryview(source.f64(count)).cast("B")
+
+    words = source.u32(count)
+    if fmt == "u32":
+        return memoryview(words).cast("B")
+
+    values = memoryview(words).cast("I").tolist() if isinstance(words, bytearray) \
+        else words.tolist()
+    if fmt == "text":
+        return ("\n".join(map(str, values)) + "\n").encode("ascii")
+    return ("\n".join(f"{value:08x}" for value in values) + "\n").encode("ascii")
+
+
+def generate(engine: str, count: int, fmt: str, output, seed: Optional[int] = None,
+             chunkSize: int = 2**20) -> int:
+    """
+    count değeri parça parça output'a (ikili dosya nesnesi) yazar.
+    Writes count values chunk by chunk into output (a binary file object).
+
+    Returns:
+        int: Yazılan byte sayısı / Number of bytes written
+    """
+    _validate_arguments(engine, fmt, count, seed)
+    source = _create_source(engine, seed)
+    written = 0
+    for start in range(0, count, chunkSize):
+        data = _encode(source, fmt, min(chunkSize, count - start))
+        output.write(data)
+        written += len(data)
+    output.flush()
+    return written
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Komut satırı ayrıştırıcısını kurar / Builds the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="lcg_generator",
+        description="Rastgele sayı akışı üretir / Streams random numbers."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generateParser = commands.add_parser("generate", help="Akış üret / Generate a stream")
+    generateParser.add_argument("--engine", default="lcg",
+                                help="lcg, csprng veya/or engines: minstd, lcg64, "
+                                     "pcg32, xoshiro256, mrg32k3a")
+    generateParser.add_argument("--count", type=int, required=True,
+                                help="Değer sayısı / Number of values")
+    generateParser.add_argument("--format", choices=FORMATS, default="text", dest="fmt")
+    generateParser.add_argument("--seed", type=int, default=None)
+    generateParser.add_argument("--output", "-o", default="-",
+                                help="Dosya yolu veya stdout için '-' / Path or '-'")
+    generateParser.add_argument("--chunk-size", type=int, default=2**20, dest="chunkSize")
+    generateParser.add_argument("--report", action="store_true",
+                                help="Verimi stderr'e yaz / Print throughput to stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Komut satırı girişi / Command-line entry point."""
+    args = _build_parser().parse_args(argv)
+
+    # Geçersiz bir motor adı var olan çıktı dosyasını silmemeli
+    # An invalid engine name must not truncate an existing output file
+    try:
+        _validate_arguments(args.engine, args.fmt, args.count, args.seed)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    startTime = time.perf_counter()
+    try:
+        if args.output == "-":
+            written = generate(args.engine, args.count, args.fmt, sys.stdout.buffer,
+                               args.seed, args.chunkSize)
+        else:
+            with open(args.output, "wb") as outputFile:
+                written = generate(args.engine, args.count, args.fmt, outputFile,
+                                   args.seed, args.chunkSize)
+    except BrokenPipeError:
+        # Okuyucu erken kapandı (ör. | head) / Reader closed early (e.g. | head)
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    if args.report:
+        elapsed = time.perf_counter() - startTime
+        print(f"{written:,} bytes in {elapsed:.3f} s "
+              f"({written / elapsed / 1e6:.1f} MB/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Üreteç Çıktısı G/Ç Yardımcıları - Generator Output I/O Helpers
+==============================================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+Bu modül, LinearCongruentialGenerator ve CryptographicallySecureRNG
+çıktısını sabit boyutlu parçalar halinde ikili dosyalara veya önceden
+boyutlandırılmış np.memmap dosyalarına yazar. Her iki üreteç de
+fill_into() arayüzünü sağladığından tek bir parça tamponu tekrar
+kullanılır ve bellek kullanımı sınırlı kalır.
+
+This module writes the output of LinearCongruentialGenerator and
+CryptographicallySecureRNG to binary files in fixed-size chunks, or into
+a pre-sized np.memmap. Both generators implement fill_into(), so one
+chunk buffer is reused and memory stays bounded.
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import time
+
+import numpy as np
+
+
+# Desteklenen çıktı biçimleri / Supported output formats
+#   uint32  : LCG için ham next() değerleri, CSPRNG için 32-bit kelimeler
+#             raw next() values for the LCG, 32-bit words for the CSPRNG
+#   float64 : [0, 1) aralığında ondalıklı sayılar / floats in [0, 1)
+#   raw     : ham byte akışı (count = byte sayısı) / raw bytes (count = bytes)
+FORMATS = {
+    "uint32": np.uint32,
+    "float64": np.float64,
+    "raw": np.uint8,
+}
+
+
+def dump_stream(
+    generator,
+    path: str,
+    count: int,
+    fmt: str = "uint32",
+    chunkSize: int = 2**20,
+    useMemmap: bool = False
+) -> dict:
+    """
+    Üreteç çıktısını ikili bir dosyaya akış halinde yazar.
+    Streams generator output into a binary file.
+
+    Varsayılan modda tek bir parça tamponu doldurulup dosyaya yazılır.
+    useMemmap=True ise dosya count öğe için önceden boyutlandırılır ve
+    üreteç doğrudan np.memmap dilimlerine yazar.
+
+    In the default mode one chunk buffer is filled and written out
+    repeatedly. With useMemmap=True the file is pre-sized for count items
+    and the generator writes straight into np.memmap slices.
+
+    Args:
+        generator: fill_into() sağlayan üreteç / Generator with fill_into()
+        path: Hedef dosya yolu / Target file path
+        count: Öğe sayısı ("raw" için byte) / Item count (bytes for "raw")
+        fmt: "uint32", "float64" veya/or "raw"
+        chunkSize: Parça başına öğe sayısı / Items per chunk
+        useMemmap: Önceden boyutlandırılmış memmap kullan / Use a pre-sized memmap
+
+    Returns:
+        dict: path, fmt, count, bytes, seconds, mb_per_second
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt} (expected one of {list(FORMATS)})")
+    if count < 0:
+        raise ValueError("count cannot be negative")
+    if chunkSize <= 0:
+        raise ValueError("chunkSize must be positive")
+
+    dtype = np.dtype(FORMATS[fmt])
+    startTime = time.perf_counter()
+
+    if useMemmap and count > 0:
+        mapped = np.memmap(path, dtype=dtype, mode="w+", shape=(count,))
+        for start in range(0, count, chunkSize):
+            generator.fill_into(mapped[start:start + chunkSize])
+        mapped.flush()
+        del mapped
+    else:
+        chunk = np.empty(min(chunkSize, count), dtype=dtype)
+        with open(path, "wb") as outputFile:
+            for start in range(0, count, chunkSize):
+                view = chunk[:min(chunkSize, count - start)]
+                generator.fill_into(view)
+                outputFile.write(memoryview(view).cast("B"))
+
+    elapsed = time.perf_counter() - startTime
+    totalBytes = count * dtype.itemsize
+    return {
+        "path": path,
+        "fmt": fmt,
+        "count": count,
+        "bytes": totalBytes,
+        "seconds": elapsed,
+        "mb_per_second": totalBytes / elapsed / 1e6 if elapsed > 0 else float("inf"),
+    }
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yerine Koymadan Örnekleme - Sampling Without Replacement
+========================================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+Bu modül, LinearCongruentialGenerator ve CryptographicallySecureRNG için
+iki örnekleme yöntemi sunar:
+
+    - sample(generator, population, k): k farklı öğe, O(k) rastgele çekim
+      (küçük k için toplu hash-küme seçimi, aksi halde Floyd algoritması)
+    - reservoir(generator, iterable, k): tek geçişli akış örneklemesi
+      (Algorithm L; atlama uzunlukları sayesinde yalnızca O(k log(n/k))
+      rastgele çekim)
+
+This module provides two sampling methods for LinearCongruentialGenerator
+and CryptographicallySecureRNG:
+
+    - sample(generator, population, k): k distinct items with O(k) random
+      draws (batched hash-set selection for small k, Floyd's algorithm
+      otherwise)
+    - reservoir(generator, iterable, k): single-pass stream sampling
+      (Algorithm L; thanks to skip lengths only O(k log(n/k)) random
+      draws)
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import math
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence
+
+
+# Akış sonu işareti / End-of-stream sentinel
+_EXHAUSTED = object()
+
+
+def _integers_range(generator) -> Optional[int]:
+    """
+    integers()'ın tek çekimde destekleyebildiği en geniş aralık
+    (None = sınırsız).
+    Widest range integers() supports in a single draw (None = unlimited).
+    """
+    return getattr(generator, "MAX_INTEGERS_RANGE", None)
+
+
+def _randbelow(generator, bound: int) -> int:
+    """
+    [0, bound) aralığında yanlılıksız tam sayı.
+    Unbiased integer in [0, bound).
+
+    integers() (high hariç) sağlayan üreteçlerde onu, aksi halde
+    next_int()'i (her iki sınır dahil) kullanır. bound, integers()'ın
+    aralığını aşarsa değer birkaç çekimin basamaklarından oluşturulur.
+    Uses integers() (exclusive high) when the generator provides it,
+    next_int() (both bounds inclusive) otherwise. When bound exceeds the
+    range of integers(), the value is composed from the digits of several
+    draws.
+    """
+    if not hasattr(generator, "integers"):
+        return generator.next_int(0, bound - 1)
+
+    base = _integers_range(generator)
+    if base is None or bound <= base:
+        return int(generator.integers(0, bound))
+
+    # base tabanında düzgün basamaklar: [0, base^k) üzerinde düzgün değer;
+    # bound'un katı olmayan üst kısım reddedilir (modüler bias yok)
+    # Uniform base-`base` digits give a uniform value on [0, base^k); the
+    # top part that is not a multiple of bound is rejected (no modulo bias)
+    digits = 1
+    while base ** digits < bound:
+        digits += 1
+    span = base ** digits
+    limit = span - span % bound
+    while True:
+        value = 0
+        for digit in generator.integers(0, base, digits).tolist():
+            value = value * base + digit
+        if value < limit:
+            return value % bound
+
+
+def _open_uniform(generator) -> float:
+    """(0, 1) aralığında düzgün sayı / Uniform number in (0, 1)."""
+    while True:
+        value = generator.next_float()
+        if value > 0.0:
+            return value
+
+
+def _floyd_indices(generator, populationSize: int, k: int) -> List[int]:
+    """
+    Floyd algoritması: k farklı indeks, tam k rastgele çekim.
+    Floyd's algorithm: k distinct indices with exactly k random draws.
+
+    Sonuç kümesi sıralı olmadığından ardından k öğelik Fisher-Yates
+    karıştırması uygulanır.
+    The resulting set is not in random order, so a k-item Fisher-Yates
+    shuffle is applied afterwards.
+    """
+    selected = set()
+    for upper in range(populationSize - k, populationSize):
+        candidate = _randbelow(generator, upper + 1)
+        selected.add(upper if candidate in selected else candidate)
+
+    indices = list(selected)
+    for i in range(len(indices) - 1, 0, -1):
+        j = _randbelow(generator, i + 1)
+        indices[i], indices[j] = indices[j], indices[i]
+    return indices
+
+
+def _hash_set_indices(generator, populationSize: int, k: int) -> List[int]:
+    """
+    Toplu hash-küme seçimi: [0, n) aralığından parti halinde indeks çekilir,
+    tekrarlar atlanır. Çekim sırası zaten rastgele sıradır.
+    Batched hash-set selection: indices are drawn from [0, n) in batches and
+    duplicates are skipped. Draw order is already a random order.
+
+    k <= n / 2 için beklenen çekim sayısı 2k'dan azdır.
+    For k <= n / 2 the expected number of draws is below 2k.
+    """
+    selected = set()
+    indices: List[int] = []
+    while len(indices) < k:
+        missing = k - len(indices)
+        for candidate in generator.integers(0, populationSize, missing + missing // 2 + 1).tolist():
+            if candidate not in selected:
+                selected.add(candidate)
+                indices.append(candidate)
+                if len(indices) == k:
+                    break
+    return indices
+
+
+def sample(generator, population: Sequence, k: int) -> list:
+    """
+    Popülasyondan k farklı öğeyi rastgele sırayla seçer (random.sample gibi).
+    Picks k distinct items from the population in random order (like
+    random.sample).
+
+    Maliyet popülasyon boyutundan bağımsız olarak O(k)'dır; popülasyon
+    kopyalanmaz ve range gibi tembel diziler de desteklenir.
+    The cost is O(k) regardless of population size; the population is
+    not copied and lazy sequences such as range are supported.
+
+    Args:
+        generator: next_int/next_float (ve isteğe bağlı integers) sağlayan üreteç
+                   Generator with next_int/next_float (and optionally integers)
+        population: len() ve indeksleme destekleyen dizi
+                    Sequence supporting len() and indexing
+        k: Seçilecek öğe sayısı / Number of items to pick
+
+    Returns:
+        list: Seçilen öğeler / Picked items
+    """
+    populationSize = len(population)
+    if not 0 <= k <= populationSize:
+        raise ValueError("Sample larger than population or is negative")
+    if k == 0:
+        return []
+
+    maxRange = _integers_range(generator)
+    if (k <= populationSize // 2 and hasattr(generator, "integers")
+            and (maxRange is None or populationSize <= maxRange)):
+        indices = _hash_set_indices(generator, populationSize, k)
+    else:
+        indices = _floyd_indices(generator, populationSize, k)
+    return [population[i] for i in indices]
+
+
+def reservoir(generator, iterable: Iterable, k: int) -> list:
+    """
+    Uzunluğu bilinmeyen bir akıştan tek geçişte k öğe seçer (Algorithm L).
+    Picks k items from a stream of unknown length in one pass (Algorithm L).
+
+    Rezervuar dolduktan sonra her adımda bir sonraki değiştirilecek
+    öğeye kadar atlanacak öğe sayısı geometrik olarak çekilir; atlanan
+    öğeler için rastgele sayı üretilmez ve akış belleğe alınmaz
+    (Li, 1994).
+
+    Once the reservoir is full, each step draws a geometric skip length up
+    to the next item to replace; no random numbers are drawn for skipped
+    items and the stream is never materialized (Li, 1994).
+
+    Args:
+        generator: next_int/next_float sağlayan üreteç
+                   Generator with next_int/next_float
+        iterable: Herhangi bir yinelenebilir / Any iterable
+        k: Rezervuar boyutu / Reservoir size
+
+    Returns:
+        list: En fazla k öğe / At most k items
+    """
+    if k < 0:
+        raise ValueError("k cannot be negative")
+    iterator = iter(iterable)
+    result = list(islice(iterator, k))
+    if len(result) < k or k == 0:
+        return result
+
+    weight = math.exp(math.log(_open_uniform(generator)) / k)
+    while True:
+        # Bir sonraki değiştirmeye kadar atlanacak öğe sayısı
+        # Number of items to skip until the next replacement
+        if weight < 1.0:
+            skip = math.floor(math.log(_open_uniform(generator)) / math.log1p(-weight))
+        else:
+            skip = 0
+        item = next(islice(iterator, skip, None), _EXHAUSTED)
+        if item is _EXHAUSTED:
+            return result
+        result[_randbelow(generator, k)] = item
+        weight *= math.exp(math.log(_open_uniform(generator)) / k)
+
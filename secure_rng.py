@@ -26,6 +26,7 @@ import time
 import hashlib
 import struct
 import threading
+import weakref
 from typing import List, Optional, Tuple
 from enum import Enum
 
@@ -59,8 +60,10 @@ class EntropyPool:
         """
         self.poolSize = poolSize
         self.pool = bytearray(poolSize)
+        self.poolView = memoryview(self.pool)  # Yerinde güncelleme için
         self.position = 0
         self.lock = threading.Lock()
+        self.metrics = None  # İsteğe bağlı RNGMetrics
         
         # İlk entropi toplama
         self._collect_initial_entropy()
@@ -92,13 +95,57 @@ class EntropyPool:
         """
         Veriyi havuza karıştırır.
         
+        Veri, havuzun mevcut konumundan başlayarak döngüsel olarak
+        XOR'lanır. Bayt bayt döngü yerine veri havuz boyutunda bloklar
+        halinde tek bir büyük tamsayıda katlanır ve havuza tek bir XOR
+        ile yerinde uygulanır; maliyet bayt başına değil blok başınadır.
+        
         Args:
             data: Karıştırılacak veri
         """
+        view = data if isinstance(data, (bytes, bytearray)) else memoryview(data).cast('B')
+        length = len(view)
+        if not length:
+            return
+        
         with self.lock:
-            for byte in data:
-                self.pool[self.position] ^= byte
-                self.position = (self.position + 1) % self.poolSize
+            size = self.poolSize
+            position = self.position
+            head = min(length, size - position)
+            
+            if length < size:
+                # Kısa veri: yalnızca etkilenen dilimleri XOR'la
+                end = position + head
+                self.pool[position:end] = (
+                    int.from_bytes(self.pool[position:end], 'big')
+                    ^ int.from_bytes(view[:head], 'big')
+                ).to_bytes(head, 'big')
+                tail = length - head
+                if tail:
+                    self.pool[:tail] = (
+                        int.from_bytes(self.pool[:tail], 'big')
+                        ^ int.from_bytes(view[head:], 'big')
+                    ).to_bytes(tail, 'big')
+                self.position = (position + length) % size
+                return
+            
+            # Baş: mevcut konumdan havuzun sonuna kadar
+            mixed = int.from_bytes(view[:head], 'big') << (8 * (size - position - head))
+            
+            # Tam bloklar havuzun başına hizalıdır
+            offset = head
+            while offset + size <= length:
+                mixed ^= int.from_bytes(view[offset:offset + size], 'big')
+                offset += size
+            
+            # Kuyruk: havuzun başından itibaren
+            tail = length - offset
+            if tail:
+                mixed ^= int.from_bytes(view[offset:], 'big') << (8 * (size - tail))
+            
+            poolValue = int.from_bytes(self.pool, 'big') ^ mixed
+            self.pool[:] = poolValue.to_bytes(size, 'big')
+            self.position = (position + length) % size
     
     def add_entropy(self, data: bytes) -> None:
         """
@@ -124,16 +171,30 @@ class EntropyPool:
         with self.lock:
             # Havuzu hash'le
             hasher = hashlib.sha256()
-            hasher.update(bytes(self.pool))
+            hasher.update(self.pool)
             hasher.update(struct.pack('q', time.time_ns()))
             digest = hasher.digest()
             
-            # Havuzu güncelle (forward secrecy)
+            # Havuzu yerinde güncelle (forward secrecy)
             newHasher = hashlib.sha256()
             newHasher.update(digest)
             newHasher.update(os.urandom(32))
-            newPool = newHasher.digest() * (self.poolSize // 32 + 1)
-            self.pool = bytearray(newPool[:self.poolSize])
+            # Özet havuzun başına yazılır ve katlanarak kopyalanır; ara
+            # nesne oluşturulmaz
+            newDigest = newHasher.digest()
+            first = min(len(newDigest), self.poolSize)
+            self.poolView[:first] = newDigest[:first]
+            filled = first
+            while filled < self.poolSize:
+                step = min(filled, self.poolSize - filled)
+                self.poolView[filled:filled + step] = self.poolView[:step]
+                filled += step
+            
+            if self.metrics is not None:
+                extraHashes = 0 if numBytes <= 32 else -(-numBytes // 32)
+                self.metrics.increment("sha256_calls", 2 + extraHashes)
+                self.metrics.increment("urandom_calls")
+                self.metrics.increment("entropy_bytes", numBytes)
             
             # İstenen miktarı döndür
             if numBytes <= 32:
@@ -159,6 +220,10 @@ class SecureLCG:
     64-bit modül ve güçlü çarpanlar kullanır.
     """
     
+    # İkili durum biçimi: sürüm, parametre indeksi, 64-bit durum
+    STATE_FORMAT = ">BBQ"
+    STATE_VERSION = 1
+    
     # Farklı LCG parametreleri (birden fazla kullanılacak)
     PARAMS = [
         # (multiplier, increment, modulus) - PCG ailesinden esinlenilmiş
@@ -175,7 +240,8 @@ class SecureLCG:
             seed: 64-bit seed değeri
             paramIndex: Kullanılacak parametre seti
         """
-        params = self.PARAMS[paramIndex % len(self.PARAMS)]
+        self.paramIndex = paramIndex % len(self.PARAMS)
+        params = self.PARAMS[self.paramIndex]
         self.multiplier = params[0]
         self.increment = params[1]
         self.modulus = params[2]
@@ -204,6 +270,418 @@ class SecureLCG:
         rot = value >> 59
         
         return ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & 0xFFFFFFFF
+    
+    def getstate(self) -> Tuple[int, int]:
+        """
+        İç durumu döndürür.
+        
+        Returns:
+            Tuple[int, int]: (parametre indeksi, durum)
+        """
+        return self.paramIndex, self.state
+    
+    def setstate(self, state: Tuple[int, int]) -> None:
+        """
+        getstate() ile alınan durumu geri yükler (warmup yapılmaz).
+        
+        Args:
+            state: (parametre indeksi, durum)
+        """
+        paramIndex, value = state
+        if not 0 <= paramIndex < len(self.PARAMS):
+            raise ValueError(f"Invalid parameter index: {paramIndex}")
+        self.paramIndex = paramIndex
+        self.multiplier, self.increment, self.modulus = self.PARAMS[paramIndex]
+        self.state = value % self.modulus
+    
+    def to_bytes(self) -> bytes:
+        """Durumu kompakt ikili biçimde serileştirir (10 byte)."""
+        return struct.pack(self.STATE_FORMAT, self.STATE_VERSION,
+                           self.paramIndex, self.state)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SecureLCG":
+        """to_bytes() çıktısından SecureLCG oluşturur."""
+        version, paramIndex, value = struct.unpack(cls.STATE_FORMAT, data)
+        if version != cls.STATE_VERSION:
+            raise ValueError(f"Unsupported state version: {version}")
+        generator = cls.__new__(cls)
+        generator.setstate((paramIndex, value))
+        return generator
+    
+    def __getstate__(self) -> Tuple[int, int]:
+        """Pickle için kompakt durum."""
+        return self.getstate()
+    
+    def __setstate__(self, state: Tuple[int, int]) -> None:
+        """Pickle durumundan geri yükler."""
+        self.setstate(state)
+
+
+class LatencyHistogram:
+    """
+    Nanosaniye değerleri için logaritmik histogram.
+    
+    Her ikinin kuvveti aralığı 4 kovaya bölünür (~%25 çözünürlük);
+    8 ns altındaki değerler tam tutulur. Bellek kullanımı sabittir.
+    """
+    
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+    
+    @staticmethod
+    def _bucket(value: int) -> int:
+        """Değerin kova indeksi."""
+        if value < 8:
+            return max(value, 0)
+        bits = value.bit_length()
+        return bits * 4 + ((value >> (bits - 3)) & 3)
+    
+    @staticmethod
+    def _upper_bound(index: int) -> int:
+        """Kovanın (hariç) üst sınırı."""
+        if index < 8:
+            return index + 1
+        bits, mantissa = divmod(index, 4)
+        return (5 + mantissa) << (bits - 3)
+    
+    def record(self, value: int) -> None:
+        """Bir ölçüm ekler."""
+        index = self._bucket(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+    
+    def percentile(self, fraction: float) -> int:
+        """Yüzdelik değerin üst sınır tahmini (ns)."""
+        if not self.count:
+            return 0
+        target = fraction * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.maximum)
+        return self.maximum
+    
+    def snapshot(self) -> dict:
+        """Özet istatistikler."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum or 0,
+            "max": self.maximum or 0,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+        }
+
+
+class RNGMetrics:
+    """
+    CSPRNG için isteğe bağlı çalışma zamanı metrikleri.
+    
+    Sayaçlar:
+        calls, bytes_produced, sha256_calls, xof_calls, reseeds,
+        urandom_calls, entropy_bytes, hook_errors
+    Histogramlar (ns):
+        latency_ns, lock_wait_ns, lock_hold_ns
+    
+    Kanca (hook) verilirse her next_bytes / fill_into çağrısından sonra,
+    kilit bırakıldıktan sonra hook("call", veri) olarak çağrılır. Kanca
+    hataları yutulur ve hook_errors sayacına eklenir.
+    
+    EntropyPool oluşturulurken yapılan ilk entropi toplama (os.urandom
+    dahil) metrikler açılmadan önce gerçekleştiği için sayılmaz; fork()
+    sonrası yeniden oluşturulan havuz için de aynısı geçerlidir. Sonraki
+    tüm havuz çekimleri ve yeniden tohumlamalar sayılır.
+    
+    Halka tamponundan karşılanan çağrılar "next_bytes_ring" işlemi olarak
+    sayılır; üretimleri arka plan doldurmasında ayrıca ölçülmez.
+    """
+    
+    COUNTERS = ("calls", "bytes_produced", "sha256_calls", "xof_calls", "reseeds",
+                "urandom_calls", "entropy_bytes", "hook_errors")
+    HISTOGRAMS = ("latency_ns", "lock_wait_ns", "lock_hold_ns")
+    
+    def __init__(self, hook=None):
+        """
+        Args:
+            hook: İsteğe bağlı geri çağırım, hook(olay, veri)
+        """
+        self.hook = hook
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Tüm sayaçları ve histogramları sıfırlar."""
+        with self.lock:
+            self.counters = dict.fromkeys(self.COUNTERS, 0)
+            self.histograms = {name: LatencyHistogram() for name in self.HISTOGRAMS}
+            self.operations = {}
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Bir sayacı artırır."""
+        with self.lock:
+            self.counters[name] += amount
+    
+    def record_call(self, operation: str, numBytes: int, waitNs: int,
+                    holdNs: int, latencyNs: int, reseeds: int) -> None:
+        """
+        Bir API çağrısını kaydeder ve kancayı çağırır.
+        
+        Args:
+            operation: Çağrı adı (ör. "next_bytes")
+            numBytes: Üretilen byte sayısı
+            waitNs: Kilit bekleme süresi
+            holdNs: Kilit tutma süresi
+            latencyNs: Toplam çağrı süresi
+            reseeds: Çağrı sırasında yapılan yeniden tohumlama sayısı
+        """
+        with self.lock:
+            self.counters["calls"] += 1
+            self.counters["bytes_produced"] += numBytes
+            self.operations[operation] = self.operations.get(operation, 0) + 1
+            self.histograms["latency_ns"].record(latencyNs)
+            self.histograms["lock_wait_ns"].record(waitNs)
+            self.histograms["lock_hold_ns"].record(holdNs)
+        
+        if self.hook is not None:
+            try:
+                self.hook("call", {
+                    "operation": operation,
+                    "bytes": numBytes,
+                    "latency_ns": latencyNs,
+                    "lock_wait_ns": waitNs,
+                    "lock_hold_ns": holdNs,
+                    "reseeds": reseeds,
+                })
+            except Exception:
+                self.increment("hook_errors")
+    
+    def snapshot(self) -> dict:
+        """Metriklerin tutarlı bir kopyası."""
+        with self.lock:
+            return {
+                "enabled": True,
+                "counters": dict(self.counters),
+                "operations": dict(self.operations),
+                "histograms": {name: histogram.snapshot()
+                               for name, histogram in self.histograms.items()},
+            }
+
+
+class BulkDRBG:
+    """
+    Toplu üretim için SHAKE-256 tabanlı DRBG (hızlı anahtar silme).
+    
+    Her istek için tek bir XOF çağrısı yapılır:
+    
+        akış = SHAKE-256(anahtar || sayaç)[0 : n + 32]
+        çıktı = akış[0 : n],  yeni anahtar = akış[n : n + 32]
+    
+    Anahtar her istekte üzerine yazıldığından iç durum ele geçirilse bile
+    önceki çıktılar hesaplanamaz (geriye dönük güvenlik). Anahtar,
+    RESEED_BYTES byte veya RESEED_SECONDS saniye sonra entropi havuzu ve
+    os.urandom ile yeniden tohumlanır. Çok büyük istekler CHUNK_SIZE
+    byte'lık parçalara bölünür ve her parçada anahtar yenilenir.
+    """
+    
+    RESEED_BYTES = 2**24
+    RESEED_SECONDS = 30.0
+    CHUNK_SIZE = 2**20
+    KEY_SIZE = 32
+    
+    def __init__(self, entropyPool: EntropyPool, metrics: Optional[RNGMetrics] = None):
+        """
+        Args:
+            entropyPool: Yeniden tohumlama için entropi havuzu
+            metrics: İsteğe bağlı RNGMetrics (ilk tohumlama da sayılır)
+        """
+        self.entropyPool = entropyPool
+        self.metrics = metrics
+        self.key = bytes(self.KEY_SIZE)
+        self.reseed()
+    
+    def reseed(self) -> None:
+        """Anahtarı taze entropiyle yeniler."""
+        hasher = hashlib.sha256()
+        hasher.update(self.key)
+        hasher.update(self.entropyPool.get_entropy(32))
+        hasher.update(os.urandom(32))
+        self.key = hasher.digest()
+        self.counter = 0
+        self.bytesSinceReseed = 0
+        self.reseedTime = time.monotonic()
+        if self.metrics is not None:
+            self.metrics.increment("sha256_calls")
+            self.metrics.increment("urandom_calls")
+            self.metrics.increment("reseeds")
+    
+    def _reseed_if_needed(self) -> None:
+        if (self.bytesSinceReseed >= self.RESEED_BYTES
+                or time.monotonic() - self.reseedTime >= self.RESEED_SECONDS):
+            self.reseed()
+    
+    def fill(self, view: memoryview) -> None:
+        """
+        Byte görünümünü doldurur (çağıran kilidi tutmalıdır).
+        
+        Args:
+            view: Hedef byte görünümü
+        """
+        numBytes = len(view)
+        position = 0
+        while position < numBytes:
+            self._reseed_if_needed()
+            take = min(self.CHUNK_SIZE, numBytes - position)
+            self.counter += 1
+            stream = hashlib.shake_256(
+                self.key + self.counter.to_bytes(16, 'big')
+            ).digest(take + self.KEY_SIZE)
+            self.key = stream[take:]
+            view[position:position + take] = memoryview(stream)[:take]
+            position += take
+            self.bytesSinceReseed += take
+            if self.metrics is not None:
+                self.metrics.increment("xof_calls")
+
+
+class RandomRingBuffer:
+    """
+    Arka planda doldurulan rastgele byte halka tamponu.
+    
+    Bir arka plan iş parçacığı tamponu üretecin çıktısıyla dolu tutar;
+    küçük istekler kısa bir kritik bölgede tampondan dilimlenerek
+    karşılanır. Verilen bölgeler hemen sıfırlanır (forward secrecy):
+    tamponda yalnızca henüz kimseye verilmemiş byte'lar bulunur.
+    
+    Doldurma REFILL_STEP byte'lık adımlarla yapılır ve her adımdan sonra
+    GIL bırakılır; böylece arka plan iş parçacığı çağıranları uzun süre
+    bekletmez.
+    """
+    
+    REFILL_STEP = 1024
+    
+    def __init__(self, fill, capacity: int = 65536, lowWater: Optional[int] = None,
+                 maxRequest: int = 256):
+        """
+        Args:
+            fill: Bir memoryview'i dolduran fonksiyon (kendi kilidini alır)
+            capacity: Tampon boyutu (byte)
+            lowWater: Bu seviyenin altında doldurma başlar (varsayılan capacity/2)
+            maxRequest: Tampondan karşılanacak en büyük istek (byte)
+        """
+        if capacity < self.REFILL_STEP:
+            raise ValueError(f"capacity must be at least {self.REFILL_STEP}")
+        self.fill = fill
+        self.capacity = capacity
+        self.maxRequest = maxRequest
+        self.lowWater = capacity // 2 if lowWater is None else lowWater
+        self.buffer = bytearray(capacity)
+        self.readPosition = 0
+        self.available = 0
+        self.running = True
+        self.condition = threading.Condition(threading.Lock())
+        self.thread = threading.Thread(target=self._run, name="csprng-ring", daemon=True)
+        self.thread.start()
+    
+    def _run(self) -> None:
+        """Arka plan doldurma döngüsü."""
+        scratch = bytearray(self.REFILL_STEP)
+        scratchView = memoryview(scratch)
+        try:
+            while True:
+                with self.condition:
+                    while self.running and self.available >= self.lowWater:
+                        self.condition.wait()
+                    if not self.running:
+                        return
+                
+                # Tampon dolana kadar adım adım doldur
+                while True:
+                    with self.condition:
+                        free = self.capacity - self.available
+                    if not self.running or free == 0:
+                        break
+                    take = min(self.REFILL_STEP, free)
+                    self.fill(scratchView[:take])
+                    with self.condition:
+                        if not self.running:
+                            return
+                        self._write(scratchView[:take])
+                    scratch[:take] = bytes(take)
+                    time.sleep(0)
+        except ReferenceError:
+            # Sahip üreteç çöp toplandı
+            return
+        finally:
+            scratch[:] = bytes(len(scratch))
+    
+    def _write(self, data: memoryview) -> None:
+        """Veriyi yazma konumuna kopyalar (koşul kilidi tutulurken)."""
+        size = len(data)
+        start = (self.readPosition + self.available) % self.capacity
+        first = min(size, self.capacity - start)
+        self.buffer[start:start + first] = data[:first]
+        if first < size:
+            self.buffer[:size - first] = data[first:]
+        self.available += size
+    
+    def take(self, numBytes: int) -> Optional[bytes]:
+        """
+        Tampondan numBytes byte alır ve o bölgeyi sıfırlar.
+        
+        Args:
+            numBytes: İstenen byte sayısı
+        
+        Returns:
+            bytes veya tamponda yeterli veri yoksa None
+        """
+        with self.condition:
+            if self.available < numBytes:
+                self.condition.notify()
+                return None
+            start = self.readPosition
+            end = start + numBytes
+            if end <= self.capacity:
+                data = bytes(self.buffer[start:end])
+                self.buffer[start:end] = bytes(numBytes)
+            else:
+                end -= self.capacity
+                data = bytes(self.buffer[start:]) + bytes(self.buffer[:end])
+                self.buffer[start:] = bytes(self.capacity - start)
+                self.buffer[:end] = bytes(end)
+            self.readPosition = end % self.capacity
+            self.available -= numBytes
+            if self.available < self.lowWater:
+                self.condition.notify()
+        return data
+    
+    def close(self, join: bool = True) -> None:
+        """
+        Arka plan iş parçacığını durdurur ve tamponu sıfırlar.
+        
+        Args:
+            join: İş parçacığının bitmesini bekle
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if join and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join()
+        with self.condition:
+            self.buffer[:] = bytes(self.capacity)
+            self.available = 0
 
 
 class CryptographicallySecureRNG:
@@ -224,20 +702,128 @@ class CryptographicallySecureRNG:
     # Kaç çıktıdan sonra yeniden tohumlanacak
     RESEED_INTERVAL = 1000
     
-    def __init__(self, language: Language = Language.TURKISH):
+    # Bu boyuttan itibaren permütasyonlar rastgele anahtar sıralamasıyla üretilir
+    PERMUTATION_SORT_THRESHOLD = 2**16
+    
+    def __init__(self, language: Language = Language.TURKISH, bulk: bool = False):
         """
         CSPRNG'yi başlatır.
         
         Args:
             language: Çıktı dili
+            bulk: True ise byte üretimi BulkDRBG ile yapılır (yüzlerce MB/s);
+                  False ise 32 byte başına LCG + SHA-256 hattı kullanılır
         """
         self.language = language
         self.entropyPool = EntropyPool()
         self.outputCounter = 0
         self.lock = threading.Lock()
+        self._asyncBuffer = None  # anext_bytes için ön-getirme tamponu
+        self._metrics = None      # enable_metrics() ile açılır
+        self.drbg = BulkDRBG(self.entropyPool) if bulk else None
+        self._ring = None         # enable_prefetch() ile açılır
+        self._ringFinalizer = None
         
         # Birden fazla LCG oluştur (farklı parametrelerle)
         self._initialize_generators()
+        
+        # fork() sonrası çocuk süreçte yeniden tohumlanacak örnekler
+        _liveInstances.add(self)
+    
+    def __getstate__(self) -> dict:
+        """
+        Pickle durumu: yalnızca yapılandırma serileştirilir.
+        
+        İç durum (entropi havuzu, LCG durumları) bilerek dışarıda
+        bırakılır; aksi halde kopyalar aynı çıktı akışını paylaşırdı.
+        """
+        return {"language": self.language, "bulk": self.drbg is not None}
+    
+    def __setstate__(self, state: dict) -> None:
+        """
+        Pickle'dan açılırken taze entropiyle yeniden tohumlar.
+        
+        Böylece CSPRNG işçi işlemlerine gönderilebilir ve her kopya
+        bağımsız bir akış üretir.
+        """
+        self.__init__(language=state["language"], bulk=state.get("bulk", False))
+    
+    def set_bulk_mode(self, enabled: bool) -> None:
+        """
+        Toplu DRBG modunu açar veya kapatır.
+        
+        Args:
+            enabled: True ise next_bytes ve fill_into BulkDRBG kullanır
+        """
+        with self.lock:
+            if enabled and self.drbg is None:
+                self.drbg = BulkDRBG(self.entropyPool, self._metrics)
+            elif not enabled:
+                self.drbg = None
+    
+    def enable_prefetch(self, capacity: int = 65536, maxRequest: int = 256) -> None:
+        """
+        Küçük istekler için arka planda doldurulan halka tamponunu açar.
+        
+        maxRequest byte'a kadar olan next_bytes çağrıları (dolayısıyla
+        next, next_float, next_int, ...) tampondan kısa bir kritik bölgede
+        karşılanır; tampon boşsa normal yola düşülür.
+        
+        Args:
+            capacity: Tampon boyutu (byte)
+            maxRequest: Tampondan karşılanacak en büyük istek (byte)
+        """
+        self.disable_prefetch()
+        owner = weakref.proxy(self)
+        
+        def fill(view: memoryview) -> None:
+            with owner.lock:
+                owner._fill_locked(view)
+        
+        self._ring = RandomRingBuffer(fill, capacity, maxRequest=maxRequest)
+        # Üreteç çöp toplanırsa iş parçacığını durdur
+        self._ringFinalizer = weakref.finalize(self, self._ring.close, False)
+    
+    def disable_prefetch(self) -> None:
+        """Halka tamponunu kapatır ve içeriğini sıfırlar."""
+        ring, self._ring = self._ring, None
+        finalizer, self._ringFinalizer = self._ringFinalizer, None
+        if finalizer is not None:
+            finalizer.detach()
+        if ring is not None:
+            ring.close()
+    
+    def _reseed_after_fork(self) -> None:
+        """
+        fork() sonrası çocuk süreçte tüm iç durumu yeniler.
+        
+        Ebeveynle aynı akışı üretmemek için entropi havuzu, LCG'ler ve
+        DRBG taze entropiyle yeniden kurulur. fork anında başka bir
+        iş parçacığının tuttuğu kilitler çocukta hiç bırakılmayacağından
+        kilitler de yeniden oluşturulur.
+        """
+        self.lock = threading.Lock()
+        self.entropyPool = EntropyPool()
+        self.entropyPool.metrics = self._metrics
+        if self._metrics is not None:
+            self._metrics.lock = threading.Lock()
+        if self.drbg is not None:
+            self.drbg = BulkDRBG(self.entropyPool, self._metrics)
+        self._asyncBuffer = None
+        self.outputCounter = 0
+        self._initialize_generators()
+        
+        # Ebeveynin tamponundaki byte'lar asla kullanılmaz; doldurma
+        # iş parçacığı çocukta yoktur, yeni bir tampon başlatılır. Ebeveynin
+        # sonlandırıcısı ayrılır: çıkışta ring.close(), fork anında tutulmuş
+        # olabilecek koşul kilidinde takılırdı
+        ring = self._ring
+        if ring is not None:
+            self._ringFinalizer.detach()
+            self._ringFinalizer = None
+            ring.buffer[:] = bytes(len(ring.buffer))
+            self._ring = None
+            self.enable_prefetch(ring.capacity, ring.maxRequest)
     
     def _initialize_generators(self) -> None:
         """Jeneratörleri başlatır / Initializes generators."""
@@ -262,6 +848,8 @@ class CryptographicallySecureRNG:
             # Yeni entropi al ve jeneratörleri yeniden başlat
             self._initialize_generators()
             self.outputCounter = 0
+            if self._metrics is not None:
+                self._metrics.increment("reseeds")
     
     def _combine_generators(self) -> int:
         """
@@ -299,6 +887,8 @@ class CryptographicallySecureRNG:
         hasher.update(struct.pack('Q', value))
         hasher.update(struct.pack('q', time.time_ns()))
         hasher.update(self.entropyPool.get_entropy(16))
+        if self._metrics is not None:
+            self._metrics.increment("sha256_calls")
         return hasher.digest()
     
     def next_bytes(self, numBytes: int) -> bytes:
@@ -311,20 +901,227 @@ class CryptographicallySecureRNG:
         Returns:
             bytes: Rastgele byte dizisi
         """
-        with self.lock:
-            self._reseed_if_needed()
-            
-            result = bytearray()
-            while len(result) < numBytes:
-                combined = self._combine_generators()
-                hashOutput = self._hash_with_entropy(combined)
-                result.extend(hashOutput)
-                self.outputCounter += 1
-            
-            # Kullanılan çıktıyı entropiye geri besle
-            self.entropyPool.add_entropy(bytes(result[:8]))
+        ring = self._ring
+        if ring is not None and numBytes <= ring.maxRequest:
+            metrics = self._metrics
+            if metrics is None:
+                data = ring.take(numBytes)
+            else:
+                start = time.perf_counter_ns()
+                data = ring.take(numBytes)
+                if data is not None:
+                    # Üretecin kilidi alınmaz; kilit süreleri sıfırdır
+                    metrics.record_call("next_bytes_ring", numBytes, 0, 0,
+                                        time.perf_counter_ns() - start, 0)
+            if data is not None:
+                return data
+        
+        result = bytearray(numBytes)
+        if self._metrics is None:
+            with self.lock:
+                self._fill_locked(memoryview(result))
+        else:
+            self._fill_instrumented(memoryview(result), "next_bytes")
+        return bytes(result)
+    
+    def fill_into(self, buffer) -> int:
+        """
+        Yazılabilir bir tamponu doğrudan güvenli rastgele byte'larla doldurur.
+        
+        bytearray, memoryview, NumPy dizisi, mmap veya
+        multiprocessing.shared_memory tamponları desteklenir; çıktı ara
+        bytes nesnesi oluşturulmadan yerinde yazılır, böylece büyük
+        tüketiciler tek bir tamponu tekrar tekrar kullanabilir.
+        
+        float64 NumPy dizileri, LinearCongruentialGenerator.fill_into ile
+        aynı şekilde [0, 1) aralığında 53-bit ondalıklı sayılarla doldurulur.
+        
+        Args:
+            buffer: Yazılabilir, bitişik tampon
+        
+        Returns:
+            int: Yazılan byte sayısı
+        """
+        view = memoryview(buffer).cast('B')
+        if view.readonly:
+            raise TypeError("buffer must be writable")
+        
+        if self._metrics is None:
+            with self.lock:
+                self._fill_locked(view)
+        else:
+            self._fill_instrumented(view, "fill_into")
+        
+        dtype = getattr(buffer, "dtype", None)
+        if dtype is not None and dtype.kind == 'f' and dtype.itemsize == 8:
+            import numpy as np
             
-            return bytes(result[:numBytes])
+            # Rastgele 64-bit kelimeleri yerinde 53-bit float'a çevir
+            bits = np.frombuffer(view, dtype=np.uint64)
+            np.right_shift(bits, np.uint64(11), out=bits)
+            np.multiply(bits, 2.0**-53, out=np.frombuffer(view, dtype=np.float64),
+                        casting='unsafe')
+        return len(view)
+    
+    def dump(self, path: str, count: int, fmt: str = "uint32",
+             chunkSize: int = 2**20, useMemmap: bool = False) -> dict:
+        """
+        Üretilen çıktıyı parça parça ikili bir dosyaya yazar.
+        
+        Ayrıntılar için rng_io.dump_stream'e bakınız.
+        
+        Args:
+            path: Hedef dosya yolu
+            count: Öğe sayısı ("raw" için byte sayısı)
+            fmt: "uint32", "float64" veya "raw"
+            chunkSize: Parça başına öğe sayısı
+            useMemmap: True ise önceden boyutlandırılmış np.memmap kullanılır
+        
+        Returns:
+            dict: Yazılan byte, süre ve MB/s bilgisi
+        """
+        from rng_io import dump_stream
+        
+        return dump_stream(self, path, count, fmt, chunkSize, useMemmap)
+    
+    def astream(self, chunkSize: int = 65536, chunks: Optional[int] = None,
+                prefetch: int = 2):
+        """
+        Asenkron byte akışı: async for chunk in rng.astream(65536).
+        
+        SHA-256 hattı olay döngüsünü bloklamaz; parçalar arka planda bir
+        yürütücüde üretilir ve en fazla `prefetch` parça tüketiciden önde
+        hazırlanır.
+        
+        Args:
+            chunkSize: Parça başına byte sayısı
+            chunks: Toplam parça sayısı (None = sonsuz)
+            prefetch: Önde hazırlanacak parça sayısı
+        
+        Returns:
+            AsyncIterator[bytes]: Rastgele byte parçaları
+        """
+        from async_rng import prefetch_stream
+        
+        if chunkSize <= 0:
+            raise ValueError("chunkSize must be positive")
+        return prefetch_stream(lambda index: self.next_bytes(chunkSize), chunks, prefetch)
+    
+    async def anext_bytes(self, numBytes: int) -> bytes:
+        """
+        next_bytes'ın asenkron karşılığı: await rng.anext_bytes(32).
+        
+        Küçük istekler arka planda doldurulan bir tampondan hemen
+        karşılanır; tampon yarıya inince yürütücüde yeniden doldurulur.
+        Verilen byte'lar tampondan silinir.
+        
+        Args:
+            numBytes: Üretilecek byte sayısı
+        
+        Returns:
+            bytes: Rastgele byte dizisi
+        """
+        from async_rng import AsyncPrefetchBuffer
+        
+        if numBytes < 0:
+            raise ValueError("numBytes cannot be negative")
+        if self._asyncBuffer is None:
+            self._asyncBuffer = AsyncPrefetchBuffer(self.next_bytes)
+        return await self._asyncBuffer.read(numBytes)
+    
+    def enable_metrics(self, hook=None) -> RNGMetrics:
+        """
+        Çalışma zamanı metriklerini açar.
+        
+        Kapalıyken her çağrı yalnızca tek bir None kontrolü öder.
+        
+        Args:
+            hook: İsteğe bağlı geri çağırım, hook("call", veri sözlüğü)
+        
+        Returns:
+            RNGMetrics: Metrik nesnesi
+        """
+        metrics = RNGMetrics(hook)
+        with self.lock:
+            self._metrics = metrics
+            self.entropyPool.metrics = metrics
+            if self.drbg is not None:
+                self.drbg.metrics = metrics
+        return metrics
+    
+    def disable_metrics(self) -> None:
+        """Metrikleri kapatır."""
+        with self.lock:
+            self._metrics = None
+            self.entropyPool.metrics = None
+            if self.drbg is not None:
+                self.drbg.metrics = None
+    
+    def metrics(self, reset: bool = False) -> dict:
+        """
+        Metriklerin anlık görüntüsünü döndürür.
+        
+        Args:
+            reset: True ise görüntü alındıktan sonra sayaçlar sıfırlanır
+        
+        Returns:
+            dict: enabled, counters, operations, histograms
+        """
+        metrics = self._metrics
+        if metrics is None:
+            return {"enabled": False}
+        snapshot = metrics.snapshot()
+        if reset:
+            metrics.reset()
+        return snapshot
+    
+    def _fill_instrumented(self, view: memoryview, operation: str) -> None:
+        """
+        _fill_locked'ı kilit bekleme/tutma süreleriyle birlikte ölçer.
+        
+        Args:
+            view: Hedef byte görünümü
+            operation: Metriklerde kullanılacak çağrı adı
+        """
+        metrics = self._metrics
+        clock = time.perf_counter_ns
+        start = clock()
+        with self.lock:
+            acquired = clock()
+            reseedsBefore = metrics.counters["reseeds"]
+            self._fill_locked(view)
+            reseeds = metrics.counters["reseeds"] - reseedsBefore
+            released = clock()
+        metrics.record_call(operation, len(view), acquired - start,
+                            released - acquired, released - start, reseeds)
+    
+    def _fill_locked(self, view: memoryview) -> None:
+        """
+        Tamponu 32 byte'lık hash çıktılarıyla doldurur (kilit tutulurken).
+        
+        Toplu modda tüm istek tek bir BulkDRBG çağrısıyla doldurulur.
+        
+        Args:
+            view: Hedef byte görünümü
+        """
+        if self.drbg is not None:
+            self.drbg.fill(view)
+            return
+        
+        self._reseed_if_needed()
+        
+        numBytes = len(view)
+        position = 0
+        while position < numBytes:
+            combined = self._combine_generators()
+            hashOutput = self._hash_with_entropy(combined)
+            take = min(len(hashOutput), numBytes - position)
+            view[position:position + take] = hashOutput[:take]
+            position += take
+            self.outputCounter += 1
+        
+        # Kullanılan çıktıyı entropiye geri besle
+        self.entropyPool.add_entropy(bytes(view[:8]))
     
     def next(self) -> int:
         """
@@ -374,6 +1171,155 @@ class CryptographicallySecureRNG:
         value = int.from_bytes(randomBytes, 'big') >> 3  # 53 bit
         return value / (2**53)
     
+    def random_floats(self, count: int):
+        """
+        [0.0, 1.0) aralığında toplu ondalıklı sayı üretir.
+        
+        8 * count byte tek bir kilitli istekle çekilir ve tek bir vektörel
+        NumPy geçişiyle 53-bit float'a çevrilir; next_float'taki çağrı
+        başına kilit ve hash maliyeti ödenmez.
+        
+        Args:
+            count: Üretilecek sayı adedi
+        
+        Returns:
+            np.ndarray: float64 dizisi
+        """
+        import numpy as np
+        
+        if count < 0:
+            raise ValueError("count cannot be negative")
+        return self.random_floats_into(np.empty(count, dtype=np.float64))
+    
+    def random_floats_into(self, out):
+        """
+        Var olan bir float64 tamponunu [0.0, 1.0) değerleriyle yerinde doldurur.
+        
+        Args:
+            out: Yazılabilir, bitişik float64 NumPy dizisi veya 'd'
+                 biçimli tampon (ör. memoryview, array.array('d'))
+        
+        Returns:
+            np.ndarray: out üzerindeki float64 görünümü
+        """
+        import numpy as np
+        
+        values = np.asarray(out)
+        if values.dtype != np.float64:
+            raise ValueError("out must hold float64 values")
+        if not values.flags.c_contiguous or not values.flags.writeable:
+            raise ValueError("out must be a writable C-contiguous buffer")
+        if values.size:
+            self.fill_into(values)
+        return values
+    
+    def integers(self, low: int, high: int, size: Optional[int] = None):
+        """
+        [low, high) aralığında modüler bias içermeyen tam sayılar üretir (toplu).
+        
+        Her değer için aralığı kapsayan en küçük bit sayısı kadar rastgele
+        bit alınır (uint8/16/32/64 kelimelerinin üst bitleri) ve aralık
+        dışında kalanlar vektörel olarak reddedilir; kabul olasılığı her
+        zaman %50'nin üzerindedir. Yalnızca reddedilen konumlar tek bir
+        toplu istekle yeniden doldurulur. 64 bitten geniş aralıklar byte
+        dizilerinden Python tamsayılarına çevrilerek aynı yöntemle üretilir.
+        
+        LinearCongruentialGenerator.integers ile aynı imzaya sahiptir.
+        
+        Args:
+            low: Alt sınır (dahil)
+            high: Üst sınır (hariç)
+            size: Dizi boyutu. None ise tek bir int döndürülür.
+        
+        Returns:
+            int | np.ndarray: int64, uint64 veya (geniş aralıklarda) object dizisi
+        """
+        rangeSize = high - low
+        if rangeSize <= 0:
+            raise ValueError("high must be greater than low")
+        if size is not None and size < 0:
+            raise ValueError("size cannot be negative")
+        
+        bits = (rangeSize - 1).bit_length()
+        numBytes = (bits + 7) // 8
+        excess = 8 * numBytes - bits
+        
+        if size is None:
+            if rangeSize == 1:
+                return low
+            while True:
+                value = int.from_bytes(self.next_bytes(numBytes), 'big') >> excess
+                if value < rangeSize:
+                    return low + value
+        
+        import numpy as np
+        
+        if low >= -2**63 and high <= 2**63:
+            dtype = np.int64
+        elif low >= 0 and high <= 2**64:
+            dtype = np.uint64
+        else:
+            dtype = object
+        
+        if rangeSize == 1:
+            return np.full(size, low, dtype=dtype)
+        
+        if numBytes > 8:
+            return self._wide_integers(low, rangeSize, size, numBytes, excess)
+        
+        # Aralığı kapsayan en dar kelime tipi ve atılacak alt bitler
+        wordBytes = 1 << max(numBytes - 1, 0).bit_length()
+        wordType = np.dtype(f">u{wordBytes}")
+        shift = 8 * wordBytes - bits
+        limit = wordType.type(rangeSize - 1)
+        
+        values = np.empty(size, dtype=np.uint64)
+        pending = np.arange(size)
+        while len(pending):
+            words = np.frombuffer(self.next_bytes(len(pending) * wordBytes), dtype=wordType)
+            if shift:
+                words = words >> wordType.type(shift)
+            accepted = words <= limit
+            values[pending[accepted]] = words[accepted]
+            pending = pending[~accepted]
+        
+        if dtype is object:
+            return np.array([low + value for value in values.tolist()], dtype=object)
+        result = values.astype(dtype)
+        result += dtype(low)
+        return result
+    
+    def _wide_integers(self, low: int, rangeSize: int, size: int,
+                       numBytes: int, excess: int):
+        """
+        64 bitten geniş aralıklar için integers yardımcısı.
+        
+        Args:
+            low: Alt sınır (dahil)
+            rangeSize: Aralık genişliği
+            size: Dizi boyutu
+            numBytes: Değer başına byte sayısı
+            excess: Değer başına atılacak alt bit sayısı
+        
+        Returns:
+            np.ndarray: Python tamsayılarından oluşan object dizisi
+        """
+        import numpy as np
+        
+        result = np.empty(size, dtype=object)
+        pending = list(range(size))
+        while pending:
+            data = self.next_bytes(len(pending) * numBytes)
+            rejected = []
+            for slot, offset in zip(pending, range(0, len(data), numBytes)):
+                value = int.from_bytes(data[offset:offset + numBytes], 'big') >> excess
+                if value < rangeSize:
+                    result[slot] = low + value
+                else:
+                    rejected.append(slot)
+            pending = rejected
+        return result
+    
     def shuffle(self, sequence: list) -> None:
         """
         Listeyi yerinde karıştırır (Fisher-Yates).
@@ -381,23 +1327,197 @@ class CryptographicallySecureRNG:
         Args:
             sequence: Karıştırılacak liste
         """
-        for i in range(len(sequence) - 1, 0, -1):
-            j = self.next_int(0, i)
+        swaps = self._swap_indices(len(sequence)).tolist()
+        for i, j in zip(range(len(sequence) - 1, 0, -1), swaps):
             sequence[i], sequence[j] = sequence[j], sequence[i]
     
-    def choice(self, sequence: list):
+    def _swap_indices(self, count: int):
+        """
+        Fisher-Yates için tüm takas indekslerini tek bir toplu istekle üretir.
+        
+        i = count-1, ..., 1 adımı için j, [0, i] aralığında düzgün
+        dağılımlıdır. Her kelime i'yi kapsayan en küçük bit maskesiyle
+        kırpılır ve i'den büyük olanlar vektörel olarak reddedilir;
+        yalnızca reddedilen konumlar yeniden çekilir (modüler bias yok).
+        
+        Args:
+            count: Karıştırılacak öğe sayısı
+        
+        Returns:
+            np.ndarray: count - 1 uzunluğunda takas indeksleri
+        """
+        import numpy as np
+        
+        wordType = np.dtype(">u4") if count <= 2**32 else np.dtype(">u8")
+        bounds = np.arange(count - 1, 0, -1, dtype=np.uint64)
+        # Her sınırın bit uzunluğu (bounds < 2^53 için frexp kesindir)
+        bitLengths = np.frexp(bounds.astype(np.float64))[1].astype(np.uint64)
+        masks = (np.uint64(1) << bitLengths) - np.uint64(1)
+        
+        swaps = np.empty(len(bounds), dtype=np.uint64)
+        pending = np.arange(len(bounds))
+        while len(pending):
+            words = np.frombuffer(self.next_bytes(len(pending) * wordType.itemsize),
+                                  dtype=wordType).astype(np.uint64)
+            words &= masks[pending]
+            accepted = words <= bounds[pending]
+            swaps[pending[accepted]] = words[accepted]
+            pending = pending[~accepted]
+        return swaps.astype(np.int64)
+    
+    def _permutation_indices(self, count: int):
+        """
+        [0, count) için rastgele bir permütasyon dizisi üretir.
+        
+        Küçük count için takas indeksleri toplu çekilip Fisher-Yates
+        uygulanır. PERMUTATION_SORT_THRESHOLD üzerinde rastgele 64-bit
+        anahtarlara göre sıralama (argsort) daha hızlıdır; anahtarlarda
+        çakışma olursa (olasılık ~count^2 / 2^65) tümü yeniden çekilir.
+        
+        Args:
+            count: Öğe sayısı
+        
+        Returns:
+            np.ndarray: int64 permütasyon dizisi
+        """
+        import numpy as np
+        
+        if count < self.PERMUTATION_SORT_THRESHOLD:
+            permutation = list(range(count))
+            swaps = self._swap_indices(count).tolist()
+            for i, j in zip(range(count - 1, 0, -1), swaps):
+                permutation[i], permutation[j] = permutation[j], permutation[i]
+            return np.array(permutation, dtype=np.int64)
+        
+        keys = np.empty(count, dtype=np.uint64)
+        while True:
+            self.fill_into(keys)
+            order = np.argsort(keys)
+            sortedKeys = keys[order]
+            if not np.any(sortedKeys[1:] == sortedKeys[:-1]):
+                return order.astype(np.int64, copy=False)
+    
+    def permutation(self, values):
+        """
+        Rastgele permütasyon üretir (numpy.random.permutation gibi).
+        
+        Args:
+            values: int ise [0, values) permütasyonu; dizi ise karıştırılmış
+                    bir kopyası döndürülür (ilk eksen boyunca)
+        
+        Returns:
+            np.ndarray: Karıştırılmış dizi
+        """
+        import numpy as np
+        
+        if isinstance(values, (int, np.integer)):
+            if values < 0:
+                raise ValueError("values cannot be negative")
+            return self._permutation_indices(int(values))
+        
+        result = np.array(values)
+        self.shuffle_array(result)
+        return result
+    
+    def shuffle_array(self, array) -> None:
+        """
+        NumPy dizisini veya yazılabilir tamponu (memoryview, array.array,
+        bytearray) ilk eksen boyunca yerinde karıştırır.
+        
+        Tüm takas indeksleri tek bir toplu istekle çekilir ve permütasyon
+        tek bir vektörel indeksleme ile uygulanır.
+        
+        Listeler ve demetler kopyalanmadan yerinde yazılamadığından kabul
+        edilmez; listeler için shuffle() kullanılmalıdır.
+        
+        Args:
+            array: Yazılabilir dizi veya tampon
+        """
+        import numpy as np
+        
+        if isinstance(array, np.ndarray):
+            values = array
+        else:
+            try:
+                view = memoryview(array)
+            except TypeError:
+                raise TypeError(
+                    "array must be a NumPy array or writable buffer; use shuffle() for lists"
+                ) from None
+            if view.readonly:
+                raise TypeError("array must be writable")
+            values = np.asarray(view)
+        if values.ndim == 0:
+            raise ValueError("array must have at least one dimension")
+        if not values.flags.writeable:
+            raise TypeError("array must be writable")
+        if len(values) > 1:
+            values[...] = values[self._permutation_indices(len(values))]
+    
+    def choice(self, sequence: list, weights=None):
         """
         Listeden rastgele eleman seçer.
         
+        weights verilirse seçim, önbelleğe alınan bir Walker/Vose alias
+        tablosuyla O(1) sürede ağırlıklı yapılır. Toplu ağırlıklı seçim
+        için distributions.Distributions(rng).weighted_choice kullanın.
+        
         Args:
             sequence: Seçim yapılacak liste
+            weights: İsteğe bağlı ağırlıklar veya distributions.AliasTable
         
         Returns:
             Rastgele seçilen eleman
         """
         if not sequence:
             raise ValueError("Cannot choose from empty sequence")
-        return sequence[self.next_int(0, len(sequence) - 1)]
+        if weights is None:
+            return sequence[self.next_int(0, len(sequence) - 1)]
+        
+        from distributions import alias_table
+        
+        table = alias_table(weights)
+        if len(table) != len(sequence):
+            raise ValueError("sequence and weights must have the same length")
+        column = self.next_int(0, len(sequence) - 1)
+        if self.next_float() >= table.probability[column]:
+            column = int(table.alias[column])
+        return sequence[column]
+    
+    def sample(self, population, k: int) -> list:
+        """
+        Popülasyondan k farklı öğeyi rastgele sırayla seçer.
+        
+        Maliyet O(k)'dır; popülasyon kopyalanmaz veya karıştırılmaz.
+        Ayrıntılar için sampling.sample'a bakınız.
+        
+        Args:
+            population: len() ve indeksleme destekleyen dizi
+            k: Seçilecek öğe sayısı
+        
+        Returns:
+            list: Seçilen öğeler
+        """
+        from sampling import sample
+        
+        return sample(self, population, k)
+    
+    def reservoir(self, iterable, k: int) -> list:
+        """
+        Uzunluğu bilinmeyen bir akıştan tek geçişte k öğe seçer (Algorithm L).
+        
+        Ayrıntılar için sampling.reservoir'a bakınız.
+        
+        Args:
+            iterable: Herhangi bir yinelenebilir
+            k: Rezervuar boyutu
+        
+        Returns:
+            list: En fazla k öğe
+        """
+        from sampling import reservoir
+        
+        return reservoir(self, iterable, k)
     
     def generate_token(self, length: int = 32) -> str:
         """
@@ -515,6 +1635,61 @@ class CryptographicallySecureRNG:
         print("=" * 70 + "\n")
 
 
+# Yaşayan tüm CSPRNG örnekleri (zayıf referans) / All live CSPRNG instances
+_liveInstances = weakref.WeakSet()
+
+
+def _reseed_all_after_fork() -> None:
+    """Çocuk süreçte tüm örnekleri yeniden tohumlar."""
+    for instance in list(_liveInstances):
+        instance._reseed_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_all_after_fork)
+
+
+class ThreadLocalSecureRNG:
+    """
+    İş parçacığı başına bağımsız CSPRNG örneği sunan vekil (proxy).
+    
+    Her iş parçacığı ilk kullanımda kendi CryptographicallySecureRNG
+    örneğini (kendi entropi havuzu, LCG'leri ve kilidiyle) alır; böylece
+    iş parçacıkları tek bir kilitte sıraya girmez. Tüm yöntemler
+    (next_bytes, next_int, shuffle, ...) çağıran iş parçacığının
+    örneğine yönlendirilir. fork() sonrası örnekler otomatik olarak
+    yeniden tohumlanır.
+    
+    Kullanım:
+        rng = ThreadLocalSecureRNG(bulk=True)
+        token = rng.generate_token(32)   # herhangi bir iş parçacığından
+    """
+    
+    def __init__(self, language: Language = Language.TURKISH, bulk: bool = False):
+        """
+        Args:
+            language: Her örnek için çıktı dili
+            bulk: Her örnek için toplu DRBG modu
+        """
+        self._options = {"language": language, "bulk": bulk}
+        self._local = threading.local()
+    
+    def instance(self) -> "CryptographicallySecureRNG":
+        """Çağıran iş parçacığının örneğini döndürür (gerekirse oluşturur)."""
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            rng = CryptographicallySecureRNG(**self._options)
+            self._local.rng = rng
+        return rng
+    
+    def __getattr__(self, name: str):
+        # Özel adlar yönlendirilmez: başlatılmamış bir nesnede (ör. copy.copy)
+        # _local aranırken __getattr__'a sonsuz geri dönüşü önler
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.instance(), name)
+
+
 def compare_security():
     """LCG ve CSPRNG güvenlik karşılaştırması / Security comparison."""
     print("\n" + "=" * 70)
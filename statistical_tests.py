@@ -0,0 +1,661 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İstatistiksel Test Bataryası - Statistical Test Battery
+=======================================================
+Bilgi Sistemleri ve Güvenliği Dersi Projesi
+
+Bu modül, LinearCongruentialGenerator, CryptographicallySecureRNG veya
+ham bir ikili dosya / mmap tamponu üzerinden akış halinde parça parça
+istatistiksel testler çalıştırır ve p-değerleri raporlar.
+
+This module runs statistical tests chunk by chunk over streamed output of
+LinearCongruentialGenerator, CryptographicallySecureRNG or a raw binary
+file / mmap buffer and reports p-values.
+
+Testler / Tests:
+    - Ki-kare frekans testi / Chi-square frequency test
+    - Kolmogorov-Smirnov testi
+    - Koşu (runs) testi / Runs test
+    - Boşluk (gap) testi / Gap test
+    - Poker (bölüntü) testi / Poker (partition) test
+    - Seri korelasyon testi / Serial correlation test
+    - Doğum günü aralıkları testi / Birthday spacings test
+
+Her parça bağımsız olarak analiz edilir ve kısmi sonuçlar sırayla
+birleştirilir; bu sayede parçalar birden fazla işlemde paralel
+işlenebilir ve bellek kullanımı örnek sayısından bağımsız kalır.
+
+Each chunk is analyzed independently and the partial results are merged
+in order, so chunks can be processed in parallel across processes and
+memory use does not depend on the sample count.
+
+Author: Yazılım Mühendisliği Ekibi
+Date: 2025
+License: MIT
+"""
+
+import math
+import os
+from collections import deque
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+# Ki-kare ve KS testleri için ince histogram çözünürlüğü
+# Fine histogram resolution for the chi-square and KS tests
+HISTOGRAM_BINS = 2**16
+
+# Ki-kare frekans testindeki kutu sayısı / Bins of the chi-square test
+FREQUENCY_BINS = 256
+
+# Boşluk testi: [0, GAP_UPPER) aralığı "isabet", GAP_CATEGORIES+ kuyruk
+# Gap test: [0, GAP_UPPER) counts as a hit, GAP_CATEGORIES+ is the tail
+GAP_UPPER = 0.5
+GAP_CATEGORIES = 10
+
+# Poker testi: 5'li eller, 10 tabanlı rakamlar
+# Poker test: hands of 5 decimal digits
+POKER_HAND = 5
+POKER_DIGITS = 10
+
+# Doğum günü aralıkları: 2^24 gün, blok başına 512 doğum günü (lambda = 2)
+# Birthday spacings: 2^24 days, 512 birthdays per block (lambda = 2)
+BIRTHDAY_DAYS = 2**24
+BIRTHDAY_COUNT = 512
+BIRTHDAY_CATEGORIES = 6
+
+
+# =============================================================================
+# p-değeri yardımcıları / p-value helpers
+# =============================================================================
+
+def _regularized_gamma_q(shape: float, x: float) -> float:
+    """
+    Düzenlenmiş üst tamamlanmamış gamma fonksiyonu Q(s, x).
+    Regularized upper incomplete gamma function Q(s, x).
+
+    x < s + 1 için seri açılımı, aksi halde sürekli kesir kullanılır.
+    Uses the series expansion for x < s + 1, a continued fraction otherwise.
+    """
+    if x <= 0:
+        return 1.0
+
+    logPrefix = shape * math.log(x) - x - math.lgamma(shape)
+
+    if x < shape + 1:
+        term = 1.0 / shape
+        total = term
+        denominator = shape
+        for _ in range(10000):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(logPrefix))
+
+    # Lentz yöntemiyle sürekli kesir / Continued fraction (Lentz)
+    tiny = 1e-300
+    b = x + 1 - shape
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        a = -i * (i - shape)
+        b += 2
+        d = a * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + a / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, math.exp(logPrefix) * h)
+
+
+def _chi_square_pvalue(statistic: float, degreesOfFreedom: int) -> float:
+    """Ki-kare üst kuyruk olasılığı / Chi-square upper tail probability."""
+    return _regularized_gamma_q(degreesOfFreedom / 2, statistic / 2)
+
+
+def _normal_pvalue(z: float) -> float:
+    """İki yönlü standart normal p-değeri / Two-sided standard normal p-value."""
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def _kolmogorov_pvalue(distance: float, sampleSize: int) -> float:
+    """
+    Kolmogorov dağılımının asimptotik üst kuyruğu.
+    Asymptotic upper tail of the Kolmogorov distribution.
+    """
+    root = math.sqrt(sampleSize)
+    lam = (root + 0.12 + 0.11 / root) * distance
+    if lam < 0.2:
+        return 1.0
+
+    total = 0.0
+    sign = 1.0
+    for j in range(1, 101):
+        term = sign * math.exp(-2 * j * j * lam * lam)
+        total += term
+        if abs(term) < 1e-12:
+            break
+        sign = -sign
+    return min(1.0, max(0.0, 2 * total))
+
+
+def _chi_square_from_counts(observed, probabilities) -> tuple:
+    """
+    Gözlenen sayılar ve beklenen olasılıklardan ki-kare istatistiği.
+    Chi-square statistic from observed counts and expected probabilities.
+
+    Returns:
+        tuple: (istatistik / statistic, serbestlik derecesi / dof)
+    """
+    observed = np.asarray(observed, dtype=np.float64)
+    expected = observed.sum() * np.asarray(probabilities, dtype=np.float64)
+    statistic = float((((observed - expected) ** 2) / expected).sum())
+    return statistic, len(observed) - 1
+
+
+def _result(name: str, statistic: Optional[float], pValue: Optional[float],
+            alpha: float, **details) -> dict:
+    """Tek bir test sonucu sözlüğü oluşturur / Builds one test result dict."""
+    result = {
+        "test": name,
+        "statistic": statistic,
+        "p_value": pValue,
+        "passed": None if pValue is None else pValue >= alpha,
+    }
+    result.update(details)
+    return result
+
+
+# =============================================================================
+# Parça analizi / Chunk analysis
+# =============================================================================
+
+def analyze_chunk(samples: np.ndarray) -> dict:
+    """
+    Bir parça [0, 1) örneği için tüm testlerin kısmi sonuçlarını hesaplar.
+    Computes the partial results of every test for one chunk of [0, 1) samples.
+
+    Args:
+        samples: float64 örnek dizisi / float64 sample array
+
+    Returns:
+        dict: merge_partials ile birleştirilebilir kısmi sonuç
+              Partial result that can be merged with merge_partials
+    """
+    count = len(samples)
+    if count == 0:
+        raise ValueError("Cannot analyze an empty chunk")
+
+    # Frekans / KS histogramı / Frequency / KS histogram
+    bins = (samples * HISTOGRAM_BINS).astype(np.int64)
+    np.clip(bins, 0, HISTOGRAM_BINS - 1, out=bins)
+    histogram = np.bincount(bins, minlength=HISTOGRAM_BINS)
+
+    # Koşu testi (0.5 üstü/altı) / Runs test (above/below 0.5)
+    above = samples >= 0.5
+    runs = 1 + int(np.count_nonzero(above[1:] != above[:-1]))
+
+    # Seri korelasyon / Serial correlation
+    serial = {
+        "sum": float(samples.sum()),
+        "sum_sq": float(np.dot(samples, samples)),
+        "sum_lag": float(np.dot(samples[:-1], samples[1:])),
+        "first": float(samples[0]),
+        "last": float(samples[-1]),
+    }
+
+    # Boşluk testi / Gap test
+    hits = np.flatnonzero(samples < GAP_UPPER)
+    gapHistogram = np.zeros(GAP_CATEGORIES + 1, dtype=np.int64)
+    if len(hits):
+        gaps = np.minimum(np.diff(hits) - 1, GAP_CATEGORIES)
+        gapHistogram += np.bincount(gaps, minlength=GAP_CATEGORIES + 1)
+        gapState = (True, int(hits[0]), int(count - 1 - hits[-1]))
+    else:
+        gapState = (False, count, count)
+
+    # Poker testi / Poker test
+    hands = count // POKER_HAND
+    digits = (samples[:hands * POKER_HAND] * POKER_DIGITS).astype(np.int64)
+    digits = np.sort(digits.reshape(hands, POKER_HAND), axis=1)
+    distinct = 1 + np.count_nonzero(np.diff(digits, axis=1), axis=1)
+    pokerHistogram = np.bincount(distinct, minlength=POKER_HAND + 1)
+
+    # Doğum günü aralıkları / Birthday spacings
+    blocks = count // BIRTHDAY_COUNT
+    days = (samples[:blocks * BIRTHDAY_COUNT] * BIRTHDAY_DAYS).astype(np.int64)
+    days = np.sort(days.reshape(blocks, BIRTHDAY_COUNT), axis=1)
+    spacings = np.sort(np.diff(days, axis=1), axis=1)
+    duplicates = np.count_nonzero(np.diff(spacings, axis=1) == 0, axis=1)
+    birthdayHistogram = np.bincount(
+        np.minimum(duplicates, BIRTHDAY_CATEGORIES),
+        minlength=BIRTHDAY_CATEGORIES + 1
+    )
+
+    return {
+        "count": count,
+        "histogram": histogram,
+        "above": int(np.count_nonzero(above)),
+        "runs": runs,
+        "first_above": bool(above[0]),
+        "last_above": bool(above[-1]),
+        "serial": serial,
+        "gap_histogram": gapHistogram,
+        "gap_state": gapState,
+        "poker_histogram": pokerHistogram,
+        "birthday_histogram": birthdayHistogram,
+    }
+
+
+def merge_partials(left: dict, right: dict) -> dict:
+    """
+    Ardışık iki parçanın kısmi sonuçlarını birleştirir.
+    Merges the partial results of two consecutive chunks.
+
+    Sıra önemlidir: koşu, boşluk ve seri korelasyon testleri parça
+    sınırını aşan değerleri de hesaba katar.
+
+    Order matters: the runs, gap and serial correlation tests account
+    for values that straddle the chunk boundary.
+    """
+    # Sınırdaki koşu birleşimi / Run joined across the boundary
+    runs = left["runs"] + right["runs"]
+    if left["last_above"] == right["first_above"]:
+        runs -= 1
+
+    leftSerial, rightSerial = left["serial"], right["serial"]
+    serial = {
+        "sum": leftSerial["sum"] + rightSerial["sum"],
+        "sum_sq": leftSerial["sum_sq"] + rightSerial["sum_sq"],
+        "sum_lag": (leftSerial["sum_lag"] + rightSerial["sum_lag"]
+                    + leftSerial["last"] * rightSerial["first"]),
+        "first": leftSerial["first"],
+        "last": rightSerial["last"],
+    }
+
+    # Sınırdaki boşluk / Gap across the boundary
+    gapHistogram = left["gap_histogram"] + right["gap_histogram"]
+    leftHit, leftLeading, leftTrailing = left["gap_state"]
+    rightHit, rightLeading, rightTrailing = right["gap_state"]
+    if leftHit and rightHit:
+        gapHistogram[min(leftTrailing + rightLeading, GAP_CATEGORIES)] += 1
+        gapState = (True, leftLeading, rightTrailing)
+    elif leftHit:
+        gapState = (True, leftLeading, leftTrailing + right["count"])
+    elif rightHit:
+        gapState = (True, left["count"] + rightLeading, rightTrailing)
+    else:
+        total = left["count"] + right["count"]
+        gapState = (False, total, total)
+
+    return {
+        "count": left["count"] + right["count"],
+        "histogram": left["histogram"] + right["histogram"],
+        "above": left["above"] + right["above"],
+        "runs": runs,
+        "first_above": left["first_above"],
+        "last_above": right["last_above"],
+        "serial": serial,
+        "gap_histogram": gapHistogram,
+        "gap_state": gapState,
+        "poker_histogram": left["poker_histogram"] + right["poker_histogram"],
+        "birthday_histogram": left["birthday_histogram"] + right["birthday_histogram"],
+    }
+
+
+def finalize_results(partial: dict, alpha: float = 0.01) -> dict:
+    """
+    Birleştirilmiş kısmi sonuçtan test istatistiklerini ve p-değerlerini
+    hesaplar.
+    Computes the test statistics and p-values from a merged partial result.
+
+    Yeterli veri olmayan testler için p_value None olur.
+    Tests without enough data report p_value None.
+
+    Args:
+        partial: merge_partials çıktısı / Output of merge_partials
+        alpha: Anlamlılık düzeyi / Significance level
+
+    Returns:
+        dict: Test adı -> sonuç sözlüğü / Test name -> result dict
+    """
+    count = partial["count"]
+    results = {}
+
+    # Ki-kare frekans testi / Chi-square frequency test
+    frequency = partial["histogram"].reshape(FREQUENCY_BINS, -1).sum(axis=1)
+    statistic, dof = _chi_square_from_counts(
+        frequency, np.full(FREQUENCY_BINS, 1 / FREQUENCY_BINS)
+    )
+    results["chi_square"] = _result(
+        "chi_square", statistic, _chi_square_pvalue(statistic, dof), alpha,
+        degrees_of_freedom=dof
+    )
+
+    # Kolmogorov-Smirnov (histogram kenarlarında)
+    # Kolmogorov-Smirnov (evaluated at histogram edges)
+    cumulative = np.cumsum(partial["histogram"]) / count
+    edges = np.arange(1, HISTOGRAM_BINS + 1) / HISTOGRAM_BINS
+    previous = np.concatenate(([0.0], cumulative[:-1]))
+    distance = float(max(
+        np.max(cumulative - edges),
+        np.max(edges - 1 / HISTOGRAM_BINS - previous),
+        0.0
+    ))
+    results["kolmogorov_smirnov"] = _result(
+        "kolmogorov_smirnov", distance, _kolmogorov_pvalue(distance, count), alpha
+    )
+
+    # Koşu testi (Wald-Wolfowitz) / Runs test (Wald-Wolfowitz)
+    above = partial["above"]
+    below = count - above
+    if above and below and count > 1:
+        product = 2 * above * below
+        expectedRuns = product / count + 1
+        varianceRuns = product * (product - count) / (count * count * (count - 1))
+        z = (partial["runs"] - expectedRuns) / math.sqrt(varianceRuns)
+        results["runs"] = _result("runs", z, _normal_pvalue(z), alpha,
+                                  runs=partial["runs"])
+    else:
+        results["runs"] = _result("runs", None, None, alpha)
+
+    # Seri korelasyon (gecikme 1) / Serial correlation (lag 1)
+    serial = partial["serial"]
+    if count > 2:
+        mean = serial["sum"] / count
+        variance = serial["sum_sq"] / count - mean * mean
+        correlation = (serial["sum_lag"] / (count - 1) - mean * mean) / variance \
+            if variance > 0 else 0.0
+        z = correlation * math.sqrt(count)
+        results["serial_correlation"] = _result(
+            "serial_correlation", correlation, _normal_pvalue(z), alpha
+        )
+    else:
+        results["serial_correlation"] = _result("serial_correlation", None, None, alpha)
+
+    # Boşluk testi / Gap test
+    gapHistogram = partial["gap_histogram"]
+    if gapHistogram.sum() > 0:
+        p = GAP_UPPER
+        probabilities = [p * (1 - p) ** r for r in range(GAP_CATEGORIES)]
+        probabilities.append((1 - p) ** GAP_CATEGORIES)
+        statistic, dof = _chi_square_from_counts(gapHistogram, probabilities)
+        results["gap"] = _result("gap", statistic, _chi_square_pvalue(statistic, dof),
+                                 alpha, gaps=int(gapHistogram.sum()))
+    else:
+        results["gap"] = _result("gap", None, None, alpha)
+
+    # Poker testi: P(r farklı) = d(d-1)...(d-r+1) * S(5, r) / d^5
+    # Poker test: P(r distinct) = d(d-1)...(d-r+1) * S(5, r) / d^5
+    pokerHistogram = partial["poker_histogram"]
+    if pokerHistogram.sum() > 0:
+        stirling = [0, 1, 15, 25, 10, 1]
+        probabilities = [
+            math.perm(POKER_DIGITS, r) * stirling[r] / POKER_DIGITS ** POKER_HAND
+            for r in range(1, POKER_HAND + 1)
+        ]
+        # Beklenen değeri çok küçük olan r=1'i r=2 ile birleştir
+        # Lump the very unlikely r=1 category into r=2
+        observed = pokerHistogram[1:].copy()
+        observed[1] += observed[0]
+        probabilities[1] += probabilities[0]
+        statistic, dof = _chi_square_from_counts(observed[1:], probabilities[1:])
+        results["poker"] = _result("poker", statistic, _chi_square_pvalue(statistic, dof),
+                                   alpha, hands=int(pokerHistogram.sum()))
+    else:
+        results["poker"] = _result("poker", None, None, alpha)
+
+    # Doğum günü aralıkları: tekrar sayısı ~ Poisson(m^3 / 4n)
+    # Birthday spacings: duplicate count ~ Poisson(m^3 / 4n)
+    birthdayHistogram = partial["birthday_histogram"]
+    if birthdayHistogram.sum() > 0:
+        lam = BIRTHDAY_COUNT ** 3 / (4 * BIRTHDAY_DAYS)
+        probabilities = [math.exp(-lam) * lam ** k / math.factorial(k)
+                         for k in range(BIRTHDAY_CATEGORIES)]
+        probabilities.append(1 - sum(probabilities))
+        statistic, dof = _chi_square_from_counts(birthdayHistogram, probabilities)
+        results["birthday_spacings"] = _result(
+            "birthday_spacings", statistic, _chi_square_pvalue(statistic, dof),
+            alpha, blocks=int(birthdayHistogram.sum())
+        )
+    else:
+        results["birthday_spacings"] = _result("birthday_spacings", None, None, alpha)
+
+    return results
+
+
+# =============================================================================
+# Kaynaklar / Sources
+# =============================================================================
+
+def _load_chunk(task: tuple) -> np.ndarray:
+    """
+    Bir görev tanımından [0, 1) örnek parçasını yükler.
+    Loads a chunk of [0, 1) samples from a task description.
+    """
+    kind = task[0]
+
+    if kind == "lcg":
+        from lcg_generator import LinearCongruentialGenerator
+
+        _, startState, size = task
+        generator = LinearCongruentialGenerator(seed=startState)
+        return generator.generate_normalized_sequence(size, asArray=True)
+
+    if kind == "file":
+        _, path, dtype, offset, size, modulus = task
+        mapped = np.memmap(path, dtype=dtype, mode="r",
+                           offset=offset * np.dtype(dtype).itemsize, shape=(size,))
+        return _to_uniform(np.array(mapped), modulus)
+
+    # "array": ana işlemde hazırlanmış veri / data prepared in the main process
+    _, values, modulus = task
+    return _to_uniform(values, modulus)
+
+
+def _to_uniform(values: np.ndarray, modulus: Optional[int] = None) -> np.ndarray:
+    """
+    Ham değerleri [0, 1) aralığına dönüştürür.
+    Converts raw values into the [0, 1) range.
+
+    modulus verilirse tamsayılar x / modulus olarak ölçeklenir; aksi halde
+    uint32 -> x / 2^32, uint64 -> (x >> 11) / 2^53, float64 olduğu gibi.
+
+    If modulus is given integers are scaled as x / modulus; otherwise
+    uint32 -> x / 2^32, uint64 -> (x >> 11) / 2^53, float64 unchanged.
+    """
+    if modulus is not None and values.dtype.kind in "ui":
+        return values.astype(np.float64) / modulus
+    if values.dtype == np.uint32:
+        return values.astype(np.float64) / 2.0**32
+    if values.dtype == np.uint64:
+        return (values >> np.uint64(11)).astype(np.float64) / 2.0**53
+    return values.astype(np.float64, copy=False)
+
+
+def _analyze_task(task: tuple) -> dict:
+    """İşçi işlemi girişi / Worker process entry point."""
+    return analyze_chunk(_load_chunk(task))
+
+
+def _source_tasks(source, sampleCount: Optional[int], chunkSize: int,
+                  dtype: str, modulus: Optional[int]) -> Iterator[tuple]:
+    """
+    Kaynağı parça görevlerine böler (tembel olarak).
+    Splits the source into chunk tasks (lazily).
+
+    Desteklenen kaynaklar / Supported sources:
+        - LinearCongruentialGenerator: başlangıç durumuna atlayan görevler
+        - CryptographicallySecureRNG: ana işlemde toplu byte üretimi
+        - str / os.PathLike: ham ikili dosya (memmap)
+        - Tampon (bytes, mmap, np.ndarray): doğrudan dilimler
+    """
+    from lcg_generator import LinearCongruentialGenerator
+
+    if isinstance(source, LinearCongruentialGenerator):
+        if sampleCount is None:
+            raise ValueError("sampleCount is required for generator sources")
+        for offset in range(0, sampleCount, chunkSize):
+            size = min(chunkSize, sampleCount - offset)
+            yield ("lcg", source._state_after(offset), size)
+        source.advance(sampleCount)
+        return
+
+    if hasattr(source, "next_bytes"):
+        if sampleCount is None:
+            raise ValueError("sampleCount is required for generator sources")
+        for offset in range(0, sampleCount, chunkSize):
+            size = min(chunkSize, sampleCount - offset)
+            yield ("array", np.frombuffer(source.next_bytes(size * 8), dtype=np.uint64),
+                   None)
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        itemSize = np.dtype(dtype).itemsize
+        available = os.path.getsize(source) // itemSize
+        total = available if sampleCount is None else min(sampleCount, available)
+        for offset in range(0, total, chunkSize):
+            yield ("file", os.fspath(source), dtype, offset,
+                   min(chunkSize, total - offset), modulus)
+        return
+
+    values = source.ravel() if isinstance(source, np.ndarray) \
+        else np.frombuffer(source, dtype=dtype)
+    total = len(values) if sampleCount is None else min(sampleCount, len(values))
+    for offset in range(0, total, chunkSize):
+        yield ("array", values[offset:min(offset + chunkSize, total)].copy(), modulus)
+
+
+class StatisticalTestBattery:
+    """
+    Parça tabanlı, çok çekirdekli istatistiksel test bataryası.
+    Chunked, multi-core statistical test battery.
+
+    Kullanım / Usage:
+        battery = StatisticalTestBattery(workers=4)
+        results = battery.run(LinearCongruentialGenerator(seed=1), 10**8)
+        results = battery.run("stream.bin", dtype="uint32")
+    """
+
+    def __init__(self, chunkSize: int = 2**20, workers: int = 1,
+                 alpha: float = 0.01):
+        """
+        Bataryayı yapılandırır.
+        Configures the battery.
+
+        Args:
+            chunkSize: Parça başına örnek sayısı / Samples per chunk
+            workers: 1'den büyükse parçalar bu kadar işlemde analiz edilir
+                     If greater than 1, chunks are analyzed in this many
+                     processes
+            alpha: Geçme/kalma için anlamlılık düzeyi / Significance level
+        """
+        if chunkSize < BIRTHDAY_COUNT:
+            raise ValueError(f"chunkSize must be at least {BIRTHDAY_COUNT}")
+        self.chunkSize = chunkSize
+        self.workers = workers
+        self.alpha = alpha
+
+    def run(self, source, sampleCount: Optional[int] = None,
+            dtype: str = "uint32", modulus: Optional[int] = None) -> dict:
+        """
+        Tüm testleri kaynak üzerinde çalıştırır.
+        Runs all tests over the source.
+
+        Üreteç kaynakları sampleCount kadar ilerletilir (tüketilir).
+        Generator sources are advanced (consumed) by sampleCount values.
+
+        Args:
+            source: Üreteç, dosya yolu veya tampon / Generator, path or buffer
+            sampleCount: Örnek sayısı (dosya/tamponda None = tamamı)
+                         Sample count (None = everything for files/buffers)
+            dtype: Ham veri tipi: "uint32", "uint64" veya "float64"
+                   Raw data type for files and buffers
+            modulus: Tamsayı veriler için ölçek (ör. LCG için 2^31 - 1)
+                     Scale for integer data (e.g. 2^31 - 1 for the LCG)
+
+        Returns:
+            dict: Test adı -> sonuç / Test name -> result, plus "sample_size"
+        """
+        tasks = _source_tasks(source, sampleCount, self.chunkSize, dtype, modulus)
+        merged = None
+        for partial in self._analyze(tasks):
+            merged = partial if merged is None else merge_partials(merged, partial)
+
+        if merged is None:
+            raise ValueError("Source produced no samples")
+
+        results = finalize_results(merged, self.alpha)
+        results["sample_size"] = merged["count"]
+        return results
+
+    def _analyze(self, tasks: Iterator[tuple]) -> Iterator[dict]:
+        """
+        Görevleri sırayla analiz eder; paralel modda en fazla
+        2 * workers görev aynı anda bekler.
+        Analyzes tasks in order; in parallel mode at most 2 * workers
+        tasks are in flight at once.
+        """
+        if self.workers <= 1:
+            for task in tasks:
+                yield _analyze_task(task)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(_analyze_task, task))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def display_results(results: dict) -> None:
+    """Sonuçları tablo halinde yazdırır / Prints the results as a table."""
+    print(f"\n{'Test':<22} {'İstatistik':>14} {'p-değeri':>12} {'Sonuç':>8}")
+    print("-" * 60)
+    for name, result in results.items():
+        if not isinstance(result, dict):
+            continue
+        if result["p_value"] is None:
+            print(f"{name:<22} {'-':>14} {'-':>12} {'N/A':>8}")
+            continue
+        status = "✅" if result["passed"] else "❌"
+        print(f"{name:<22} {result['statistic']:>14.6f} "
+              f"{result['p_value']:>12.6f} {status:>8}")
+    print(f"\nÖrnek sayısı / Sample size: {results['sample_size']:,}")
+
+
+def main():
+    """Demo: her iki üreteci de test eder / Demo: tests both generators."""
+    from lcg_generator import LinearCongruentialGenerator
+    from secure_rng import CryptographicallySecureRNG
+
+    battery = StatisticalTestBattery(chunkSize=2**18, workers=os.cpu_count() or 1)
+
+    print("\n" + "=" * 60)
+    print("🔓 LCG (seed=12345, 10^7 örnek / samples)")
+    print("=" * 60)
+    display_results(battery.run(LinearCongruentialGenerator(seed=12345), 10**7))
+
+    print("\n" + "=" * 60)
+    print("🔐 CSPRNG (10^5 örnek / samples)")
+    print("=" * 60)
+    display_results(battery.run(CryptographicallySecureRNG(), 10**5))
+    print()
+
+
+if __name__ == "__main__":
+    main()
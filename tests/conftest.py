@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+Testler depo kökündeki düz modülleri içe aktarır.
+Tests import the flat modules at the repository root.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""async_rng regresyon testleri / async_rng regression tests."""
+
+import asyncio
+import os
+
+import numpy as np
+
+from async_rng import AsyncPrefetchBuffer
+from lcg_generator import LinearCongruentialGenerator
+from secure_rng import CryptographicallySecureRNG
+
+
+def test_concurrent_reads_return_requested_length():
+    async def scenario():
+        buffer = AsyncPrefetchBuffer(os.urandom, capacity=4096)
+        buffer.buffer += os.urandom(1000)
+        sizes = [5000, 100, 3000, 1, 8192, 64]
+        results = await asyncio.gather(*(buffer.read(size) for size in sizes))
+        return sizes, results
+
+    sizes, results = asyncio.run(scenario())
+    assert [len(result) for result in results] == sizes
+
+
+def test_reads_never_repeat_bytes():
+    async def scenario():
+        buffer = AsyncPrefetchBuffer(os.urandom, capacity=1024)
+        return await asyncio.gather(*(buffer.read(16) for _ in range(500)))
+
+    results = asyncio.run(scenario())
+    assert all(len(result) == 16 for result in results)
+    assert len(set(results)) == len(results)
+
+
+def test_lcg_astream_matches_synchronous_chunks():
+    async def collect():
+        rng = LinearCongruentialGenerator(seed=4)
+        return [chunk async for chunk in rng.astream(chunkSize=300, count=1000)]
+
+    chunks = asyncio.run(collect())
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    expected = LinearCongruentialGenerator(seed=4).random_raw(1000)
+    assert np.array_equal(np.concatenate(chunks), expected)
+
+
+def test_csprng_astream_yields_requested_chunks():
+    async def collect():
+        rng = CryptographicallySecureRNG()
+        return [chunk async for chunk in rng.astream(chunkSize=64, chunks=5)]
+
+    chunks = asyncio.run(collect())
+    assert [len(chunk) for chunk in chunks] == [64] * 5
+    assert len(set(chunks)) == 5
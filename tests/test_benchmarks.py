@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""benchmarks regresyon testleri / benchmarks regression tests."""
+
+import benchmarks
+
+
+def _report(p50, p99, version=benchmarks.REPORT_VERSION):
+    prefix = "batch_" if version >= 2 else ""
+    return {"version": version, "benchmarks": {"x": {"latency_ns": {
+        "mean": p50, f"{prefix}p50": p50, f"{prefix}p99": p99}}}}
+
+
+def test_measure_reports_batch_percentiles():
+    result = benchmarks.measure(lambda: None, 8, duration=0.01)
+    assert set(result["latency_ns"]) == {"mean", "batch_p50", "batch_p90", "batch_p99"}
+    assert result["bytes_per_second"] == result["ops_per_second"] * 8
+
+
+def test_compare_flags_regressions_and_reads_version_1_baselines():
+    for baseline in (_report(100.0, 200.0), _report(100.0, 200.0, version=1)):
+        row, = benchmarks.compare(_report(125.0, 300.0), baseline, threshold=0.10)
+        assert row["regression"]
+        assert row["batch_p99_ratio"] == 1.5
+        row, = benchmarks.compare(_report(105.0, 200.0), baseline, threshold=0.10)
+        assert not row["regression"]
+
+
+def test_later_fast_paths_are_registered():
+    for name in ("csprng.next_bytes[32,prefetch]", "csprng.next_bytes[1MiB,bulk]",
+                 "csprng.random_floats[10000]", "csprng.random_floats[10000,bulk]"):
+        assert name in benchmarks.BENCHMARKS
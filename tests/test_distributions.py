@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""distributions regresyon testleri / distributions regression tests."""
+
+import numpy as np
+
+from distributions import Distributions, alias_table, normal_tail_check
+from lcg_generator import LinearCongruentialGenerator
+
+
+def test_normal_tail_mass_matches_expectation():
+    # d04d53c öncesi bu tohumla z ~ -5.6 / z ~ -5.6 with this seed before d04d53c
+    result = normal_tail_check(LinearCongruentialGenerator(seed=1), 2 * 10**7)
+    assert abs(result["z_score"]) < 3.0, result
+
+
+def test_normal_and_exponential_moments():
+    dist = Distributions(LinearCongruentialGenerator(seed=3))
+    normal = dist.normal(10**6, loc=2.0, scale=3.0)
+    assert abs(normal.mean() - 2.0) < 0.02
+    assert abs(normal.std() - 3.0) < 0.02
+    exponential = dist.exponential(10**6, scale=2.0)
+    assert abs(exponential.mean() - 2.0) < 0.02
+
+
+def test_alias_table_reproduces_weights_exactly():
+    weights = np.array([1.0, 3.0, 0.0, 6.0])
+    table = alias_table(weights)
+    size = len(table)
+    implied = np.zeros(size)
+    for column in range(size):
+        implied[column] += table.probability[column] / size
+        implied[table.alias[column]] += (1.0 - table.probability[column]) / size
+    assert np.allclose(implied, weights / weights.sum())
+
+
+def test_truncated_normal_stays_in_bounds():
+    dist = Distributions(LinearCongruentialGenerator(seed=9))
+    values = dist.truncated_normal(3.0, 3.5, 10000)
+    assert values.min() >= 3.0 and values.max() <= 3.5
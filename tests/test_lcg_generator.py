@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""lcg_generator regresyon testleri / lcg_generator regression tests."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from lcg_generator import GeneratorBank, LinearCongruentialGenerator
+
+
+def test_integers_are_in_range_and_unbiased():
+    values = LinearCongruentialGenerator(seed=5).integers(-3, 4, 70000)
+    assert values.dtype == np.int64
+    assert values.min() == -3 and values.max() == 3
+    counts = np.bincount(values + 3)
+    assert np.all(np.abs(counts - 10000) < 500)
+
+
+def test_integers_rejects_invalid_ranges():
+    rng = LinearCongruentialGenerator(seed=5)
+    with pytest.raises(ValueError):
+        rng.integers(5, 5)
+    with pytest.raises(ValueError):
+        rng.integers(0, rng.MAX_INTEGERS_RANGE + 1)
+
+
+@pytest.mark.parametrize("low", [2**63 - 10, -2**63 - 5, 2**70])
+def test_integers_near_int64_limits_do_not_wrap(low):
+    rng = LinearCongruentialGenerator(seed=5)
+    values = rng.integers(low, low + 15, 1000)
+    assert all(low <= int(value) < low + 15 for value in values)
+    scalar = rng.integers(low, low + 15)
+    assert low <= scalar < low + 15
+
+
+@pytest.mark.parametrize("steps", [0, 1, 2, 7, 1000, 12345])
+def test_advance_matches_stepping(steps):
+    stepped = LinearCongruentialGenerator(seed=2024)
+    for _ in range(steps):
+        stepped.next()
+    jumped = LinearCongruentialGenerator(seed=2024)
+    assert jumped.advance(steps) == stepped.currentState
+    assert jumped.next() == stepped.next()
+
+
+def test_value_at_does_not_move_the_generator():
+    rng = LinearCongruentialGenerator(seed=99)
+    expected = [rng.value_at(index) for index in range(1, 6)]
+    assert rng.currentState == 99
+    assert [rng.next() for _ in range(5)] == expected
+
+
+def test_jump_parameters_rejects_negative_steps():
+    with pytest.raises(ValueError):
+        LinearCongruentialGenerator.jump_parameters(-1)
+
+
+@pytest.mark.parametrize("count", [0, 1, 5, 65535, 65536, 65537, 140000])
+def test_block_mode_is_bit_identical_to_next(count):
+    scalar = LinearCongruentialGenerator(seed=77)
+    expected = [scalar.next() for _ in range(count)]
+    block = LinearCongruentialGenerator(seed=77)
+    values = block.generate_sequence(count, asArray=True)
+    assert values.dtype == np.uint32
+    assert values.tolist() == expected
+    assert block.currentState == scalar.currentState
+
+
+def test_normalized_block_mode_matches_next_float():
+    scalar = LinearCongruentialGenerator(seed=77)
+    expected = [scalar.next_float() for _ in range(3000)]
+    values = LinearCongruentialGenerator(seed=77).generate_normalized_sequence(3000, asArray=True)
+    assert values.tolist() == expected
+
+
+def test_parallel_generation_matches_serial(tmp_path):
+    serial = LinearCongruentialGenerator(seed=3)
+    expected = serial.generate_sequence(10000, asArray=True)
+    parallel = LinearCongruentialGenerator(seed=3)
+    values = parallel.generate_sequence_parallel(10000, workers=2, blockSize=3000)
+    assert np.array_equal(values, expected)
+    assert parallel.currentState == serial.currentState
+
+    path = tmp_path / "stream.bin"
+    fileGenerator = LinearCongruentialGenerator(seed=3)
+    assert fileGenerator.generate_sequence_parallel(
+        10000, workers=2, outputPath=str(path), blockSize=3000) is None
+    assert np.array_equal(np.fromfile(path, dtype=np.uint32), expected)
+
+
+def test_chunked_statistics_match_single_pass():
+    rng = LinearCongruentialGenerator(seed=11)
+    samples = LinearCongruentialGenerator(seed=11).generate_normalized_sequence(5000, asArray=True)
+    stats = rng.calculate_statistics(5000, chunkSize=777)
+    assert rng.currentState == 11
+    assert stats["mean"] == pytest.approx(samples.mean(), abs=1e-12)
+    assert stats["variance"] == pytest.approx(samples.var(), abs=1e-12)
+    centered = samples - samples.mean()
+    skewness = (centered ** 3).mean() / samples.var() ** 1.5
+    assert stats["skewness"] == pytest.approx(skewness, abs=1e-9)
+    assert stats["min"] == samples.min() and stats["max"] == samples.max()
+
+
+@pytest.mark.parametrize("length", [0, 3, 4, 17, 4096])
+def test_fill_into_writes_the_next_stream_bytewise(length):
+    buffer = bytearray(length)
+    assert LinearCongruentialGenerator(seed=8).fill_into(buffer) == length
+    reference = LinearCongruentialGenerator(seed=8)
+    words = np.array([reference.next() for _ in range((length + 3) // 4)], dtype=np.uint32)
+    assert bytes(buffer) == words.tobytes()[:length]
+
+
+def test_fill_into_float_array_matches_random():
+    values = np.empty((10, 10))
+    LinearCongruentialGenerator(seed=8).fill_into(values)
+    assert np.array_equal(values.ravel(), LinearCongruentialGenerator(seed=8).random(100))
+    with pytest.raises(TypeError):
+        LinearCongruentialGenerator(seed=8).fill_into(memoryview(bytes(8)))
+
+
+def test_snapshot_round_trips():
+    rng = LinearCongruentialGenerator(seed=31)
+    rng.advance(50)
+    state = rng.getstate()
+    packed = rng.to_bytes()
+    pickled = pickle.dumps(rng)
+    expected = [rng.next() for _ in range(5)]
+
+    rng.setstate(state)
+    assert [rng.next() for _ in range(5)] == expected
+    restored = LinearCongruentialGenerator.from_bytes(packed)
+    assert len(packed) == 10
+    assert [restored.next() for _ in range(5)] == expected
+    unpickled = pickle.loads(pickled)
+    assert [unpickled.next() for _ in range(5)] == expected
+    unpickled.reset()
+    assert unpickled.currentState == 31
+
+
+def test_setstate_and_from_bytes_reject_bad_input():
+    rng = LinearCongruentialGenerator(seed=31)
+    with pytest.raises(ValueError):
+        rng.setstate((0, 31))
+    corrupt = bytearray(rng.to_bytes())
+    corrupt[0] ^= 0xFF
+    with pytest.raises(ValueError):
+        LinearCongruentialGenerator.from_bytes(bytes(corrupt))
+
+
+def test_bank_lanes_match_scalar_generators():
+    seeds = [1, 2, 12345, 2**31 - 2, 0]
+    bank = GeneratorBank(seeds)
+    scalars = [LinearCongruentialGenerator(seed=seed) for seed in seeds]
+    for _ in range(20):
+        assert bank.next().tolist() == [generator.next() for generator in scalars]
+    assert bank.lane(2).next() == scalars[2].next()
+
+
+def test_bank_advance_matches_scalar_advance():
+    bank = GeneratorBank.spaced(seed=9, size=4, spacing=1000)
+    parent = LinearCongruentialGenerator(seed=9)
+    assert bank.states.tolist() == [parent.value_at(1000 * lane) for lane in range(4)]
+
+    steps = [0, 1, 17, 123456]
+    bank.advance(steps)
+    for lane, step in enumerate(steps):
+        expected = LinearCongruentialGenerator(seed=9)
+        expected.advance(1000 * lane + step)
+        assert int(bank.states[lane]) == expected.currentState
+
+    bank.reset(lanes=[1])
+    assert int(bank.states[1]) == parent.value_at(1000)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""rng_cli regresyon testleri / rng_cli regression tests."""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+import rng_cli
+
+
+def test_unknown_engine_keeps_existing_output(tmp_path, capsys):
+    target = tmp_path / "out.bin"
+    target.write_bytes(b"keep")
+    assert rng_cli.main(["generate", "--engine", "pcg33", "--count", "4",
+                         "-o", str(target)]) == 2
+    assert target.read_bytes() == b"keep"
+    message = capsys.readouterr().err
+    assert "lcg" in message and "csprng" in message and "pcg32" in message
+
+
+def test_seeded_csprng_is_rejected_before_opening_output(tmp_path):
+    target = tmp_path / "out.bin"
+    target.write_bytes(b"keep")
+    assert rng_cli.main(["generate", "--engine", "csprng", "--seed", "1",
+                         "--count", "4", "-o", str(target)]) == 2
+    assert target.read_bytes() == b"keep"
+
+
+@pytest.mark.parametrize("fmt, size", [("u32", 4), ("f64", 8)])
+def test_binary_output_size(fmt, size):
+    output = io.BytesIO()
+    written = rng_cli.generate("csprng", 1000, fmt, output, chunkSize=300)
+    assert written == len(output.getvalue()) == 1000 * size
+
+
+def test_seeded_text_output_is_reproducible():
+    first, second = io.BytesIO(), io.BytesIO()
+    rng_cli.generate("lcg", 10, "text", first, seed=7, chunkSize=3)
+    rng_cli.generate("lcg", 10, "text", second, seed=7, chunkSize=4)
+    assert first.getvalue() == second.getvalue()
+    assert len(first.getvalue().split()) == 10
+
+
+def test_lcg_generator_script_dispatches_to_the_cli(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    target = tmp_path / "out.txt"
+    subprocess.run([sys.executable, os.path.join(root, "lcg_generator.py"), "generate",
+                    "--count", "5", "--seed", "7", "-o", str(target)],
+                   check=True, timeout=60)
+    expected = io.BytesIO()
+    rng_cli.generate("lcg", 5, "text", expected, seed=7)
+    assert target.read_bytes() == expected.getvalue()
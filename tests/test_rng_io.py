@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""rng_io regresyon testleri / rng_io regression tests."""
+
+import numpy as np
+import pytest
+
+from lcg_generator import LinearCongruentialGenerator
+from rng_io import dump_stream
+
+
+@pytest.mark.parametrize("useMemmap", [False, True])
+def test_dump_matches_generate_sequence(tmp_path, useMemmap):
+    path = tmp_path / "stream.bin"
+    report = LinearCongruentialGenerator(seed=21).dump(
+        str(path), 1000, chunkSize=300, useMemmap=useMemmap)
+    assert report["bytes"] == 4000
+    expected = LinearCongruentialGenerator(seed=21).generate_sequence(1000, asArray=True)
+    assert np.array_equal(np.fromfile(path, dtype=np.uint32), expected)
+
+
+def test_dump_float64_and_raw_sizes(tmp_path):
+    floatPath = tmp_path / "floats.bin"
+    dump_stream(LinearCongruentialGenerator(seed=2), str(floatPath), 500, "float64", 128)
+    values = np.fromfile(floatPath, dtype=np.float64)
+    assert values.size == 500 and values.min() >= 0.0 and values.max() < 1.0
+
+    rawPath = tmp_path / "raw.bin"
+    dump_stream(LinearCongruentialGenerator(seed=2), str(rawPath), 13, "raw")
+    assert rawPath.stat().st_size == 13
+
+
+def test_dump_rejects_bad_arguments(tmp_path):
+    rng = LinearCongruentialGenerator(seed=2)
+    with pytest.raises(ValueError):
+        dump_stream(rng, str(tmp_path / "x.bin"), 10, "int8")
+    with pytest.raises(ValueError):
+        dump_stream(rng, str(tmp_path / "x.bin"), -1)
+    with pytest.raises(ValueError):
+        dump_stream(rng, str(tmp_path / "x.bin"), 10, chunkSize=0)
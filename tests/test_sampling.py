@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""sampling regresyon testleri / sampling regression tests."""
+
+import pytest
+
+from lcg_generator import LinearCongruentialGenerator
+from sampling import _randbelow, reservoir, sample
+from secure_rng import CryptographicallySecureRNG
+
+
+def test_sample_from_population_wider_than_integers_range():
+    rng = LinearCongruentialGenerator(seed=1)
+    picked = rng.sample(range(10**10), 3)
+    assert len(set(picked)) == 3
+    assert all(0 <= value < 10**10 for value in picked)
+    wider = rng.sample(range(10**10), 50)
+    assert any(value > rng.MAX_INTEGERS_RANGE for value in wider)
+
+
+def test_composed_randbelow_is_uniform_over_wide_bounds():
+    rng = LinearCongruentialGenerator(seed=2)
+    base = rng.MAX_INTEGERS_RANGE
+    bound = 3 * base
+    draws = [_randbelow(rng, bound) for _ in range(6000)]
+    assert all(0 <= value < bound for value in draws)
+    counts = [sum(1 for value in draws if value // base == third) for third in range(3)]
+    assert all(abs(count - 2000) < 200 for count in counts)
+
+
+@pytest.mark.parametrize("make", [lambda: LinearCongruentialGenerator(seed=3),
+                                  lambda: CryptographicallySecureRNG(bulk=True)])
+def test_sample_picks_distinct_items(make):
+    rng = make()
+    population = list(range(100))
+    for k in (0, 1, 30, 51, 100):
+        picked = sample(rng, population, k)
+        assert len(picked) == len(set(picked)) == k
+        assert set(picked) <= set(population)
+    with pytest.raises(ValueError):
+        sample(rng, population, 101)
+
+
+def test_reservoir_keeps_k_distinct_items():
+    rng = LinearCongruentialGenerator(seed=4)
+    assert reservoir(rng, range(3), 5) == [0, 1, 2]
+    picked = reservoir(rng, iter(range(10000)), 20)
+    assert len(set(picked)) == 20
+    with pytest.raises(ValueError):
+        reservoir(rng, range(3), -1)
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""secure_rng regresyon testleri / secure_rng regression tests."""
+
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+from array import array
+
+import numpy as np
+import pytest
+
+from secure_rng import (CryptographicallySecureRNG, EntropyPool, SecureLCG,
+                        ThreadLocalSecureRNG)
+
+
+def _reference_mix(pool: bytearray, position: int, data: bytes) -> int:
+    """Eski bayt bayt XOR döngüsü / The former byte-by-byte XOR loop."""
+    for byte in data:
+        pool[position] ^= byte
+        position = (position + 1) % len(pool)
+    return position
+
+
+@pytest.mark.parametrize("length", [0, 1, 7, 255, 256, 257, 1000, 4096 + 3])
+def test_mix_into_pool_matches_byte_loop(length):
+    pool = EntropyPool(256)
+    for start in (0, 100, 255):
+        pool.position = start
+        expected = bytearray(pool.pool)
+        data = os.urandom(length)
+        expectedPosition = _reference_mix(expected, start, data)
+        pool._mix_into_pool(data)
+        assert pool.pool == expected
+        assert pool.position == expectedPosition
+
+
+@pytest.mark.parametrize("poolSize", [16, 33, 100, 256])
+def test_get_entropy_updates_pool_in_place(poolSize):
+    pool = EntropyPool(poolSize)
+    original = pool.pool
+    pool.get_entropy(48)
+    assert pool.pool is original
+    assert len(pool.pool) == poolSize
+    digest = bytes(pool.pool[:32])
+    assert bytes(pool.pool) == (digest * (poolSize // 32 + 1))[:poolSize]
+
+
+def test_metrics_count_calls_bytes_and_hook():
+    events = []
+    rng = CryptographicallySecureRNG()
+    rng.enable_metrics(hook=lambda event, data: events.append(data["bytes"]))
+    rng.next_bytes(10)
+    rng.fill_into(bytearray(100))
+    counters = rng.metrics()["counters"]
+    assert counters["calls"] == 2
+    assert counters["bytes_produced"] == 110
+    assert events == [10, 100]
+    rng.disable_metrics()
+    assert rng.metrics() == {"enabled": False}
+
+
+def test_set_bulk_mode_counts_initial_drbg_reseed():
+    rng = CryptographicallySecureRNG()
+    rng.enable_metrics()
+    rng.set_bulk_mode(True)
+    counters = rng.metrics()["counters"]
+    assert counters["reseeds"] == 1
+    assert counters["urandom_calls"] >= 1
+
+
+def test_bulk_mode_output_and_toggle():
+    rng = CryptographicallySecureRNG(bulk=True)
+    first, second = rng.next_bytes(1000), rng.next_bytes(1000)
+    assert len(first) == len(second) == 1000 and first != second
+    rng.set_bulk_mode(False)
+    assert rng.drbg is None
+    assert len(rng.next_bytes(33)) == 33
+
+
+def test_secure_lcg_snapshot_round_trips():
+    generator = SecureLCG(seed=12345, paramIndex=2)
+    packed = generator.to_bytes()
+    pickled = pickle.dumps(generator)
+    expected = [generator.next() for _ in range(5)]
+    fromBytes = SecureLCG.from_bytes(packed)
+    assert [fromBytes.next() for _ in range(5)] == expected
+    unpickled = pickle.loads(pickled)
+    assert [unpickled.next() for _ in range(5)] == expected
+
+
+def test_csprng_pickle_reseeds_instead_of_copying_state():
+    rng = CryptographicallySecureRNG(bulk=True)
+    clone = pickle.loads(pickle.dumps(rng))
+    assert clone.drbg is not None
+    assert clone.next_bytes(32) != rng.next_bytes(32)
+
+
+def test_weighted_choice_follows_weights():
+    rng = CryptographicallySecureRNG(bulk=True)
+    picks = [rng.choice("abc", weights=[0, 1, 3]) for _ in range(8000)]
+    assert picks.count("a") == 0
+    assert abs(picks.count("c") / len(picks) - 0.75) < 0.03
+    with pytest.raises(ValueError):
+        rng.choice("ab", weights=[1, 2, 3])
+    with pytest.raises(ValueError):
+        rng.choice([], weights=[])
+
+
+def _read_from_child(produce) -> bytes:
+    """Çocuk süreçte produce() çıktısını okur / Reads produce() from a child."""
+    readFd, writeFd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(writeFd, produce())
+        finally:
+            os._exit(0)
+    os.close(writeFd)
+    with os.fdopen(readFd, "rb") as reader:
+        data = reader.read()
+    os.waitpid(pid, 0)
+    return data
+
+
+def test_thread_local_proxy_can_be_copied():
+    proxy = ThreadLocalSecureRNG()
+    clone = copy.copy(proxy)
+    assert len(clone.next_bytes(8)) == 8
+    with pytest.raises(AttributeError):
+        proxy._missing
+
+
+def test_thread_local_proxy_gives_each_thread_its_own_instance():
+    proxy = ThreadLocalSecureRNG(bulk=True)
+    instances = []
+    threads = [threading.Thread(target=lambda: instances.append(proxy.instance()))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(instance) for instance in instances}) == 4
+    assert proxy.instance() is proxy.instance()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+@pytest.mark.parametrize("bulk", [False, True])
+def test_fork_reseeds_the_child(bulk):
+    rng = CryptographicallySecureRNG(bulk=bulk)
+    proxy = ThreadLocalSecureRNG(bulk=bulk)
+    proxy.next_bytes(1)
+    childBytes = _read_from_child(lambda: rng.next_bytes(32) + proxy.next_bytes(32))
+    assert len(childBytes) == 64
+    assert childBytes[:32] != rng.next_bytes(32)
+    assert childBytes[32:] != proxy.next_bytes(32)
+
+
+def test_disable_prefetch_between_ring_checks_does_not_fail():
+    rng = CryptographicallySecureRNG()
+    rng.enable_prefetch(capacity=4096, maxRequest=64)
+    disabled = []
+
+    # next_bytes halkayı yerel değişkene aldıktan hemen sonra başka bir
+    # iş parçacığının disable_prefetch() çağırmasını taklit eder
+    # Simulates another thread calling disable_prefetch() right after
+    # next_bytes has loaded the ring into a local variable
+    def tracer(frame, event, arg):
+        if frame.f_code.co_name != "next_bytes":
+            return None
+
+        def lineTracer(frame, event, arg):
+            if event == "line" and "ring" in frame.f_locals and not disabled:
+                disabled.append(True)
+                rng.disable_prefetch()
+            return lineTracer
+        return lineTracer
+
+    sys.settrace(tracer)
+    try:
+        data = rng.next_bytes(16)
+    finally:
+        sys.settrace(None)
+    assert disabled and rng._ring is None
+    assert len(data) == 16
+
+
+FORK_WITH_HELD_RING_LOCK = """
+import os, sys
+sys.path.insert(0, {root!r})
+from secure_rng import CryptographicallySecureRNG
+
+rng = CryptographicallySecureRNG()
+rng.enable_prefetch(capacity=4096)
+rng._ring.condition.acquire()
+pid = os.fork()
+if pid:
+    rng._ring.condition.release()
+    os.waitpid(pid, 0)
+"""
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+def test_child_exits_when_fork_happens_inside_the_ring_lock():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = FORK_WITH_HELD_RING_LOCK.format(root=root)
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+
+
+def test_ring_served_calls_are_counted():
+    rng = CryptographicallySecureRNG()
+    rng.enable_metrics()
+    rng.enable_prefetch(capacity=4096, maxRequest=64)
+    try:
+        deadline = time.monotonic() + 5
+        while rng._ring.available < 64 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        rng.next_bytes(16)
+        rng.next_bytes(128)
+    finally:
+        rng.disable_prefetch()
+    snapshot = rng.metrics()
+    assert snapshot["counters"]["calls"] == 2
+    assert snapshot["counters"]["bytes_produced"] == 144
+    assert snapshot["operations"]["next_bytes_ring"] == 1
+    assert snapshot["operations"]["next_bytes"] == 1
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_random_floats_are_float64_in_unit_interval(bulk):
+    rng = CryptographicallySecureRNG(bulk=bulk)
+    values = rng.random_floats(20000)
+    assert values.dtype == np.float64 and values.shape == (20000,)
+    assert values.min() >= 0.0 and values.max() < 1.0
+    assert abs(values.mean() - 0.5) < 0.01
+    assert rng.random_floats(0).size == 0
+    with pytest.raises(ValueError):
+        rng.random_floats(-1)
+
+
+def test_random_floats_into_fills_existing_buffers():
+    rng = CryptographicallySecureRNG()
+    target = array("d", bytes(8 * 100))
+    values = rng.random_floats_into(target)
+    assert np.shares_memory(values, np.frombuffer(target))
+    assert all(0.0 <= value < 1.0 for value in target) and len(set(target)) == 100
+    with pytest.raises(ValueError):
+        rng.random_floats_into(np.empty(10, dtype=np.float32))
+    with pytest.raises(ValueError):
+        rng.random_floats_into(np.empty((10, 10))[:, 0])
+
+
+@pytest.mark.parametrize("low, high, dtype", [
+    (-3, 4, np.int64),
+    (0, 2**16 + 1, np.int64),
+    (-2**63, 2**63, np.int64),
+    (2**63, 2**64, np.uint64),
+    (0, 2**80 + 3, object),
+    (-2**70, -2**70 + 5, object),
+])
+def test_csprng_integers_stay_in_range(low, high, dtype):
+    rng = CryptographicallySecureRNG(bulk=True)
+    values = rng.integers(low, high, 5000)
+    assert values.dtype == np.dtype(dtype) and len(values) == 5000
+    assert all(low <= int(value) < high for value in values.tolist())
+    assert low <= rng.integers(low, high) < high
+
+
+def test_csprng_integers_are_unbiased_on_awkward_ranges():
+    rng = CryptographicallySecureRNG(bulk=True)
+    counts = np.bincount(rng.integers(0, 5, 50000), minlength=5)
+    assert np.all(np.abs(counts - 10000) < 500)
+    assert rng.integers(7, 8, 3).tolist() == [7, 7, 7]
+    with pytest.raises(ValueError):
+        rng.integers(3, 3)
+    with pytest.raises(ValueError):
+        rng.integers(0, 3, -1)
+
+
+def _read_only_array():
+    values = np.arange(3)
+    values.setflags(write=False)
+    return values
+
+
+@pytest.mark.parametrize("target", [[1, 2, 3], (1, 2, 3), memoryview(b"abc"),
+                                    _read_only_array()])
+def test_shuffle_array_rejects_targets_it_cannot_write(target):
+    with pytest.raises(TypeError):
+        CryptographicallySecureRNG().shuffle_array(target)
+
+
+@pytest.mark.parametrize("target", [bytearray(range(200)), array("i", range(200)),
+                                    np.arange(200), np.arange(400).reshape(200, 2)])
+def test_shuffle_array_permutes_in_place(target):
+    before = np.array(target).tolist()
+    CryptographicallySecureRNG().shuffle_array(target)
+    after = np.array(target).tolist()
+    assert after != before
+    assert sorted(after) == sorted(before)
+
+
+@pytest.mark.parametrize("count", [0, 1, 1000, CryptographicallySecureRNG.PERMUTATION_SORT_THRESHOLD + 7])
+def test_permutation_is_valid_on_both_paths(count):
+    rng = CryptographicallySecureRNG(bulk=True)
+    permutation = rng.permutation(count)
+    assert permutation.dtype == np.int64
+    assert np.array_equal(np.sort(permutation), np.arange(count))
+    with pytest.raises(ValueError):
+        rng.permutation(-1)
+
+
+def test_shuffle_is_uniform_over_small_permutations():
+    rng = CryptographicallySecureRNG(bulk=True)
+    counts = {}
+    for _ in range(6000):
+        items = [0, 1, 2]
+        rng.shuffle(items)
+        counts[tuple(items)] = counts.get(tuple(items), 0) + 1
+    assert len(counts) == 6
+    assert all(abs(count - 1000) < 150 for count in counts.values())